@@ -29,9 +29,17 @@ from config.settings import (
     PRIVACY_SUMMARY,
     SUPPORT_EMAIL,
 )
-from core.data_manager import get_evidence_items, get_intake_data, init_session
+from config.states import StateDataError, maybe_reload_state_data
+from core.data_manager import (
+    get_evidence_derivatives,
+    get_evidence_files,
+    get_intake_data,
+    get_ordered_evidence_items,
+    init_session,
+)
 from core.error_boundary import safe_render
-from export.binder import generate_binder_zip
+from core.logger import log_info, log_warning
+from export.binder import build_binder
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +110,12 @@ st.markdown(
 # ---------------------------------------------------------------------------
 init_session()
 
+# Pick up edits to config/data/states.json without a restart (throttled).
+try:
+    maybe_reload_state_data()
+except StateDataError as exc:
+    log_warning("State data not reloaded: %s", exc)
+
 # ---------------------------------------------------------------------------
 # Sidebar
 # ---------------------------------------------------------------------------
@@ -122,11 +136,25 @@ with st.sidebar:
     if selected_state:
         intake = get_intake_data()
         if intake.get("claimant_name") and intake.get("description"):
-            evidence = get_evidence_items()
-            binder_bytes = generate_binder_zip(intake, evidence, selected_state)
+            evidence = get_ordered_evidence_items()
+            binder = build_binder(
+                intake, evidence, selected_state, get_evidence_files(),
+                image_derivatives=get_evidence_derivatives(),
+            )
+            if binder.verification is not None:
+                log_info(
+                    "Binder built in %.1f ms; PDF verification %.1f ms (export waited %.1f ms)",
+                    binder.build_ms, binder.verification.check_ms, binder.verification.wait_ms,
+                )
+                if binder.verification.violations:
+                    st.warning(
+                        "The binder PDFs contain sensitive numbers or embedded data. "
+                        "Court filings are usually public; edit your intake to remove them:\n"
+                        + "\n".join(f"- {v}" for v in binder.verification.violations[:10])
+                    )
             st.download_button(
                 label="Download case binder (ZIP)",
-                data=binder_bytes,
+                data=binder.content,
                 file_name=f"ClaimPilot_Binder_{selected_state}.zip",
                 mime="application/zip",
                 key="download_binder",
@@ -0,0 +1,115 @@
+"""
+Binary-content detector benchmark for ClaimPilot v2.4.0.
+
+Compares ``core.pii_guard.is_base64_binary`` with the previous
+regex-and-decode implementation on the kinds of strings an export
+contains: long free-text descriptions, short identifiers, base64 of text
+and base64 of binary. Both detectors are first run over a fuzzed corpus
+and must agree on every string.
+
+Usage: python benchmarks/bench_base64_detector.py
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.pii_guard import is_base64_binary
+
+ROUNDS = 20_000
+
+# The previous implementation, kept here for comparison.
+_LEGACY_PATTERN = re.compile(
+    r"^(?:[A-Za-z0-9+/]{4}){10,}(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$"
+)
+
+
+def legacy_is_base64_binary(value: str) -> bool:
+    if not isinstance(value, str):
+        return False
+    stripped = value.strip()
+    if len(stripped) < 40:
+        return False
+    if _LEGACY_PATTERN.match(stripped):
+        try:
+            decoded = base64.b64decode(stripped[:100])
+            if decoded.startswith(b"%PDF-"):
+                return True
+            non_text = sum(1 for b in decoded if b > 127 or (b < 32 and b not in (9, 10, 13)))
+            return non_text > len(decoded) * 0.3
+        except Exception:
+            pass
+    return False
+
+
+_WORDS = (
+    "the tenant left water damage in kitchen and refused to return deposit "
+    "after repeated calls landlord invoice receipt photos show mould"
+).split()
+
+
+def _description(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _fuzz_corpus(rng: random.Random, n: int) -> list:
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    corpus = []
+    for _ in range(n):
+        kind = rng.randrange(6)
+        if kind == 0:
+            raw = bytes(rng.getrandbits(8) for _ in range(rng.randint(20, 120)))
+            corpus.append(base64.b64encode(raw).decode())
+        elif kind == 1:
+            raw = _description(rng, rng.randint(3, 40)).encode()
+            corpus.append(base64.b64encode(raw).decode())
+        elif kind == 2:
+            length = rng.randint(36, 60)
+            chars = [rng.choice(alphabet + "=- \n") for _ in range(length)]
+            corpus.append("".join(chars))
+        elif kind == 3:
+            body = "".join(rng.choice(alphabet) for _ in range(rng.choice((40, 41, 42, 43, 44, 48))))
+            corpus.append(body + rng.choice(("", "=", "==", "===")))
+        elif kind == 4:
+            raw = b"%PDF-1.4 " + bytes(rng.getrandbits(8) for _ in range(60))
+            corpus.append(f"  {base64.b64encode(raw).decode()}\n")
+        else:
+            corpus.append(_description(rng, rng.randint(1, 300)))
+    return corpus
+
+
+def _time(fn, value: str) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(value)
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def main() -> None:
+    rng = random.Random(11)
+    corpus = _fuzz_corpus(rng, 20_000)
+    mismatches = sum(1 for s in corpus if is_base64_binary(s) != legacy_is_base64_binary(s))
+    print(f"fuzzed corpus: {len(corpus):,} strings, {mismatches} mismatches")
+    assert mismatches == 0
+
+    cases = [
+        ("free-text description, 2 KB", _description(rng, 400)),
+        ("hex digest, 64 chars", "".join(rng.choice("0123456789abcdef") for _ in range(64))),
+        ("base64 of text, 3 KB", base64.b64encode(_description(rng, 500).encode()).decode()),
+        ("base64 of binary, 7 KB", base64.b64encode(os.urandom(5000)).decode()),
+    ]
+    for name, value in cases:
+        legacy = _time(legacy_is_base64_binary, value)
+        fast = _time(is_base64_binary, value)
+        print(f"{name:<30} legacy {legacy:8.2f} us   new {fast:6.2f} us   ({legacy / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
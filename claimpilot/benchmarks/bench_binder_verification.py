@@ -0,0 +1,90 @@
+"""
+Binder verification overhead benchmark for ClaimPilot v2.4.0.
+
+Builds the same binder with and without PDF verification and reports:
+
+  - end-to-end build time for each,
+  - the summed per-PDF verification time, and
+  - how long the export waited on verification after the ZIP was written
+    (the part that verification actually adds to export latency).
+
+The case has 300 evidence items (a long EvidenceIndex.pdf) and a dozen
+photos (an ExhibitPacket.pdf whose image streams are skipped).
+
+Usage: python benchmarks/bench_binder_verification.py
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PIL import Image
+
+from export.binder import build_binder
+
+ROUNDS = 5
+EVIDENCE = 300
+PHOTOS = 12
+
+INTAKE = {
+    "claimant_name": "Jane Doe",
+    "claimant_email": "jane@example.com",
+    "claimant_phone": "555-123-4567",
+    "claimant_address": "123 Main St\nAnytown, CA 90210",
+    "respondent_name": "Acme Corp",
+    "respondent_address": "456 Oak Ave\nSometown, CA 90211",
+    "claim_type": "small_claims",
+    "incident_date": "2025-06-15",
+    "amount_claimed": 5000.00,
+    "description": "Vendor failed to deliver contracted services worth $5,000. " * 20,
+    "resolution_attempted": "Sent two written requests for refund.",
+    "desired_outcome": "Full refund of $5,000.",
+}
+
+
+def _case() -> tuple:
+    items, files = [], {}
+    for n in range(EVIDENCE):
+        photo = n < PHOTOS
+        item_id = f"ev-{n:04d}"
+        items.append({
+            "item_id": item_id,
+            "label": f"Exhibit item {n}",
+            "file_name": f"photo_{n}.jpg" if photo else f"receipt_{n}.pdf",
+            "file_type": "image/jpeg" if photo else "application/pdf",
+            "file_size_bytes": 20_000 + n,
+            "description": "Receipt for materials purchased",
+            "date_added": f"2025-07-{1 + n % 28:02d}T10:00:00",
+        })
+        if photo:
+            buf = io.BytesIO()
+            Image.effect_noise((1600, 1200), 40 + n).convert("RGB").save(buf, format="JPEG")
+            files[item_id] = buf.getvalue()
+    return items, files
+
+
+def main() -> None:
+    items, files = _case()
+    build_binder(INTAKE, items, "CA", files, verify=True)  # warm caches
+
+    plain = [build_binder(INTAKE, items, "CA", files, verify=False).build_ms for _ in range(ROUNDS)]
+    checked = [build_binder(INTAKE, items, "CA", files, verify=True) for _ in range(ROUNDS)]
+    with_ms = [b.build_ms for b in checked]
+    check_ms = [b.verification.check_ms for b in checked]
+    wait_ms = [b.verification.wait_ms for b in checked]
+
+    print(f"binder with {EVIDENCE} evidence items, {PHOTOS} photos (median of {ROUNDS})")
+    print(f"build without verification   {statistics.median(plain):8.1f} ms")
+    print(f"build with verification      {statistics.median(with_ms):8.1f} ms")
+    print(f"  verification work (summed) {statistics.median(check_ms):8.1f} ms")
+    print(f"  export waited after ZIP    {statistics.median(wait_ms):8.1f} ms")
+    print(f"violations: {checked[-1].verification.violations}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Export safety-check benchmark for ClaimPilot v2.4.0.
+
+Compares sanitize_export_dict() followed by validate_export_json() (two
+recursive walks, two base64 checks per string) with the fused, iterative
+sanitize_and_validate() on:
+
+  - a case summary with thousands of evidence entries, and
+  - a deeply nested payload.
+
+Usage: python benchmarks/bench_export_safety.py
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.pii_guard import sanitize_and_validate, sanitize_export_dict, validate_export_json
+
+EVIDENCE = 5000
+DEPTH = 500
+REPEAT = 5
+
+
+def _summary(n: int) -> dict:
+    blob = base64.b64encode(b"%PDF-1.4 " + bytes(range(256))).decode()
+    return {
+        "claimpilot_version": "2.4.0",
+        "state": "CA",
+        "evidence_items": [
+            {
+                "item_id": f"{i:08d}-4f1c-4a5e-9b7d-2c1e0f9a8b7c",
+                "label": f"Receipt {i % 200}",
+                "file_name": f"receipt-{i}.pdf",
+                "file_type": "application/pdf",
+                "file_size_bytes": 40_000 + i,
+                "description": "Photo of the water damage in the kitchen taken the morning after the leak was reported to the landlord",
+                "date_added": "2025-07-01T10:00:00",
+                "thumbnail": blob if i % 50 == 0 else "",
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def _nested(depth: int) -> dict:
+    root: dict = {}
+    node = root
+    for i in range(depth):
+        node["note"] = f"level {i} of the nested payload, free text that is not base64 at all"
+        node["child"] = {}
+        node = node["child"]
+    return root
+
+
+def _two_pass(data: dict):
+    clean = sanitize_export_dict(data)
+    return clean, validate_export_json(clean)
+
+
+def _time(fn, data) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    for name, data in ((f"summary, {EVIDENCE:,} evidence items", _summary(EVIDENCE)),
+                       (f"nested payload, depth {DEPTH}", _nested(DEPTH))):
+        assert _two_pass(data) == sanitize_and_validate(data)
+        legacy = _time(_two_pass, data)
+        fused = _time(sanitize_and_validate, data)
+        print(f"{name:36} two-pass {legacy:8.2f} ms   fused {fused:8.2f} ms   ({legacy / fused:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+PII redaction benchmark for ClaimPilot v2.4.0.
+
+Compares the single-pass redaction engine (core.pii_guard) with the
+previous implementation, which ran four regexes one after another, on a
+synthetic stream of log lines shaped like the app's own log traffic.
+Most lines carry no PII, so the pre-check matters as much as the scan.
+The last row adds a session's own names and addresses to the same scan.
+
+Usage: python benchmarks/bench_redaction.py
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.pii_guard import build_session_engine, redact_text
+
+LINES = 50_000
+
+# The pre-engine implementation, kept here for comparison.
+_LEGACY_PATTERNS = [
+    (re.compile(r"\b\d{3}-\d{2}-\d{4}\b"), "[SSN-REDACTED]"),
+    (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"), "[EMAIL-REDACTED]"),
+    (re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"), "[PHONE-REDACTED]"),
+    (re.compile(r"\b\d{5}(-\d{4})?\b"), "[ZIP-REDACTED]"),
+]
+
+
+def legacy_redact(text: str) -> str:
+    for pattern, replacement in _LEGACY_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+_SESSION_INTAKE = {
+    "claimant_name": "Jane Doe",
+    "respondent_name": "Oakview Property Management LLC",
+    "claimant_address": "123 Main St, Anytown, CA 90210",
+    "respondent_address": "9 Harbor Way, Suite 400, Anytown, CA 90211",
+    "claimant_email": "jane.doe@example.com",
+    "claimant_phone": "(555) 201-3344",
+}
+
+
+def _corpus(n: int) -> list:
+    rng = random.Random(7)
+    templates = [
+        lambda: "Rendering tab Evidence",
+        lambda: "Binder export started for state CA",
+        lambda: "All user data deleted from session.",
+        lambda: f"Optimised evidence {rng.getrandbits(32):08x}: {rng.randint(10**5, 10**7)} -> {rng.randint(10**4, 10**6)} bytes in {rng.random() * 200:.1f} ms",
+        lambda: f"Text extraction for evidence {rng.getrandbits(32):08x} ended with status timeout",
+        lambda: f"Added {rng.randint(2, 400)} evidence items in one batch",
+        lambda: f"Intake saved for claimant jane.doe{rng.randint(1, 99)}@example.com",
+        lambda: f"Callback number {rng.randint(200, 999)}-555-{rng.randint(1000, 9999)} recorded",
+        lambda: f"Address update: 123 Main St, Anytown, CA {rng.randint(10000, 99999)}",
+        lambda: f"Error in tab Intake: ValueError('SSN {rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)} invalid')",
+    ]
+    weights = [30, 10, 5, 15, 10, 5, 8, 6, 6, 5]
+    return [t() for t in rng.choices(templates, weights=weights, k=n)]
+
+
+def _time(fn, corpus) -> float:
+    start = time.perf_counter()
+    for line in corpus:
+        fn(line)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    corpus = _corpus(LINES)
+    mismatches = sum(1 for line in corpus if legacy_redact(line) != redact_text(line))
+    legacy = min(_time(legacy_redact, corpus) for _ in range(3))
+    engine = min(_time(redact_text, corpus) for _ in range(3))
+    print(f"{LINES:,} log lines, {mismatches} output mismatches")
+    print(f"legacy (4 sequential passes): {legacy * 1e6 / LINES:6.2f} us/line")
+    print(f"single-pass engine:           {engine * 1e6 / LINES:6.2f} us/line  ({legacy / engine:.1f}x)")
+    session_engine = build_session_engine(_SESSION_INTAKE)
+    session = min(_time(session_engine.redact, corpus) for _ in range(3))
+    print(f"with session names/addresses: {session * 1e6 / LINES:6.2f} us/line  ({legacy / session:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Evidence search benchmark for ClaimPilot v2.4.0.
+
+Indexes a synthetic case of 10,000 pages (200 exhibits of 50 pages, ~300
+words per page) and reports index build time and per-query latency. The
+query budget is 10 ms.
+
+Usage: python benchmarks/bench_search.py
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.search_index import SearchIndex
+
+EXHIBITS = 200
+PAGES_PER_EXHIBIT = 50
+WORDS_PER_PAGE = 300
+QUERIES = ["refund", "contractor deposit invoice", '"promised a refund"', "w17 w42"]
+REPEAT = 50
+
+
+def main() -> None:
+    rng = random.Random(1)
+    vocab = [f"w{i}" for i in range(20000)] + ["refund", "promised", "contractor", "deposit", "invoice"]
+    index = SearchIndex()
+
+    start = time.perf_counter()
+    for n in range(EXHIBITS):
+        words = rng.choices(vocab, k=PAGES_PER_EXHIBIT * WORDS_PER_PAGE)
+        index.add_document(f"evidence:{n}", " ".join(words), f"Exhibit {n}")
+    build_s = time.perf_counter() - start
+    print(f"indexed {EXHIBITS * PAGES_PER_EXHIBIT:,} pages in {build_s:.2f} s")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            hits = index.search(query)
+        ms = (time.perf_counter() - start) / REPEAT * 1000
+        print(f"{query!r:32} {ms:7.3f} ms  ({len(hits)} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+State lookup benchmark for ClaimPilot v2.4.0.
+
+Times the state helpers the UI and export generators call on every rerun
+against the previous implementations (upper-case then dict probe, list
+membership for Tier 1, per-call string formatting for export headers).
+Inputs mix upper-case, lower-case and unknown abbreviations.
+
+Usage: python benchmarks/bench_states.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from config.states import ALL_STATES, TIER1_STATES, get_state, get_state_fragments, is_tier1, tier_label
+
+NUMBER = 200
+
+_LEGACY_STATES = dict(ALL_STATES)
+_LEGACY_TIER1 = list(TIER1_STATES)
+
+
+# The previous implementations, kept here for comparison.
+def legacy_get_state(abbreviation):
+    return _LEGACY_STATES.get(abbreviation.upper())
+
+
+def legacy_is_tier1(abbreviation):
+    return abbreviation.upper() in _LEGACY_TIER1
+
+
+def legacy_tier_label(abbreviation):
+    if legacy_is_tier1(abbreviation):
+        return "Supported (Tier 1)"
+    return "Guidance-only (Tier 2)"
+
+
+def legacy_state_line(abbreviation):
+    state = legacy_get_state(abbreviation)
+    coverage = legacy_tier_label(abbreviation)
+    state_name = state.name if state else abbreviation
+    return f"State of {state_name} | Coverage: {coverage}"
+
+
+def state_line(abbreviation):
+    fragments = get_state_fragments(abbreviation)
+    return fragments.state_line if fragments else f"State of {abbreviation} | Coverage: Guidance-only (Tier 2)"
+
+
+def _run(fn, inputs) -> float:
+    def loop():
+        for abbr in inputs:
+            fn(abbr)
+
+    best = min(timeit.repeat(loop, number=NUMBER, repeat=5))
+    return best / (NUMBER * len(inputs)) * 1e9
+
+
+def main() -> None:
+    inputs = list(ALL_STATES) + [a.lower() for a in ALL_STATES] + ["ZZ", "xx", "Ca", "ny"]
+    for abbr in inputs:
+        assert get_state(abbr) is legacy_get_state(abbr) or get_state(abbr) == legacy_get_state(abbr)
+        assert is_tier1(abbr) == legacy_is_tier1(abbr)
+        assert tier_label(abbr) == legacy_tier_label(abbr)
+        assert state_line(abbr) == legacy_state_line(abbr)
+
+    print(f"{len(inputs)} abbreviations per pass (best of 5, ns per call)")
+    for name, legacy, fast in (
+        ("get_state", legacy_get_state, get_state),
+        ("is_tier1", legacy_is_tier1, is_tier1),
+        ("tier_label", legacy_tier_label, tier_label),
+        ("export state line", legacy_state_line, state_line),
+    ):
+        before = _run(legacy, inputs)
+        after = _run(fast, inputs)
+        print(f"{name:<20} legacy {before:7.1f}   new {after:7.1f}   ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,39 @@ import uuid
 from datetime import datetime
 
 import streamlit as st
+from PIL import Image
 
-from core.data_manager import add_evidence_item, get_evidence_items
+from config.feature_flags import ENABLE_IMAGE_OPTIMIZATION
+from config.settings import EVIDENCE_PAGE_SIZE
+from core.bulk_import import ARCHIVE_ERRORS, import_archive
+from core.data_manager import (
+    add_evidence_derivative_failure,
+    add_evidence_items,
+    get_evidence_catalog,
+    get_evidence_derivative_failures,
+    get_evidence_derivatives,
+    get_evidence_files,
+    get_evidence_items,
+    get_evidence_pii_reports,
+    get_evidence_text,
+    get_exhibit_ordering,
+    get_near_duplicate_index,
+    get_search_index,
+    set_evidence_derivative,
+    set_evidence_pii_report,
+    set_evidence_text,
+    set_exhibit_ordering,
+)
 from core.error_boundary import safe_render
+from core.evidence_view import EVIDENCE_KINDS, EVIDENCE_SORTS, EvidenceFilter
+from core.exhibit_order import EXHIBIT_ORDERS, ORDER_CHRONOLOGICAL
+from core.image_optimizer import is_image, optimize_images
+from core.logger import log_info, log_warning
+from core.metadata_extractor import extract_document_date
+from core.pdf_inspector import count_pdf_pages
+from core.perceptual_hash import dhash, format_hash
+from core.pii_scanner import FINDING_LABELS, PiiScanReport, scan_sources
+from core.text_extractor import KIND_TXT, extract_texts, text_kind
 
 
 @safe_render("Evidence")
@@ -28,11 +58,13 @@ def render_evidence_manager() -> None:
     )
 
     if uploaded:
+        to_extract = {}
+        new_records = []
+        # Check for duplicates by name
+        names = {e["file_name"] for e in get_evidence_items()}
         for f in uploaded:
-            # Check for duplicates by name
-            existing = get_evidence_items()
-            names = {e["file_name"] for e in existing}
             if f.name not in names:
+                names.add(f.name)
                 item = {
                     "item_id": str(uuid.uuid4()),
                     "label": f.name.rsplit(".", 1)[0],
@@ -42,16 +74,290 @@ def render_evidence_manager() -> None:
                     "description": "",
                     "date_added": datetime.now().isoformat(),
                 }
-                add_evidence_item(item)
+                content = f.getvalue()
+                _analyse(item, content)
+                new_records.append((item, content))
+                if text_kind(f.name, item["file_type"]):
+                    to_extract[item["item_id"]] = (content, f.name, item["file_type"])
+        if new_records:
+            add_evidence_items(new_records)
+        if to_extract:
+            _extract_text(to_extract)
+
+    _render_bulk_import()
+
+    if ENABLE_IMAGE_OPTIMIZATION:
+        _optimize_new_images()
 
     # Display existing evidence
     items = get_evidence_items()
+    texts = get_evidence_text()
     if items:
         st.subheader(f"Evidence items ({len(items)})")
-        for item in items:
-            with st.expander(f"{item['label']} ({item['file_name']})"):
-                st.markdown(f"**Type:** {item['file_type']}")
-                st.markdown(f"**Size:** {item['file_size_bytes']:,} bytes")
-                st.markdown(f"**Added:** {item['date_added']}")
+        _render_near_duplicates(items)
+        _render_pii_findings(items)
+        _render_search()
+        st.radio(
+            "Exhibit order",
+            EXHIBIT_ORDERS,
+            index=EXHIBIT_ORDERS.index(get_exhibit_ordering()),
+            format_func=lambda o: (
+                "Chronological (by document date)" if o == ORDER_CHRONOLOGICAL else "Upload order"
+            ),
+            horizontal=True,
+            key="exhibit_ordering_widget",
+            # Callbacks run before the rerun, so the sidebar export sees the new order.
+            on_change=lambda: set_exhibit_ordering(st.session_state["exhibit_ordering_widget"]),
+        )
+        _render_evidence_page(texts)
     else:
         st.info("No evidence uploaded yet.")
+
+
+def _render_evidence_page(texts: dict) -> None:
+    """Filter controls plus one page of evidence; only that page is rendered."""
+    col_kind, col_label, col_from, col_to = st.columns([1, 2, 1, 1])
+    kind = col_kind.selectbox(
+        "Type", ("",) + EVIDENCE_KINDS,
+        format_func=lambda k: k.title() if k else "All types",
+        key="evidence_filter_kind",
+    )
+    label = col_label.text_input("Label contains", key="evidence_filter_label")
+    date_from = col_from.date_input("From", value=None, key="evidence_filter_from")
+    date_to = col_to.date_input("To", value=None, key="evidence_filter_to")
+    col_sort, col_dir = st.columns([2, 1])
+    sort = col_sort.selectbox(
+        "Sort by", EVIDENCE_SORTS,
+        format_func=lambda s: {"upload": "Upload order"}.get(s, s.title()),
+        key="evidence_sort",
+    )
+    descending = col_dir.toggle("Descending", key="evidence_sort_desc")
+
+    flt = EvidenceFilter(
+        kind=kind,
+        label=label,
+        date_from=date_from.isoformat() if date_from else "",
+        date_to=date_to.isoformat() if date_to else "",
+    )
+    catalog = get_evidence_catalog()
+    requested = st.session_state.get("evidence_page", 1) - 1
+    page = catalog.page(requested, EVIDENCE_PAGE_SIZE, sort=sort, descending=descending, flt=flt)
+    if page.total == 0:
+        st.caption("No evidence matches these filters.")
+        return
+
+    for item in page.items:
+        with st.expander(f"{item['label']} ({item['file_name']})"):
+            st.markdown(f"**Type:** {item['file_type']}")
+            st.markdown(f"**Size:** {item['file_size_bytes']:,} bytes")
+            st.markdown(f"**Added:** {item['date_added']}")
+            if item.get("page_count"):
+                st.markdown(f"**Pages:** {item['page_count']}")
+            if item.get("document_date"):
+                st.markdown(f"**Document date:** {item['document_date']}")
+            if item["item_id"] in texts:
+                st.caption(f"Extracted text: {len(texts[item['item_id']]):,} characters")
+            report = get_evidence_pii_reports().get(item["item_id"])
+            if report is not None and report.total:
+                st.markdown(
+                    "**Sensitive numbers:** "
+                    + ", ".join(f"{FINDING_LABELS[f.kind]} `{f.preview}`" for f in report.findings[:10])
+                )
+
+    first = page.page * EVIDENCE_PAGE_SIZE + 1
+    st.caption(f"Showing {first}-{first + len(page.items) - 1} of {page.total}")
+    if page.page_count > 1:
+        # Filters can shrink the listing below the page the user was on.
+        if requested != page.page:
+            st.session_state["evidence_page"] = page.page + 1
+        st.number_input(
+            f"Page (of {page.page_count})",
+            min_value=1,
+            max_value=page.page_count,
+            key="evidence_page",
+        )
+
+
+def _render_search() -> None:
+    """Search box over evidence text, labels and the intake narrative."""
+    query = st.text_input(
+        "Search evidence",
+        key="evidence_search",
+        placeholder='e.g. refund, or "promised a refund" for an exact phrase',
+    )
+    if not query.strip():
+        return
+    hits = get_search_index().search(query, limit=10)
+    if not hits:
+        st.caption("No matches.")
+        return
+    for hit in hits:
+        st.markdown(f"**{hit.title}**")
+        st.caption(hit.snippet)
+
+
+def _analyse(item: dict, content: bytes) -> None:
+    """Fill in metadata read from the file itself (dates, pages, image hash)."""
+    if not item.get("document_date"):
+        item["document_date"] = extract_document_date(content, item["file_name"], item["file_type"]) or ""
+    if is_image(item["file_name"], item["file_type"]):
+        item["page_count"] = 1
+        _index_image(item, content)
+    elif item["file_type"] == "application/pdf" or item["file_name"].lower().endswith(".pdf"):
+        item["page_count"] = count_pdf_pages(content)
+
+
+def _render_bulk_import() -> None:
+    """Import a ZIP of evidence, optionally with a manifest.csv of labels and dates."""
+    with st.expander("Bulk import from a ZIP archive"):
+        st.caption(
+            "Optionally include manifest.csv at the top level of the archive with "
+            "columns file_name, label, description, date."
+        )
+        archive = st.file_uploader("ZIP archive", type=["zip"], key="evidence_bulk_uploader")
+        if archive is None or not st.button("Import archive", key="evidence_bulk_import"):
+            return
+
+        bar = st.progress(0.0, text="Reading archive...")
+
+        def progress(done: int, total: int, name: str) -> None:
+            bar.progress(done / total, text=f"{done}/{total}: {name}")
+
+        existing = {e["file_name"] for e in get_evidence_items()}
+        try:
+            result = import_archive(archive, existing_names=existing, progress=progress)
+        except ARCHIVE_ERRORS:
+            bar.empty()
+            st.error("That file is not a ZIP archive ClaimPilot can read.")
+            return
+
+        to_extract = {}
+        for item in result.items:
+            content = result.contents[item["item_id"]]
+            _analyse(item, content)
+            if text_kind(item["file_name"], item["file_type"]):
+                to_extract[item["item_id"]] = (content, item["file_name"], item["file_type"])
+        add_evidence_items([(item, result.contents[item["item_id"]]) for item in result.items])
+        if to_extract:
+            _extract_text(to_extract)
+
+        bar.empty()
+        st.success(f"Imported {len(result.items)} file(s).")
+        if result.skipped:
+            st.warning(
+                f"Skipped {len(result.skipped)} file(s):\n"
+                + "\n".join(f"- {name}: {reason}" for name, reason in result.skipped[:20])
+            )
+
+
+def _extract_text(files: dict) -> None:
+    """Extract text from new txt/docx/pdf uploads on the worker pool, then scan it for PII."""
+    to_scan = {}
+    for item_id, result in extract_texts(files).items():
+        if result.text:
+            set_evidence_text(item_id, result.text)
+        if result.status != "ok":
+            log_warning("Text extraction for evidence %s ended with status %s", item_id, result.status)
+        content, file_name, file_type = files[item_id]
+        # Plain text is scanned straight from the upload, past the
+        # extraction character cap; other formats through their text.
+        if text_kind(file_name, file_type) == KIND_TXT:
+            to_scan[item_id] = content
+        elif result.text:
+            to_scan[item_id] = result.text
+    for report in scan_sources(to_scan).values():
+        set_evidence_pii_report(report)
+
+
+def _describe_findings(report: PiiScanReport) -> str:
+    return ", ".join(
+        f"{count} {FINDING_LABELS[kind].lower()}{'s' if count != 1 else ''}"
+        for kind, count in sorted(report.counts.items())
+    )
+
+
+def _render_pii_findings(items: list) -> None:
+    """Warn about exhibits whose text contains SSNs, account or card numbers."""
+    reports = get_evidence_pii_reports()
+    lines = [
+        f"- {item['label']}: {_describe_findings(reports[item['item_id']])}"
+        for item in items
+        if item["item_id"] in reports and reports[item["item_id"]].total
+    ]
+    if lines:
+        st.warning(
+            "These exhibits appear to contain sensitive numbers. Court filings are "
+            "usually public, so black out all but the last four digits before "
+            "filing:\n" + "\n".join(lines)
+        )
+
+
+def _index_image(item: dict, content: bytes) -> None:
+    """Hash a new photo once and add it to the near-duplicate index."""
+    try:
+        value = dhash(content)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        log_warning("Could not hash image evidence %s", item["item_id"])
+        return
+    item["perceptual_hash"] = format_hash(value)
+    get_near_duplicate_index().add(item["item_id"], value)
+
+
+def _render_near_duplicates(items: list) -> None:
+    """Flag clusters of near-identical photos."""
+    clusters = get_near_duplicate_index().clusters()
+    if not clusters:
+        return
+    labels = {item["item_id"]: item["label"] for item in items}
+    lines = []
+    for members in clusters:
+        names = [labels[i] for i in members if i in labels]
+        if len(names) > 1:
+            lines.append("- " + ", ".join(names))
+    if lines:
+        st.warning(
+            "These photos look nearly identical. Consider keeping only the "
+            "clearest one of each group:\n" + "\n".join(lines)
+        )
+
+
+def _optimize_new_images() -> None:
+    """Create print-resolution derivatives for images not yet attempted."""
+    files = get_evidence_files()
+    done = get_evidence_derivatives()
+    failed = get_evidence_derivative_failures()
+    pending = {
+        item["item_id"]: files[item["item_id"]]
+        for item in get_evidence_items()
+        if item["item_id"] in files
+        and item["item_id"] not in done
+        and item["item_id"] not in failed
+        and is_image(item["file_name"], item["file_type"])
+    }
+    if not pending:
+        return
+
+    results = optimize_images(pending)
+    # Undecodable images are left out of the results; record them so later
+    # reruns don't decode them again.
+    for item_id in pending.keys() - results.keys():
+        add_evidence_derivative_failure(item_id)
+        log_warning("Could not optimise image evidence %s", item_id)
+    rows = []
+    for item_id, result in results.items():
+        set_evidence_derivative(item_id, result.content)
+        log_info(
+            "Optimised evidence %s: %d -> %d bytes in %.1f ms",
+            item_id, result.original_size, result.optimized_size, result.elapsed_ms,
+        )
+        rows.append({
+            "Item": item_id[:8],
+            "Original (KB)": round(result.original_size / 1024, 1),
+            "Optimised (KB)": round(result.optimized_size / 1024, 1),
+            "Saved (KB)": round(result.bytes_saved / 1024, 1),
+            "Time (ms)": round(result.elapsed_ms, 1),
+        })
+    if rows:
+        with st.expander(f"Image optimisation ({len(rows)} new)"):
+            st.caption("Originals are kept; optimised copies are placed in the exhibit packet.")
+            st.dataframe(rows, hide_index=True)
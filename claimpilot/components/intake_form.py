@@ -9,8 +9,11 @@ from typing import Optional
 
 import streamlit as st
 
-from core.data_manager import get_intake_data, set_intake_data
+from config.counties import counties_for_state
+from config.states import get_state
+from core.data_manager import get_intake_data, request_state_preselect, set_intake_data
 from core.error_boundary import safe_render
+from core.venue import resolve_intake_venue
 
 
 @safe_render("Intake Form")
@@ -63,6 +66,8 @@ def render_intake_form(selected_state: Optional[str]) -> None:
                 height=80,
             )
 
+        venue_county = _render_venue_county(selected_state, existing.get("venue_county", ""))
+
         st.subheader("Claim Details")
         claim_type = st.selectbox(
             "Claim type",
@@ -114,6 +119,7 @@ def render_intake_form(selected_state: Optional[str]) -> None:
                 "respondent_name": respondent_name,
                 "respondent_address": respondent_address,
                 "state": selected_state or "",
+                "venue_county": venue_county,
                 "claim_type": claim_type,
                 "incident_date": incident_date.isoformat() if incident_date else None,
                 "amount_claimed": amount,
@@ -121,5 +127,37 @@ def render_intake_form(selected_state: Optional[str]) -> None:
                 "resolution_attempted": resolution,
                 "desired_outcome": desired,
             }
+            venue = resolve_intake_venue(data)
+            if venue and not data["state"] and get_state(venue.state):
+                # No state chosen yet: take it from the address ZIP code
+                # and rerun so the sidebar shows it.
+                data["state"] = venue.state
+                data["venue_county"] = venue.county
+                set_intake_data(data)
+                request_state_preselect(venue)
+                st.rerun()
+            if venue and not data["venue_county"] and venue.state == data["state"]:
+                data["venue_county"] = venue.county
             set_intake_data(data)
             st.success("Intake information saved.")
+
+
+_VENUE_UNKNOWN = "Not sure yet"
+
+
+def _render_venue_county(selected_state: Optional[str], current: str) -> str:
+    """County selector for states with county court data; returns "" if unset."""
+    counties = [court.county for court in counties_for_state(selected_state or "")]
+    if not counties:
+        return ""
+    st.subheader("Court Venue")
+    options = [_VENUE_UNKNOWN] + counties
+    choice = st.selectbox(
+        "County where you will file",
+        options,
+        index=options.index(current) if current in counties else 0,
+        key="intake_venue_county",
+        help="Usually the county where the respondent lives or does business, "
+        "or where the dispute happened. Used to name the court on your claim form.",
+    )
+    return "" if choice == _VENUE_UNKNOWN else choice
@@ -1,15 +1,60 @@
 """
 State selector with coverage badges for ClaimPilot v2.4.0 (Workstream A).
+
+The option labels, the label-to-abbreviation map and the abbreviation-to-
+index map are built once per process from one state registry, and rebuilt
+on first use after the registry is replaced by a reload (see
+config/states.py).
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Mapping, Optional, Tuple
 
 import streamlit as st
 
-from config.states import ALL_STATES, tier_label
-from core.data_manager import get_selected_state, set_selected_state
+from config import states
+from config.states import StateRegistry
+from core.data_manager import get_selected_state, pop_state_preselect, set_selected_state
+
+_PLACEHOLDER = "-- Select your state --"
+_WIDGET_KEY = "state_selector_widget"
+
+
+@dataclass(frozen=True)
+class SelectorOptions:
+    """Selectbox options for every state, sorted by name, placeholder first."""
+
+    registry: StateRegistry  # the registry the options were built from
+    labels: Tuple[str, ...]
+    abbr_by_label: Mapping[str, str]
+    index_by_abbr: Mapping[str, int]
+
+
+_options: Optional[SelectorOptions] = None
+
+
+def _build_options(registry: StateRegistry) -> SelectorOptions:
+    labels = [_PLACEHOLDER]
+    abbr_by_label = {}
+    index_by_abbr = {}
+    for abbr, coverage in sorted(registry.states.items(), key=lambda item: item[1].name):
+        label = f"{coverage.name} ({abbr}) — {registry.labels[abbr]}"
+        index_by_abbr[abbr] = len(labels)
+        abbr_by_label[label] = abbr
+        labels.append(label)
+    return SelectorOptions(registry, tuple(labels), abbr_by_label, index_by_abbr)
+
+
+def selector_options() -> SelectorOptions:
+    """The cached options, rebuilt if the state registry has been reloaded."""
+    global _options
+    registry = states.REGISTRY
+    options = _options
+    if options is None or options.registry is not registry:
+        options = _options = _build_options(registry)
+    return options
 
 
 def render_state_selector() -> Optional[str]:
@@ -17,37 +62,30 @@ def render_state_selector() -> Optional[str]:
     Render a state selector dropdown with coverage tier badges.
     Returns the selected state abbreviation or None.
     """
-    # Build options with tier badges
-    options = ["-- Select your state --"]
-    abbr_map = {}
-    for abbr in sorted(ALL_STATES.keys(), key=lambda a: ALL_STATES[a].name):
-        state = ALL_STATES[abbr]
-        badge = tier_label(abbr)
-        label = f"{state.name} ({abbr}) — {badge}"
-        options.append(label)
-        abbr_map[label] = abbr
+    options = selector_options()
+
+    # A state resolved from the intake's ZIP code replaces the selection.
+    preselect = pop_state_preselect()
+    if preselect and preselect.state in options.index_by_abbr:
+        st.session_state[_WIDGET_KEY] = options.labels[options.index_by_abbr[preselect.state]]
 
     current = get_selected_state()
-    default_idx = 0
-    if current:
-        for i, opt in enumerate(options):
-            if current in opt:
-                default_idx = i
-                break
+    default_idx = options.index_by_abbr.get(current, 0) if current else 0
 
     selected_label = st.selectbox(
         "Select your state",
-        options,
+        options.labels,
         index=default_idx,
-        key="state_selector_widget",
+        key=_WIDGET_KEY,
         help="Coverage tier indicates whether ClaimPilot has verified form mapping for your state.",
     )
 
-    if selected_label and selected_label != "-- Select your state --":
-        abbr = abbr_map.get(selected_label)
-        if abbr:
-            set_selected_state(abbr)
-            return abbr
+    abbr = options.abbr_by_label.get(selected_label) if selected_label else None
+    if abbr:
+        if preselect and preselect.state == abbr:
+            st.caption(f"Selected from ZIP code {preselect.zip_code} in your intake.")
+        set_selected_state(abbr)
+        return abbr
 
     set_selected_state(None)
     return None
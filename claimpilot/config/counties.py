@@ -0,0 +1,242 @@
+"""
+County court data for ClaimPilot v2.4.0.
+
+Each county and the court that hears its small claims cases, stored in
+config/data/county_courts.bin (override with CLAIMPILOT_COUNTY_DATA):
+
+  header   magic, format version, record count
+  records  fixed-width, sorted by (state, county key); each holds the key
+           and (offset, length) pairs into the string table
+  strings  UTF-8 county names, court names and divisions
+
+The file is memory-mapped on first lookup, so importing this module does
+no I/O. Lookups bisect the record table and decode only the matching
+records. Build the file from config/data/county_courts.csv with
+``python -m config.counties``; the file is replaced atomically, so a
+running process keeps its mapping of the old one.
+
+Coverage is partial: California (58 counties) and Florida (67). For other
+states the exports fall back to the state-level court in config/states.py.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import mmap
+import os
+import struct
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from config.settings import COUNTY_DATA_CSV_PATH, COUNTY_DATA_PATH
+
+_MAGIC = b"CPCC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHI")  # magic, format version, record count
+_KEY_BYTES = 32  # 2-byte state + 30-byte county key, NUL-padded
+_RECORD = struct.Struct(f"<{_KEY_BYTES}sIHIHIH")  # key, then (offset, length) x 3
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+class CountyDataError(ValueError):
+    """The county data file or its CSV source is malformed."""
+
+
+@dataclass(frozen=True)
+class CountyCourt:
+    """The small claims venue for one county."""
+
+    state: str
+    county: str
+    court_name: str
+    division: str
+
+    @property
+    def venue(self) -> str:
+        """e.g. "the Small Claims Division of the Superior Court of California, County of Alameda"."""
+        return f"the {self.division} of the {self.court_name}" if self.division else f"the {self.court_name}"
+
+
+def county_key(name: str) -> str:
+    """Normalise a county name for lookup: "St. Johns County" -> "stjohns"."""
+    lowered = name.strip().lower()
+    if lowered.endswith(" county"):
+        lowered = lowered[: -len(" county")]
+    return "".join(ch for ch in lowered if ch.isalnum())
+
+
+def _record_key(state: str, county: str) -> bytes:
+    return (state.upper() + county_key(county)).encode("ascii", "ignore")[:_KEY_BYTES].ljust(_KEY_BYTES, b"\0")
+
+
+class _KeyColumn(Sequence[bytes]):
+    """The record keys as a sequence, read straight from the buffer, for bisect."""
+
+    def __init__(self, buf: Buffer, count: int) -> None:
+        self._buf = buf
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:  # type: ignore[override]
+        start = _HEADER.size + i * _RECORD.size
+        return self._buf[start:start + _KEY_BYTES]
+
+
+class CountyIndex:
+    """Read-only view of a county data file."""
+
+    def __init__(self, buf: Buffer) -> None:
+        if len(buf) < _HEADER.size:
+            raise CountyDataError("county data file is truncated")
+        magic, version, count = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise CountyDataError("not a county data file, or an unsupported format version")
+        if len(buf) < _HEADER.size + count * _RECORD.size:
+            raise CountyDataError("county data file is truncated")
+        self._buf = buf
+        self._count = count
+        self._strings = _HEADER.size + count * _RECORD.size
+        self._keys = _KeyColumn(buf, count)
+        self._by_state: Dict[str, Tuple[CountyCourt, ...]] = {}
+
+    @classmethod
+    def open(cls, path: str) -> "CountyIndex":
+        with open(path, "rb") as fh:
+            # The mapping stays valid after the file is closed or replaced.
+            return cls(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings + offset
+        return self._buf[start:start + length].decode("utf-8")
+
+    def _record(self, i: int) -> CountyCourt:
+        key, *spans = _RECORD.unpack_from(self._buf, _HEADER.size + i * _RECORD.size)
+        county, court, division = (self._string(spans[j], spans[j + 1]) for j in (0, 2, 4))
+        return CountyCourt(key[:2].decode("ascii"), county, court, division)
+
+    def lookup(self, state: str, county: str) -> Optional[CountyCourt]:
+        """The court for ``county`` in ``state`` (any case, "County" suffix optional)."""
+        key = _record_key(state, county)
+        i = bisect.bisect_left(self._keys, key)
+        if i < self._count and self._keys[i] == key:
+            return self._record(i)
+        return None
+
+    def counties(self, state: str) -> Tuple[CountyCourt, ...]:
+        """Every county in ``state``, ordered by county name."""
+        state = state.upper()
+        cached = self._by_state.get(state)
+        if cached is None:
+            prefix = state.encode("ascii", "ignore")[:2]
+            lo = bisect.bisect_left(self._keys, prefix.ljust(_KEY_BYTES, b"\0"))
+            hi = bisect.bisect_left(self._keys, prefix + b"\xff", lo)
+            cached = self._by_state[state] = tuple(self._record(i) for i in range(lo, hi)) if len(prefix) == 2 else ()
+        return cached
+
+
+# ---------------------------------------------------------------------------
+# Building the data file
+# ---------------------------------------------------------------------------
+
+
+def read_county_csv(path: str) -> List[CountyCourt]:
+    """Read and validate the CSV source (columns: state, county, court_name, division)."""
+    courts: List[CountyCourt] = []
+    seen = set()
+    with open(path, encoding="utf-8", newline="") as fh:
+        for line, row in enumerate(csv.DictReader(fh), start=2):
+            try:
+                court = CountyCourt(row["state"].strip(), row["county"].strip(), row["court_name"].strip(), row["division"].strip())
+            except (KeyError, AttributeError):
+                raise CountyDataError(f"{path}:{line}: expected state, county, court_name, division") from None
+            key = county_key(court.county)
+            if not (len(court.state) == 2 and court.state.isascii() and court.state.isalpha() and court.state.isupper()):
+                raise CountyDataError(f"{path}:{line}: state must be two capital letters")
+            if not key or not key.isascii() or len(key) > _KEY_BYTES - 2:
+                raise CountyDataError(f"{path}:{line}: county name cannot be indexed")
+            if not court.court_name:
+                raise CountyDataError(f"{path}:{line}: court_name is required")
+            if (court.state, key) in seen:
+                raise CountyDataError(f"{path}:{line}: duplicate county {court.county}, {court.state}")
+            seen.add((court.state, key))
+            courts.append(court)
+    return courts
+
+
+def encode_county_data(courts: Sequence[CountyCourt]) -> bytes:
+    """Serialise courts into the on-disk format."""
+    records = []
+    strings = bytearray()
+    spans: Dict[str, Tuple[int, int]] = {}  # court names and divisions repeat
+
+    def span(text: str) -> Tuple[int, int]:
+        if text not in spans:
+            raw = text.encode("utf-8")
+            spans[text] = (len(strings), len(raw))
+            strings.extend(raw)
+        return spans[text]
+
+    for court in sorted(courts, key=lambda c: _record_key(c.state, c.county)):
+        records.append(_RECORD.pack(
+            _record_key(court.state, court.county),
+            *span(court.county), *span(court.court_name), *span(court.division),
+        ))
+    return _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(records)) + b"".join(records) + bytes(strings)
+
+
+def build_county_data(csv_path: str = COUNTY_DATA_CSV_PATH, out_path: str = COUNTY_DATA_PATH) -> int:
+    """Build the data file from its CSV source. Returns the number of counties."""
+    courts = read_county_csv(csv_path)
+    tmp_path = f"{out_path}.tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(encode_county_data(courts))
+    os.replace(tmp_path, out_path)
+    return len(courts)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide index
+# ---------------------------------------------------------------------------
+
+_lock = threading.Lock()
+_index: Optional[CountyIndex] = None
+
+
+def get_county_index() -> CountyIndex:
+    """The shared index, mapped on first use."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = CountyIndex.open(COUNTY_DATA_PATH)
+    return _index
+
+
+def get_county_court(state_abbr: str, county: str) -> Optional[CountyCourt]:
+    """The court for a county, or None if the county (or its state) has no data."""
+    if not state_abbr or not county:
+        return None
+    return get_county_index().lookup(state_abbr, county)
+
+
+def counties_for_state(state_abbr: str) -> Tuple[CountyCourt, ...]:
+    """Counties with court data in a state, ordered by name; empty if none."""
+    if not state_abbr:
+        return ()
+    return get_county_index().counties(state_abbr)
+
+
+if __name__ == "__main__":
+    count = build_county_data(*sys.argv[1:3])
+    print(f"wrote {count} counties to {sys.argv[2] if len(sys.argv) > 2 else COUNTY_DATA_PATH}")
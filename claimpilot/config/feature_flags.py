@@ -31,3 +31,11 @@ SHOW_PLACEHOLDER_POLICIES: bool = _flag("SHOW_PLACEHOLDER_POLICIES", False)
 
 # When True, enable detailed analytics/telemetry (requires consent).
 ENABLE_ANALYTICS: bool = _flag("ENABLE_ANALYTICS", False)
+
+# Downscale and recompress uploaded photos to print resolution.
+# Originals are always kept. Default OFF.
+ENABLE_IMAGE_OPTIMIZATION: bool = _flag("ENABLE_IMAGE_OPTIMIZATION", False)
+
+# Scan each generated binder PDF for leaked SSNs/account numbers, base64
+# binary and raw PDF data while the ZIP is written. Default ON.
+ENABLE_BINDER_VERIFICATION: bool = _flag("ENABLE_BINDER_VERIFICATION", True)
@@ -2,6 +2,8 @@
 Application-wide settings for ClaimPilot v2.4.0.
 """
 
+import os
+
 APP_NAME = "ClaimPilot"
 APP_VERSION = "2.4.0"
 APP_TAGLINE = "Your guided path through the small-claims process"
@@ -40,3 +42,72 @@ PRIVACY_SUMMARY = (
     "to third parties unless you explicitly export or share it. "
     "You may delete all your data at any time using the 'Delete My Data' feature."
 )
+
+# Evidence image optimisation: images are fitted to a printable area
+# (inches, portrait letter page minus margins) at this resolution.
+EXHIBIT_IMAGE_DPI = 150
+EXHIBIT_IMAGE_MAX_INCHES = (7.5, 10.0)
+EXHIBIT_IMAGE_JPEG_QUALITY = 80
+
+# Photos whose 64-bit perceptual hashes differ in at most this many bits
+# are flagged as near-duplicates in the Evidence tab.
+NEAR_DUPLICATE_MAX_DISTANCE = 10
+
+# Text extraction from txt/docx/pdf evidence: per-file character cap and
+# wall-clock budget (seconds) before a file is reported as timed out.
+EVIDENCE_TEXT_MAX_CHARS = 2_000_000
+EVIDENCE_TEXT_TIMEOUT_S = 10.0
+
+# Evidence items shown per page in the Evidence tab.
+EVIDENCE_PAGE_SIZE = 20
+
+# Bulk ZIP import: per-file size cap (bytes, enforced while streaming),
+# maximum files per archive, and the largest plausible compression ratio
+# for a single member (guards against decompression bombs).
+BULK_IMPORT_MAX_FILE_BYTES = 25 * 1024 * 1024
+BULK_IMPORT_MAX_FILES = 500
+BULK_IMPORT_MAX_RATIO = 100
+
+# Evidence PII scan: characters per chunk, characters of look-ahead past
+# each chunk (must exceed the longest possible match, currently 104), and
+# findings kept per exhibit.
+PII_SCAN_CHUNK_CHARS = 64 * 1024
+PII_SCAN_OVERLAP_CHARS = 128
+PII_SCAN_MAX_FINDINGS = 50
+
+# Production log pipeline: records waiting for the background writer.
+# When the queue is full, new records are dropped and counted.
+LOG_QUEUE_MAX_RECORDS = 10_000
+# Longest flush_logs() waits (seconds) for the writer to catch up.
+LOG_FLUSH_TIMEOUT_S = 5.0
+
+# Error-storm control: each event fingerprint (exception type + tab) is
+# logged at most LOG_EVENT_BURST times per window; further occurrences are
+# counted and reported as "suppressed N occurrences" with the next one.
+LOG_EVENT_WINDOW_S = 60.0
+LOG_EVENT_BURST = 3
+LOG_EVENT_MAX_FINGERPRINTS = 1024
+
+# Fraction of info-level log calls that are emitted (1.0 = all).
+# Override with CLAIMPILOT_LOG_INFO_SAMPLE_RATE.
+LOG_INFO_SAMPLE_RATE = 1.0
+
+# State coverage data file (see config/states.py), the schema version this
+# build understands, and how often (seconds) the file's mtime is checked
+# for a hot reload.
+STATE_DATA_PATH = os.environ.get("CLAIMPILOT_STATE_DATA") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "states.json"
+)
+STATE_DATA_SCHEMA = 1
+STATE_DATA_CHECK_S = 5.0
+
+# County court dataset (see config/counties.py): the memory-mapped index and
+# the CSV it is built from.
+COUNTY_DATA_PATH = os.environ.get("CLAIMPILOT_COUNTY_DATA") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "county_courts.bin"
+)
+COUNTY_DATA_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "county_courts.csv")
+
+# ZIP code ranges used to resolve an address to a state (and county, where
+# a range is narrowed to one) -- see core/venue.py.
+ZIP_VENUE_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "zip_venues.csv")
@@ -5,12 +5,34 @@ Tier 1 ("Supported"): State-specific form mapping verified by legal review.
 Tier 2 ("Guidance-only"): General template; user must verify local requirements.
 
 10 Pilot Tier 1 States: CA, FL, GA, IL, NJ, NY, OH, PA, TX, WA
+
+State data lives in config/data/states.json (override the path with
+CLAIMPILOT_STATE_DATA). It is loaded on first use, validated, and compiled
+into an immutable registry: read-only state mapping, frozenset tier
+membership, tier labels, every case variant of each abbreviation, and the
+text fragments the export generators repeat. Lookups are single dict or
+set probes.
+
+``maybe_reload_state_data()`` (called once per rerun) checks the file's
+mtime at most every STATE_DATA_CHECK_S seconds. A changed file is loaded
+and validated in full, then swapped in with a single assignment, so a
+reader sees either the old registry or the new one. Code that caches
+anything derived from state data registers a reload listener.
 """
 
 from __future__ import annotations
 
+import itertools
+import json
+import os
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Callable, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from config.settings import STATE_DATA_CHECK_S, STATE_DATA_PATH, STATE_DATA_SCHEMA
 
 
 @dataclass(frozen=True)
@@ -30,7 +52,7 @@ class StateCoverage:
     name: str
     abbreviation: str
     tier: int  # 1 or 2
-    sources: List[StateSource] = field(default_factory=list)
+    sources: Sequence[StateSource] = field(default_factory=tuple)
     official_form_url: Optional[str] = None  # Only for Tier 1
     notes: str = ""
     # Court metadata — Tier 1 states
@@ -42,360 +64,360 @@ class StateCoverage:
 
 
 # ---------------------------------------------------------------------------
-# Tier 1 states -- verified form mappings (10 pilot states)
+# Registry
 # ---------------------------------------------------------------------------
 
-_TIER1: List[StateCoverage] = [
-    # --- California ---
-    StateCoverage(
-        name="California",
-        abbreviation="CA",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.courts.ca.gov/selfhelp-smallclaims.htm",
-                label="California Courts - Small Claims Self-Help",
-                source_quality="official",
-                last_reviewed_iso="2025-12-15",
-            ),
-            StateSource(
-                url="https://www.courts.ca.gov/1062.htm",
-                label="California Courts - Small Claims Forms",
-                source_quality="official",
-                last_reviewed_iso="2025-12-15",
-            ),
-        ],
-        official_form_url="https://www.courts.ca.gov/documents/sc100.pdf",
-        notes="SC-100 Plaintiff's Claim and ORDER to Go to Small Claims Court.",
-        court_name="Superior Court of California",
-        court_division="Small Claims Division",
-        form_number="SC-100",
-        max_claim_amount=12500,
-        filing_fee_range="$30 - $75",
-    ),
-
-    # --- Florida ---
-    StateCoverage(
-        name="Florida",
-        abbreviation="FL",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.flcourts.gov/Resources-Services/Court-Improvement/Self-Help-Information",
-                label="Florida Courts - Self-Help Information",
-                source_quality="official",
-                last_reviewed_iso="2025-11-20",
-            ),
-            StateSource(
-                url="https://www.flcourts.gov/content/download/403225/3459633/form7.010.pdf",
-                label="Florida Small Claims Rules - Form 7.010",
-                source_quality="official",
-                last_reviewed_iso="2025-11-20",
-            ),
-        ],
-        official_form_url="https://www.flcourts.gov/content/download/403225/3459633/form7.010.pdf",
-        notes="Form 7.010 Statement of Claim (Small Claims).",
-        court_name="County Court",
-        court_division="Small Claims Division",
-        form_number="Form 7.010",
-        max_claim_amount=8000,
-        filing_fee_range="$55 - $300",
-    ),
-
-    # --- Georgia ---
-    StateCoverage(
-        name="Georgia",
-        abbreviation="GA",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://georgiacourts.gov/magistrate-court/",
-                label="Georgia Courts - Magistrate Court",
-                source_quality="official",
-                last_reviewed_iso="2025-10-15",
-            ),
-            StateSource(
-                url="https://georgiacourts.gov/wp-content/uploads/2019/07/CIVIL_CASE_FILING_INFORMATION_FORM.pdf",
-                label="Georgia Magistrate Court - Civil Case Filing Form",
-                source_quality="official",
-                last_reviewed_iso="2025-10-15",
-            ),
-        ],
-        official_form_url="https://georgiacourts.gov/wp-content/uploads/2019/07/CIVIL_CASE_FILING_INFORMATION_FORM.pdf",
-        notes="Magistrate Court Statement of Claim. Georgia uses county-level magistrate courts.",
-        court_name="Magistrate Court",
-        court_division="Small Claims Division",
-        form_number="Statement of Claim",
-        max_claim_amount=15000,
-        filing_fee_range="$45 - $75",
-    ),
-
-    # --- Illinois ---
-    StateCoverage(
-        name="Illinois",
-        abbreviation="IL",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.illinoiscourts.gov/forms/approved-forms/",
-                label="Illinois Courts - Approved Forms",
-                source_quality="official",
-                last_reviewed_iso="2025-09-10",
-            ),
-            StateSource(
-                url="https://www.illinoiscourts.gov/Resources/1f27c27c-32b8-4e57-87c0-8f3e2ad657a4/SC_2_0_Small_Claims_Complaint.pdf",
-                label="Illinois - Small Claims Complaint Form SC 2-1",
-                source_quality="official",
-                last_reviewed_iso="2025-09-10",
-            ),
-        ],
-        official_form_url="https://www.illinoiscourts.gov/Resources/1f27c27c-32b8-4e57-87c0-8f3e2ad657a4/SC_2_0_Small_Claims_Complaint.pdf",
-        notes="Form SC 2-1 Small Claims Complaint. Filed in Circuit Court.",
-        court_name="Circuit Court of Illinois",
-        court_division="Small Claims Division",
-        form_number="SC 2-1",
-        max_claim_amount=10000,
-        filing_fee_range="$20 - $75",
-    ),
-
-    # --- New Jersey ---
-    StateCoverage(
-        name="New Jersey",
-        abbreviation="NJ",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.njcourts.gov/self-help/small-claims",
-                label="New Jersey Courts - Small Claims",
-                source_quality="official",
-                last_reviewed_iso="2025-10-01",
-            ),
-            StateSource(
-                url="https://www.njcourts.gov/sites/default/files/forms/11789/dc_sm_clmntgd_0.pdf",
-                label="New Jersey - Small Claims Plaintiff Guide",
-                source_quality="official",
-                last_reviewed_iso="2025-10-01",
-            ),
-        ],
-        official_form_url="https://www.njcourts.gov/self-help/small-claims",
-        notes="Small Claims Complaint. Filed in Superior Court, Special Civil Part.",
-        court_name="Superior Court of New Jersey",
-        court_division="Special Civil Part, Small Claims Section",
-        form_number="Small Claims Complaint",
-        max_claim_amount=5000,
-        filing_fee_range="$15 - $50",
-    ),
-
-    # --- New York ---
-    StateCoverage(
-        name="New York",
-        abbreviation="NY",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://nycourts.gov/courts/nyc/smallclaims/index.shtml",
-                label="NYC Small Claims Court",
-                source_quality="official",
-                last_reviewed_iso="2025-11-01",
-            ),
-            StateSource(
-                url="https://www.nycourts.gov/courts/nyc/smallclaims/startingcase.shtml",
-                label="NYC - How to Start a Small Claims Case",
-                source_quality="official",
-                last_reviewed_iso="2025-11-01",
-            ),
-        ],
-        official_form_url="https://nycourts.gov/courts/nyc/smallclaims/forms.shtml",
-        notes="Small Claims Application. Filed in City/District/Town/Village Court.",
-        court_name="Small Claims Court",
-        court_division="Small Claims Part",
-        form_number="Small Claims Application",
-        max_claim_amount=10000,
-        filing_fee_range="$15 - $20",
-    ),
-
-    # --- Ohio ---
-    StateCoverage(
-        name="Ohio",
-        abbreviation="OH",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.supremecourt.ohio.gov/public/small-claims/",
-                label="Ohio Supreme Court - Small Claims Information",
-                source_quality="official",
-                last_reviewed_iso="2025-09-25",
-            ),
-            StateSource(
-                url="https://www.ohiolegalhelp.org/topic/small-claims",
-                label="Ohio Legal Help - Small Claims Guide",
-                source_quality="aggregator",
-                last_reviewed_iso="2025-09-25",
-            ),
-        ],
-        official_form_url="https://www.supremecourt.ohio.gov/public/small-claims/",
-        notes="Small Claims Complaint. Filed in Municipal or County Court.",
-        court_name="Municipal Court / County Court",
-        court_division="Small Claims Division",
-        form_number="Small Claims Complaint",
-        max_claim_amount=6000,
-        filing_fee_range="$30 - $65",
-    ),
-
-    # --- Pennsylvania ---
-    StateCoverage(
-        name="Pennsylvania",
-        abbreviation="PA",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.pacourts.us/learn/minor-courts",
-                label="Pennsylvania Courts - Minor Courts",
-                source_quality="official",
-                last_reviewed_iso="2025-08-30",
-            ),
-            StateSource(
-                url="https://www.pacourts.us/forms/for-the-public",
-                label="Pennsylvania Courts - Public Forms",
-                source_quality="official",
-                last_reviewed_iso="2025-08-30",
-            ),
-        ],
-        official_form_url="https://www.pacourts.us/forms/for-the-public",
-        notes="Civil Complaint (Statement of Claim). Filed in Magisterial District Court.",
-        court_name="Magisterial District Court",
-        court_division="Civil Division",
-        form_number="Statement of Claim",
-        max_claim_amount=12000,
-        filing_fee_range="$45 - $125",
-    ),
-
-    # --- Texas ---
-    StateCoverage(
-        name="Texas",
-        abbreviation="TX",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.txcourts.gov/rules-forms/forms/small-claims-forms/",
-                label="Texas Courts - Small Claims Forms",
-                source_quality="official",
-                last_reviewed_iso="2025-11-10",
-            ),
-            StateSource(
-                url="https://www.texasattorneygeneral.gov/consumer-protection/file-complaint",
-                label="Texas Attorney General - Consumer Protection",
-                source_quality="official",
-                last_reviewed_iso="2025-11-10",
-            ),
-        ],
-        official_form_url="https://www.txcourts.gov/rules-forms/forms/small-claims-forms/",
-        notes="Petition in Justice Court (Small Claims). Filed in Justice Court (JP Court).",
-        court_name="Justice Court",
-        court_division="Small Claims",
-        form_number="Petition in Small Claims Court",
-        max_claim_amount=20000,
-        filing_fee_range="$31 - $54",
-    ),
-
-    # --- Washington ---
-    StateCoverage(
-        name="Washington",
-        abbreviation="WA",
-        tier=1,
-        sources=[
-            StateSource(
-                url="https://www.courts.wa.gov/newsinfo/resources/?fa=newsinfo_jury.smallclaims",
-                label="Washington Courts - Small Claims Information",
-                source_quality="official",
-                last_reviewed_iso="2025-10-20",
-            ),
-            StateSource(
-                url="https://www.atg.wa.gov/small-claims-court",
-                label="Washington Attorney General - Small Claims Guide",
-                source_quality="official",
-                last_reviewed_iso="2025-10-20",
-            ),
-        ],
-        official_form_url="https://www.courts.wa.gov/forms/?fa=forms.contribute&formID=31",
-        notes="Notice of Small Claim. Filed in District Court.",
-        court_name="District Court",
-        court_division="Small Claims Department",
-        form_number="Notice of Small Claim",
-        max_claim_amount=10000,
-        filing_fee_range="$14 - $29",
-    ),
-]
+TIER1_LABEL = "Supported (Tier 1)"
+TIER2_LABEL = "Guidance-only (Tier 2)"
+
+
+@dataclass(frozen=True)
+class StateFragments:
+    """Text the export generators build for a state, precomputed."""
+
+    state_name: str
+    coverage: str  # tier label
+    coverage_line: str  # "Coverage Status: ..."
+    state_line: str  # "State of ... | Coverage: ..."
+
+
+@dataclass(frozen=True)
+class StateRegistry:
+    """Immutable, indexed view of every state in one data file."""
+
+    version: Any  # the file's "version" field
+    states: Mapping[str, StateCoverage]
+    tier1: FrozenSet[str]
+    labels: Mapping[str, str]
+    keys: Mapping[str, str]  # every case spelling of an abbreviation -> abbreviation
+    fragments: Mapping[str, StateFragments]
+
+
+def _case_variants(abbreviation: str) -> Iterable[str]:
+    pairs = [(c.lower(), c.upper()) for c in abbreviation]
+    return {"".join(chars) for chars in itertools.product(*pairs)}
+
+
+def _compile_registry(version: Any, coverages: Iterable[StateCoverage]) -> StateRegistry:
+    states = {sc.abbreviation: sc for sc in coverages}
+    labels = {abbr: TIER1_LABEL if sc.tier == 1 else TIER2_LABEL for abbr, sc in states.items()}
+    return StateRegistry(
+        version=version,
+        states=MappingProxyType(states),
+        tier1=frozenset(abbr for abbr, sc in states.items() if sc.tier == 1),
+        labels=MappingProxyType(labels),
+        keys=MappingProxyType({
+            variant: abbr for abbr in states for variant in _case_variants(abbr)
+        }),
+        fragments=MappingProxyType({
+            abbr: StateFragments(
+                state_name=sc.name,
+                coverage=labels[abbr],
+                coverage_line=f"Coverage Status: {labels[abbr]}",
+                state_line=f"State of {sc.name} | Coverage: {labels[abbr]}",
+            )
+            for abbr, sc in states.items()
+        }),
+    )
+
 
 # ---------------------------------------------------------------------------
-# Tier 2 states -- guidance only
+# Loading and validation
 # ---------------------------------------------------------------------------
 
-_TIER2_NAMES = {
-    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
-    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware",
-    "HI": "Hawaii", "ID": "Idaho", "IN": "Indiana", "IA": "Iowa",
-    "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine",
-    "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
-    "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska",
-    "NV": "Nevada", "NH": "New Hampshire", "NM": "New Mexico",
-    "NC": "North Carolina", "ND": "North Dakota", "OK": "Oklahoma",
-    "OR": "Oregon", "RI": "Rhode Island", "SC": "South Carolina",
-    "SD": "South Dakota", "TN": "Tennessee", "UT": "Utah", "VT": "Vermont",
-    "VA": "Virginia", "WV": "West Virginia", "WI": "Wisconsin",
-    "WY": "Wyoming", "DC": "District of Columbia",
+
+class StateDataError(ValueError):
+    """The state data file is missing, malformed or fails validation."""
+
+
+_NONE = type(None)
+_SOURCE_FIELDS = {"url": str, "label": str, "source_quality": str, "last_reviewed_iso": (str, _NONE)}
+_SOURCE_REQUIRED = ("url", "label", "source_quality")
+_SOURCE_QUALITIES = ("official", "aggregator")
+_STATE_FIELDS = {
+    "name": str,
+    "abbreviation": str,
+    "tier": int,
+    "sources": list,
+    "official_form_url": (str, _NONE),
+    "notes": str,
+    "court_name": str,
+    "court_division": str,
+    "form_number": str,
+    "max_claim_amount": int,
+    "filing_fee_range": str,
 }
+_STATE_REQUIRED = ("name", "abbreviation", "tier", "sources")
+
+
+def _check_fields(entry: Any, types: Mapping[str, Any], required: Sequence[str], where: str) -> None:
+    if not isinstance(entry, dict):
+        raise StateDataError(f"{where}: expected an object")
+    unknown = sorted(set(entry) - set(types))
+    if unknown:
+        raise StateDataError(f"{where}: unknown field(s) {', '.join(unknown)}")
+    for key in required:
+        if key not in entry:
+            raise StateDataError(f"{where}: missing {key}")
+    for key, value in entry.items():
+        if not isinstance(value, types[key]) or (isinstance(value, bool) and types[key] is int):
+            raise StateDataError(f"{where}: {key} has the wrong type")
+
+
+def _parse_source(entry: Any, where: str) -> StateSource:
+    _check_fields(entry, _SOURCE_FIELDS, _SOURCE_REQUIRED, where)
+    if entry["source_quality"] not in _SOURCE_QUALITIES:
+        raise StateDataError(f"{where}: source_quality must be one of {', '.join(_SOURCE_QUALITIES)}")
+    reviewed = entry.get("last_reviewed_iso")
+    if reviewed is not None:
+        try:
+            date.fromisoformat(reviewed)
+        except ValueError:
+            raise StateDataError(f"{where}: last_reviewed_iso is not an ISO-8601 date") from None
+    return StateSource(**entry)
+
+
+def _parse_state(entry: Any, where: str) -> StateCoverage:
+    _check_fields(entry, _STATE_FIELDS, _STATE_REQUIRED, where)
+    abbr = entry["abbreviation"]
+    if not (len(abbr) == 2 and abbr.isascii() and abbr.isalpha() and abbr.isupper()):
+        raise StateDataError(f"{where}: abbreviation must be two capital letters")
+    where = f"{where} ({abbr})"
+    if entry["tier"] not in (1, 2):
+        raise StateDataError(f"{where}: tier must be 1 or 2")
+    if entry["tier"] == 2 and entry.get("official_form_url"):
+        raise StateDataError(f"{where}: Tier 2 states cannot have an official form URL")
+    if entry.get("max_claim_amount", 0) < 0:
+        raise StateDataError(f"{where}: max_claim_amount cannot be negative")
+    if not entry["sources"]:
+        raise StateDataError(f"{where}: at least one source is required")
+    sources = tuple(_parse_source(src, f"{where} source {i}") for i, src in enumerate(entry["sources"]))
+    return StateCoverage(**{**entry, "sources": sources})
+
+
+def parse_state_data(document: Any) -> StateRegistry:
+    """Validate a decoded state data document and compile it into a registry."""
+    if not isinstance(document, dict):
+        raise StateDataError("expected a JSON object at the top level")
+    if document.get("schema") != STATE_DATA_SCHEMA:
+        raise StateDataError(f"unsupported schema {document.get('schema')!r} (expected {STATE_DATA_SCHEMA})")
+    if "version" not in document:
+        raise StateDataError("missing version")
+    entries = document.get("states")
+    if not isinstance(entries, list) or not entries:
+        raise StateDataError("states must be a non-empty list")
+    coverages = []
+    seen = set()
+    for i, entry in enumerate(entries):
+        sc = _parse_state(entry, f"state {i}")
+        if sc.abbreviation in seen:
+            raise StateDataError(f"state {i}: duplicate abbreviation {sc.abbreviation}")
+        seen.add(sc.abbreviation)
+        coverages.append(sc)
+    return _compile_registry(document["version"], coverages)
+
+
+def load_state_data(path: str) -> StateRegistry:
+    """Read, validate and compile a state data file. Raises StateDataError."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            document = json.load(fh)
+    except OSError as exc:
+        raise StateDataError(f"{path}: cannot read ({exc.strerror})") from None
+    except ValueError as exc:
+        raise StateDataError(f"{path}: invalid JSON ({exc})") from None
+    try:
+        return parse_state_data(document)
+    except StateDataError as exc:
+        raise StateDataError(f"{path}: {exc}") from None
 
 
-def _build_tier2() -> List[StateCoverage]:
-    result = []
-    for abbr, name in sorted(_TIER2_NAMES.items(), key=lambda x: x[1]):
-        result.append(
-            StateCoverage(
-                name=name,
-                abbreviation=abbr,
-                tier=2,
-                sources=[
-                    StateSource(
-                        url=f"https://www.nolo.com/legal-encyclopedia/small-claims-court-{name.lower().replace(' ', '-')}.html",
-                        label=f"Nolo: {name} Small Claims Guide",
-                        source_quality="aggregator",
-                        last_reviewed_iso=None,
-                    ),
-                ],
-                official_form_url=None,
-                notes="General template only. User must verify local court requirements.",
-            )
-        )
-    return result
+# ---------------------------------------------------------------------------
+# Live registry and hot reload
+# ---------------------------------------------------------------------------
 
 
-_TIER2: List[StateCoverage] = _build_tier2()
+class _Index:
+    """Plain-dict copies of one registry for the lookup helpers.
+
+    A probe through a MappingProxyType costs an extra call per lookup.
+    """
+
+    __slots__ = ("registry", "states", "keys", "tier1", "labels", "fragments", "tier1_list", "tier2_list")
+
+    def __init__(self, registry: StateRegistry) -> None:
+        self.registry = registry
+        self.states = dict(registry.states)
+        self.keys = dict(registry.keys)
+        self.tier1 = registry.tier1
+        self.labels = dict(registry.labels)
+        self.fragments = dict(registry.fragments)
+        self.tier1_list = tuple(sorted(registry.tier1))
+        self.tier2_list = tuple(sorted(set(registry.states) - registry.tier1))
+
+
+ReloadListener = Callable[[StateRegistry], None]
+
+_lock = threading.Lock()
+_path: str = STATE_DATA_PATH
+_index: Optional[_Index] = None  # replaced wholesale on reload, never mutated
+_stamp: Optional[Tuple[int, int]] = None  # (mtime_ns, size) of the loaded or last rejected file
+_next_check = 0.0
+_listeners: List[ReloadListener] = []
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _ensure_loaded() -> _Index:
+    global _index, _stamp
+    with _lock:
+        if _index is None:
+            stamp = _file_stamp(_path)
+            _index = _Index(load_state_data(_path))
+            _stamp = stamp
+        return _index
+
+
+def add_reload_listener(listener: ReloadListener) -> None:
+    """Call ``listener(registry)`` after every reload, to drop derived caches."""
+    with _lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def remove_reload_listener(listener: ReloadListener) -> None:
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def reload_state_data(path: Optional[str] = None) -> StateRegistry:
+    """
+    Load ``path`` (default: the current data file) and make it current.
+
+    The new registry is built and validated before the swap; on
+    StateDataError the current one stays in place. Listeners run after
+    the swap, and all of them run even if one raises.
+    """
+    global _index, _path, _stamp
+    with _lock:
+        target = path or _path
+        stamp = _file_stamp(target)
+        try:
+            registry = load_state_data(target)
+        except StateDataError:
+            if target == _path:
+                _stamp = stamp  # report a bad file once, not on every check
+            raise
+        _path = target
+        _index = _Index(registry)
+        _stamp = stamp
+        listeners = list(_listeners)
+    error: Optional[BaseException] = None
+    for listener in listeners:
+        try:
+            listener(registry)
+        except Exception as exc:
+            error = error or exc
+    if error is not None:
+        raise error
+    return registry
+
+
+def maybe_reload_state_data(now: Optional[float] = None) -> bool:
+    """
+    Reload the data file if it changed since it was loaded.
+
+    Stats the file at most every STATE_DATA_CHECK_S seconds, so it is
+    cheap to call on every rerun. Returns True if a new registry was
+    swapped in; raises StateDataError (once per change) if the changed
+    file is rejected.
+    """
+    global _next_check, _stamp
+    now = time.monotonic() if now is None else now
+    with _lock:
+        if now < _next_check:
+            return False
+        _next_check = now + STATE_DATA_CHECK_S
+        loaded = _index is not None
+        stamp = _file_stamp(_path)
+        if loaded and stamp == _stamp:
+            return False
+        if loaded and stamp is None:
+            _stamp = None
+            raise StateDataError(f"{_path}: state data file is missing; keeping the loaded version")
+    if not loaded:
+        _ensure_loaded()
+        return False
+    reload_state_data()
+    return True
+
+
+def state_data_version() -> Any:
+    """The ``version`` field of the loaded data file."""
+    return (_index or _ensure_loaded()).registry.version
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-ALL_STATES: Dict[str, StateCoverage] = {}
-for _sc in _TIER1 + _TIER2:
-    ALL_STATES[_sc.abbreviation] = _sc
 
-TIER1_STATES: List[str] = sorted(sc.abbreviation for sc in _TIER1)
-TIER2_STATES: List[str] = sorted(sc.abbreviation for sc in _TIER2)
+class _StatesView(Mapping[str, StateCoverage]):
+    """Read-only mapping that always reflects the current registry."""
+
+    def __getitem__(self, abbreviation: str) -> StateCoverage:
+        return (_index or _ensure_loaded()).states[abbreviation]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter((_index or _ensure_loaded()).states)
+
+    def __len__(self) -> int:
+        return len((_index or _ensure_loaded()).states)
+
+    def __repr__(self) -> str:
+        return f"<states {sorted(self)}>"
+
+
+ALL_STATES: Mapping[str, StateCoverage] = _StatesView()
+
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first access. ``from config.states import TIER1_STATES``
+    # takes a snapshot; read ``states.TIER1_STATES`` to follow reloads.
+    if name == "TIER1_STATES":
+        return list((_index or _ensure_loaded()).tier1_list)
+    if name == "TIER2_STATES":
+        return list((_index or _ensure_loaded()).tier2_list)
+    if name == "REGISTRY":
+        return (_index or _ensure_loaded()).registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_state(abbreviation: str) -> Optional[StateCoverage]:
     """Return StateCoverage for a given abbreviation, or None."""
-    return ALL_STATES.get(abbreviation.upper())
+    index = _index or _ensure_loaded()
+    return index.states.get(index.keys.get(abbreviation) or abbreviation.upper())
 
 
 def is_tier1(abbreviation: str) -> bool:
-    return abbreviation.upper() in TIER1_STATES
+    index = _index or _ensure_loaded()
+    return (index.keys.get(abbreviation) or abbreviation.upper()) in index.tier1
 
 
 def tier_label(abbreviation: str) -> str:
     """Human-readable tier label."""
-    if is_tier1(abbreviation):
-        return "Supported (Tier 1)"
-    return "Guidance-only (Tier 2)"
+    index = _index or _ensure_loaded()
+    return index.labels.get(index.keys.get(abbreviation) or abbreviation.upper(), TIER2_LABEL)
+
+
+def get_state_fragments(abbreviation: str) -> Optional[StateFragments]:
+    """Precomputed export text for a state, or None for an unknown abbreviation."""
+    index = _index or _ensure_loaded()
+    return index.fragments.get(index.keys.get(abbreviation) or abbreviation.upper())
@@ -0,0 +1,280 @@
+"""
+Bulk evidence import for ClaimPilot v2.4.0.
+
+Imports a single ZIP of evidence files, optionally with a ``manifest.csv``
+at the archive root supplying labels, descriptions and dates:
+
+    file_name,label,description,date
+    receipt-01.jpg,Deposit receipt,Paid by card,2025-03-02
+
+The archive is read member by member from the uploaded file object; it is
+never extracted to disk or loaded whole. Each member is streamed in chunks
+through SHA-256 with a hard size cap (declared sizes in the ZIP header are
+not trusted), classified by extension *and* magic bytes, and turned into an
+evidence record. Records are returned together so the caller can add them
+in one batch.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import lzma
+import os
+import posixpath
+import uuid
+import zipfile
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from config.settings import (
+    BULK_IMPORT_MAX_FILE_BYTES,
+    BULK_IMPORT_MAX_FILES,
+    BULK_IMPORT_MAX_RATIO,
+)
+
+MANIFEST_NAME = "manifest.csv"
+MANIFEST_COLUMNS = ("file_name", "label", "description", "date")
+
+_CHUNK = 64 * 1024
+
+# What import_archive() raises for an upload it cannot open as a ZIP
+# (ValueError covers a central directory entry with an undecodable name).
+ARCHIVE_ERRORS = (zipfile.BadZipFile, NotImplementedError, ValueError)
+
+# What reading one member of an opened archive raises when the member's
+# headers or data are damaged: ValueError covers a bad seek or file name,
+# OSError a corrupt bzip2 stream, LZMAError a corrupt LZMA one.
+_DAMAGED_ERRORS = (zipfile.BadZipFile, zlib.error, lzma.LZMAError, EOFError, OSError, RuntimeError, ValueError)
+
+# Extension -> (MIME type, accepted leading bytes; empty means no check)
+_FILE_TYPES: Dict[str, Tuple[str, Tuple[bytes, ...]]] = {
+    ".pdf": ("application/pdf", (b"%PDF-",)),
+    ".png": ("image/png", (b"\x89PNG\r\n\x1a\n",)),
+    ".jpg": ("image/jpeg", (b"\xff\xd8\xff",)),
+    ".jpeg": ("image/jpeg", (b"\xff\xd8\xff",)),
+    ".docx": (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        (b"PK\x03\x04",),
+    ),
+    ".doc": ("application/msword", (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",)),
+    ".txt": ("text/plain", ()),
+}
+SUPPORTED_EXTENSIONS = frozenset(_FILE_TYPES)
+
+_MANIFEST_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d.%m.%Y", "%Y/%m/%d")
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+@dataclass
+class BulkImportResult:
+    """Records created from an archive, plus what was skipped and why."""
+
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    contents: Dict[str, bytes] = field(default_factory=dict)
+    skipped: List[Tuple[str, str]] = field(default_factory=list)  # (member name, reason)
+    manifest_rows: int = 0
+
+
+def classify(file_name: str, head: bytes) -> Optional[str]:
+    """
+    Return the MIME type for a member, or None if it is unsupported or its
+    leading bytes contradict its extension.
+    """
+    entry = _FILE_TYPES.get(os.path.splitext(file_name)[1].lower())
+    if entry is None:
+        return None
+    mime, magics = entry
+    if magics and not head.startswith(magics):
+        return None
+    return mime
+
+
+def parse_manifest_date(value: str) -> str:
+    """Normalise a manifest date to ISO-8601, or "" if unrecognised."""
+    value = (value or "").strip()
+    for fmt in _MANIFEST_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).isoformat()
+        except ValueError:
+            continue
+    return ""
+
+
+def read_manifest(fh: IO[bytes]) -> Dict[str, Dict[str, str]]:
+    """Parse ``manifest.csv`` into ``{file_name: row}``; unknown columns are ignored."""
+    text = io.TextIOWrapper(fh, encoding="utf-8-sig", errors="replace", newline="")
+    rows: Dict[str, Dict[str, str]] = {}
+    for row in csv.DictReader(text):
+        normalised = {
+            (key or "").strip().lower(): (value or "").strip()
+            for key, value in row.items()
+            if isinstance(value, str)
+        }
+        name = normalised.get("file_name", "")
+        if name:
+            rows[posixpath.basename(name.replace("\\", "/"))] = {
+                column: normalised.get(column, "") for column in MANIFEST_COLUMNS
+            }
+    return rows
+
+
+def _is_skippable(info: zipfile.ZipInfo) -> bool:
+    """Directories, nameless entries and OS metadata (``__MACOSX/``, dotfiles) are ignored silently."""
+    if not info.filename or info.is_dir():
+        return True
+    name = info.filename.replace("\\", "/")
+    return name.startswith("__MACOSX/") or posixpath.basename(name).startswith(".")
+
+
+def _read_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> Tuple[Optional[bytes], str]:
+    """
+    Stream one member through SHA-256, stopping at the size cap.
+    Returns ``(content, sha256)``; content is None if the cap was exceeded.
+    """
+    digest = hashlib.sha256()
+    buf = bytearray()
+    with zf.open(info) as fh:
+        while True:
+            chunk = fh.read(_CHUNK)
+            if not chunk:
+                break
+            if len(buf) + len(chunk) > BULK_IMPORT_MAX_FILE_BYTES:
+                return None, ""
+            digest.update(chunk)
+            buf += chunk
+    return bytes(buf), digest.hexdigest()
+
+
+def import_archive(
+    archive: IO[bytes],
+    existing_names: Optional[Set[str]] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> BulkImportResult:
+    """
+    Build evidence records from a ZIP archive.
+
+    ``archive`` is any seekable binary file object (an upload, an open
+    file). Files whose names are in ``existing_names``, repeats within the
+    archive and byte-identical copies are skipped. ``progress`` is called
+    as ``progress(done, total, member_name)`` after each member.
+
+    A damaged, oversized or unreadable ``manifest.csv`` is recorded in
+    ``skipped`` and the files are imported without it.
+
+    Raises ``zipfile.BadZipFile`` if ``archive`` is not a ZIP, and another
+    of ``ARCHIVE_ERRORS`` if its directory is damaged or needs a ZIP
+    feature Python lacks.
+    """
+    result = BulkImportResult()
+    names = set(existing_names or ())
+    seen_hashes: Set[str] = set()
+
+    with zipfile.ZipFile(archive) as zf:
+        members = [info for info in zf.infolist() if not _is_skippable(info)]
+        manifest: Dict[str, Dict[str, str]] = {}
+        for info in members:
+            if info.filename.lower() == MANIFEST_NAME:
+                manifest, reason = _read_manifest_member(zf, info)
+                if reason:
+                    result.skipped.append((info.filename, reason))
+                result.manifest_rows = len(manifest)
+        members = [info for info in members if info.filename.lower() != MANIFEST_NAME]
+
+        total = len(members)
+        for done, info in enumerate(members, 1):
+            reason = _import_member(zf, info, manifest, names, seen_hashes, result)
+            if reason:
+                result.skipped.append((info.filename, reason))
+            if progress is not None:
+                progress(done, total, info.filename)
+
+    return result
+
+
+def _limit_reason(info: zipfile.ZipInfo, what: str) -> str:
+    """Why a member must not be read at all (size, ratio, encryption), or ""."""
+    if info.file_size > BULK_IMPORT_MAX_FILE_BYTES:
+        return f"{what} is too large"
+    if info.compress_size and info.file_size / info.compress_size > BULK_IMPORT_MAX_RATIO:
+        return f"{what} is compressed suspiciously well"
+    if info.flag_bits & 0x1:
+        return f"{what} is password-protected"
+    return ""
+
+
+def _read_manifest_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> Tuple[Dict[str, Dict[str, str]], str]:
+    """
+    Read the manifest under the same limits as any member. Returns
+    ``(rows, "")``, or ``({}, reason)`` if the files must be imported without it.
+    """
+    reason = _limit_reason(info, "manifest")
+    if reason:
+        return {}, reason
+    try:
+        content, _ = _read_member(zf, info)
+        if content is None:
+            return {}, "manifest is too large"
+        return read_manifest(io.BytesIO(content)), ""
+    except NotImplementedError:  # a RuntimeError, so caught first
+        return {}, "manifest uses an unsupported compression method"
+    except (*_DAMAGED_ERRORS, csv.Error):
+        return {}, "manifest is damaged"
+
+
+def _import_member(
+    zf: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    manifest: Dict[str, Dict[str, str]],
+    names: Set[str],
+    seen_hashes: Set[str],
+    result: BulkImportResult,
+) -> str:
+    """Import one member into ``result``; returns a skip reason or ""."""
+    file_name = posixpath.basename(info.filename.replace("\\", "/"))
+    if len(result.items) >= BULK_IMPORT_MAX_FILES:
+        return f"archive holds more than {BULK_IMPORT_MAX_FILES} files"
+    if os.path.splitext(file_name)[1].lower() not in SUPPORTED_EXTENSIONS:
+        return "unsupported file type"
+    if file_name in names:
+        return "a file with this name is already in your evidence"
+    reason = _limit_reason(info, "file")
+    if reason:
+        return reason
+
+    try:
+        content, sha256 = _read_member(zf, info)
+    except NotImplementedError:  # a RuntimeError, so caught first
+        return "file uses an unsupported compression method"
+    except _DAMAGED_ERRORS:
+        return "file is damaged"
+    if content is None:
+        return "file is too large"
+    if sha256 in seen_hashes:
+        return "identical to another file in the archive"
+    file_type = classify(file_name, content[:16])
+    if file_type is None:
+        return "contents do not match the file extension"
+
+    row = manifest.get(file_name, {})
+    item = {
+        "item_id": str(uuid.uuid4()),
+        "label": row.get("label") or file_name.rsplit(".", 1)[0],
+        "file_name": file_name,
+        "file_type": file_type,
+        "file_size_bytes": len(content),
+        "description": row.get("description", ""),
+        "date_added": datetime.now().isoformat(),
+        "document_date": parse_manifest_date(row.get("date", "")),
+    }
+    names.add(file_name)
+    seen_hashes.add(sha256)
+    result.items.append(item)
+    result.contents[item["item_id"]] = content
+    return ""
@@ -0,0 +1,61 @@
+"""
+Shared process-level caches for ClaimPilot v2.4.0.
+
+Processing stages cache their results by content hash so Streamlit reruns
+and repeated exports only pay for new uploads. Caches are shared across
+sessions, hold no user-identifying keys, and are bounded by total size.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Sized, TypeVar
+
+V = TypeVar("V", bound=Sized)
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest used to key per-content caches."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class SizedLRUCache(Generic[V]):
+    """LRU cache bounded by the summed ``len()`` of its values. Thread-safe."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._size = 0
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        if len(value) > self._max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self._max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
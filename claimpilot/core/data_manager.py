@@ -4,22 +4,56 @@ Data manager for ClaimPilot v2.4.0.
 Handles storage, retrieval, and deletion of user data.
 Uses Streamlit session_state as primary store (no server-side persistence
 in this version).
+
+Evidence is held as immutable ``EvidenceItem`` records and the intake as
+a read-only mapping, so accessors return the stored objects directly
+instead of copying them on every call. Records are appended to a list and
+read through a tuple snapshot that is rebuilt once after each batch of
+additions, so adding n items costs O(n), not O(n^2).
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import streamlit as st
 
+from core.evidence_view import EvidenceCatalog
+from core.exhibit_order import ORDER_CHRONOLOGICAL, ORDER_UPLOAD, ExhibitOrder
 from core.logger import log_info
+from core.perceptual_hash import NearDuplicateIndex
+from core.pii_guard import build_session_engine, set_session_engine
+from core.pii_scanner import PiiScanReport
+from core.search_index import SearchIndex
+from core.venue import Venue
+from models.evidence import EvidenceItem
+
+# Intake fields covered by evidence search, with display titles
+_INTAKE_SEARCH_FIELDS = {
+    "description": "Case description",
+    "resolution_attempted": "Resolution attempts",
+}
 
 # Keys managed by ClaimPilot in session_state
 _SESSION_KEYS = [
     "intake_data",
     "evidence_items",
+    "evidence_items_snapshot",
+    "evidence_files",
+    "evidence_derivatives",
+    "evidence_derivative_failures",
+    "evidence_text",
+    "evidence_pii_reports",
+    "evidence_phash_index",
+    "exhibit_order",
+    "exhibit_ordering",
+    "evidence_catalog",
+    "search_index",
+    "pii_redactor",
     "generated_docs",
     "selected_state",
+    "state_preselect",
     "claim_type",
     "export_cache",
     "chat_history",
@@ -29,10 +63,23 @@ _SESSION_KEYS = [
 def init_session() -> None:
     """Ensure all session keys exist with safe defaults."""
     defaults: Dict[str, Any] = {
-        "intake_data": {},
+        "intake_data": MappingProxyType({}),
         "evidence_items": [],
+        "evidence_items_snapshot": (),
+        "evidence_files": {},
+        "evidence_derivatives": {},
+        "evidence_derivative_failures": set(),
+        "evidence_text": {},
+        "evidence_pii_reports": {},
+        "evidence_phash_index": NearDuplicateIndex(),
+        "exhibit_order": ExhibitOrder(),
+        "exhibit_ordering": ORDER_UPLOAD,
+        "evidence_catalog": EvidenceCatalog(),
+        "search_index": SearchIndex(),
+        "pii_redactor": None,
         "generated_docs": {},
         "selected_state": None,
+        "state_preselect": None,
         "claim_type": None,
         "export_cache": None,
         "chat_history": [],
@@ -40,26 +87,164 @@ def init_session() -> None:
     for key, default in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = default
+    # Each rerun starts in a fresh context: re-install this session's
+    # redaction engine so logs and error messages from the run use it.
+    set_session_engine(st.session_state["pii_redactor"])
+
+
+def get_intake_data() -> Mapping[str, Any]:
+    """Return a read-only view of the intake; use ``set_intake_data`` to change it."""
+    init_session()
+    return st.session_state["intake_data"]
+
+
+def set_intake_data(data: Mapping[str, Any]) -> None:
+    init_session()
+    st.session_state["intake_data"] = MappingProxyType(dict(data))
+    engine = build_session_engine(data)
+    st.session_state["pii_redactor"] = engine
+    set_session_engine(engine)
+    index = st.session_state["search_index"]
+    for field, title in _INTAKE_SEARCH_FIELDS.items():
+        index.add_document(f"intake:{field}", data.get(field) or "", title)
+
+
+def get_evidence_items() -> Tuple[EvidenceItem, ...]:
+    init_session()
+    snapshot = st.session_state["evidence_items_snapshot"]
+    if snapshot is None:
+        snapshot = st.session_state["evidence_items_snapshot"] = tuple(st.session_state["evidence_items"])
+    return snapshot
+
+
+def add_evidence_item(item: Mapping[str, Any], content: Optional[bytes] = None) -> None:
+    """
+    Append an evidence record. Uploaded file content, when given, is kept
+    in a separate store keyed by ``item_id`` so metadata stays lightweight.
+    """
+    add_evidence_items([(item, content)])
+
+
+def add_evidence_items(records: Sequence[Tuple[Mapping[str, Any], Optional[bytes]]]) -> None:
+    """Append many ``(item, content)`` records in one batch (bulk import)."""
+    init_session()
+    order = st.session_state["exhibit_order"]
+    catalog = st.session_state["evidence_catalog"]
+    files = st.session_state["evidence_files"]
+    added = []
+    for item, content in records:
+        record = EvidenceItem.from_dict(item)
+        added.append(record)
+        order.add(record)
+        catalog.add(record)
+        if content is not None:
+            files[record.item_id] = content
+        _index_evidence(record)
+    st.session_state["evidence_items"].extend(added)
+    st.session_state["evidence_items_snapshot"] = None
+    if len(added) > 1:
+        log_info("Added %d evidence items in one batch", len(added))
+
+
+def get_exhibit_ordering() -> str:
+    init_session()
+    return st.session_state.get("exhibit_ordering", ORDER_UPLOAD)
+
+
+def set_exhibit_ordering(order: str) -> None:
+    init_session()
+    st.session_state["exhibit_ordering"] = order
+
+
+def get_ordered_evidence_items() -> Sequence[EvidenceItem]:
+    """Return evidence items in the user's chosen exhibit order."""
+    items = get_evidence_items()
+    if get_exhibit_ordering() == ORDER_CHRONOLOGICAL:
+        return st.session_state["exhibit_order"].apply(items)
+    return items
+
+
+def get_evidence_files() -> Mapping[str, bytes]:
+    """Return uploaded evidence content keyed by ``item_id``."""
+    init_session()
+    return MappingProxyType(st.session_state["evidence_files"])
 
 
-def get_intake_data() -> Dict[str, Any]:
+def get_evidence_derivatives() -> Mapping[str, bytes]:
+    """Return optimised evidence derivatives keyed by ``item_id``."""
     init_session()
-    return dict(st.session_state.get("intake_data", {}))
+    return MappingProxyType(st.session_state["evidence_derivatives"])
 
 
-def set_intake_data(data: Dict[str, Any]) -> None:
+def set_evidence_derivative(item_id: str, content: bytes) -> None:
+    """Store an optimised derivative. The original upload is never replaced."""
     init_session()
-    st.session_state["intake_data"] = dict(data)
+    st.session_state["evidence_derivatives"][item_id] = content
 
 
-def get_evidence_items() -> List[Dict[str, Any]]:
+def get_evidence_derivative_failures() -> AbstractSet[str]:
+    """Return ids of images the optimiser could not decode; they are not retried."""
     init_session()
-    return list(st.session_state.get("evidence_items", []))
+    return st.session_state["evidence_derivative_failures"]
 
 
-def add_evidence_item(item: Dict[str, Any]) -> None:
+def add_evidence_derivative_failure(item_id: str) -> None:
     init_session()
-    st.session_state["evidence_items"].append(item)
+    st.session_state["evidence_derivative_failures"].add(item_id)
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Return the session's perceptual-hash index over image evidence."""
+    init_session()
+    return st.session_state["evidence_phash_index"]
+
+
+def get_evidence_text() -> Mapping[str, str]:
+    """Return extracted evidence text keyed by ``item_id``."""
+    init_session()
+    return MappingProxyType(st.session_state["evidence_text"])
+
+
+def set_evidence_text(item_id: str, text: str) -> None:
+    init_session()
+    st.session_state["evidence_text"][item_id] = text
+    item = st.session_state["evidence_catalog"].get(item_id)
+    if item is not None:
+        _index_evidence(item)
+
+
+def get_evidence_pii_reports() -> Mapping[str, PiiScanReport]:
+    """Return PII scan reports keyed by ``item_id``."""
+    init_session()
+    return MappingProxyType(st.session_state["evidence_pii_reports"])
+
+
+def set_evidence_pii_report(report: PiiScanReport) -> None:
+    init_session()
+    st.session_state["evidence_pii_reports"][report.item_id] = report
+
+
+def get_evidence_catalog() -> EvidenceCatalog:
+    """Return the session's sorted, filterable evidence listing."""
+    init_session()
+    return st.session_state["evidence_catalog"]
+
+
+def get_search_index() -> SearchIndex:
+    """Return the session's full-text index over evidence and intake narrative."""
+    init_session()
+    return st.session_state["search_index"]
+
+
+def _index_evidence(item: Mapping[str, Any]) -> None:
+    """(Re)index one evidence item's label, description and extracted text."""
+    text = "\n".join(filter(None, (
+        item.get("label", ""),
+        item.get("file_name", ""),
+        item.get("description", ""),
+        st.session_state["evidence_text"].get(item["item_id"], ""),
+    )))
+    st.session_state["search_index"].add_document(f"evidence:{item['item_id']}", text, item.get("label", ""))
 
 
 def get_selected_state() -> Optional[str]:
@@ -72,6 +257,17 @@ def set_selected_state(abbr: Optional[str]) -> None:
     st.session_state["selected_state"] = abbr
 
 
+def request_state_preselect(venue: Venue) -> None:
+    """Have the state selector pick ``venue.state`` on the next rerun."""
+    init_session()
+    st.session_state["state_preselect"] = venue
+
+
+def pop_state_preselect() -> Optional[Venue]:
+    init_session()
+    return st.session_state.pop("state_preselect", None)
+
+
 def get_generated_docs() -> Dict[str, Any]:
     init_session()
     return dict(st.session_state.get("generated_docs", {}))
@@ -7,13 +7,14 @@ Provides safe fallback UI when any tab or component crashes.
 from __future__ import annotations
 
 import functools
+import logging
 import traceback
 from typing import Any, Callable
 
 import streamlit as st
 
 from config.settings import SUPPORT_EMAIL
-from core.logger import _is_production, log_error, safe_error_message
+from core.logger import _is_production, event_fingerprint, log_event, safe_error_message
 
 
 def safe_render(tab_name: str) -> Callable:
@@ -28,7 +29,19 @@ def safe_render(tab_name: str) -> Callable:
             try:
                 return func(*args, **kwargs)
             except Exception as exc:
-                log_error("Error in tab '%s': %s", tab_name, safe_error_message(exc))
+                # One fingerprint per (exception type, tab): a failure hit on
+                # every rerun is logged a few times, then summarised.
+                exc_type = type(exc).__name__
+                log_event(
+                    logging.ERROR,
+                    "render_error",
+                    event_fingerprint(exc_type, tab_name),
+                    "Error in tab '%s': %s",
+                    tab_name,
+                    safe_error_message(exc),
+                    tab=tab_name,
+                    exc_type=exc_type,
+                )
                 _render_fallback(tab_name, exc)
 
         return wrapper
@@ -0,0 +1,183 @@
+"""
+Paginated evidence listing for ClaimPilot v2.4.0.
+
+The Evidence tab shows one page of exhibits at a time. ``EvidenceCatalog``
+keeps a sorted key list per sort order, maintained with ``bisect`` as items
+are added, so sorting never happens on a rerun. Filtered id lists are
+cached per (filters, sort) and dropped when evidence changes; paging
+through a result set then costs one slice per rerun.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from core.exhibit_order import chronological_key
+from core.image_optimizer import is_image
+
+SORT_UPLOAD = "upload"
+SORT_LABEL = "label"
+SORT_DATE = "date"
+SORT_SIZE = "size"
+EVIDENCE_SORTS = (SORT_UPLOAD, SORT_LABEL, SORT_DATE, SORT_SIZE)
+
+KIND_IMAGE = "image"
+KIND_PDF = "pdf"
+KIND_DOCUMENT = "document"
+KIND_TEXT = "text"
+KIND_OTHER = "other"
+EVIDENCE_KINDS = (KIND_IMAGE, KIND_PDF, KIND_DOCUMENT, KIND_TEXT, KIND_OTHER)
+
+_DOCUMENT_EXTENSIONS = frozenset({".doc", ".docx"})
+
+
+def evidence_kind(item: Mapping[str, Any]) -> str:
+    """Coarse file category used by the type filter."""
+    file_name = item.get("file_name", "")
+    file_type = item.get("file_type", "")
+    ext = os.path.splitext(file_name)[1].lower()
+    if is_image(file_name, file_type):
+        return KIND_IMAGE
+    if ext == ".pdf" or file_type == "application/pdf":
+        return KIND_PDF
+    if ext in _DOCUMENT_EXTENSIONS or "wordprocessingml" in file_type or file_type == "application/msword":
+        return KIND_DOCUMENT
+    if ext == ".txt" or file_type == "text/plain":
+        return KIND_TEXT
+    return KIND_OTHER
+
+
+@dataclass(frozen=True)
+class EvidenceFilter:
+    """Server-side filter; empty fields match everything."""
+
+    kind: str = ""
+    label: str = ""
+    date_from: str = ""  # ISO date, inclusive
+    date_to: str = ""  # ISO date, inclusive
+
+    @property
+    def active(self) -> bool:
+        return bool(self.kind or self.label.strip() or self.date_from or self.date_to)
+
+
+@dataclass(frozen=True)
+class EvidencePage:
+    """One page of a filtered, sorted evidence listing."""
+
+    items: Tuple[Mapping[str, Any], ...]
+    total: int
+    page: int  # 0-based, clamped to the last page
+    page_count: int
+
+
+class _Entry:
+    """Per-item values precomputed at insert time."""
+
+    __slots__ = ("item", "kind", "label", "date")
+
+    def __init__(self, item: Mapping[str, Any]) -> None:
+        self.item = item
+        self.kind = evidence_kind(item)
+        self.label = (item.get("label") or "").casefold()
+        self.date = chronological_key(item)[:10]
+
+
+def _sort_key(sort: str, entry: _Entry, seq: int) -> tuple:
+    if sort == SORT_LABEL:
+        return (entry.label, seq)
+    if sort == SORT_DATE:
+        return (entry.date, seq)
+    if sort == SORT_SIZE:
+        return (entry.item.get("file_size_bytes") or 0, seq)
+    return (seq,)
+
+
+class EvidenceCatalog:
+    """Evidence records with incrementally maintained sort orders."""
+
+    def __init__(self, items: Any = ()) -> None:
+        self._entries: Dict[str, _Entry] = {}
+        self._orders: Dict[str, List[Tuple[tuple, str]]] = {sort: [] for sort in EVIDENCE_SORTS}
+        self._filtered: Dict[Tuple[EvidenceFilter, str], List[str]] = {}
+        self._seq = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, item_id: str) -> Optional[Mapping[str, Any]]:
+        entry = self._entries.get(item_id)
+        return entry.item if entry is not None else None
+
+    def add(self, item: Mapping[str, Any]) -> None:
+        entry = _Entry(item)
+        self._entries[item["item_id"]] = entry
+        for sort, keys in self._orders.items():
+            bisect.insort(keys, (_sort_key(sort, entry, self._seq), item["item_id"]))
+        self._seq += 1
+        self._filtered.clear()
+
+    def _matching_ids(self, flt: EvidenceFilter, sort: str) -> List[str]:
+        """Ids in ``sort`` order passing ``flt``; cached until the next add."""
+        cache_key = (flt, sort)
+        ids = self._filtered.get(cache_key)
+        if ids is not None:
+            return ids
+        needle = flt.label.strip().casefold()
+        ids = []
+        for _, item_id in self._orders[sort]:
+            entry = self._entries[item_id]
+            if flt.kind and entry.kind != flt.kind:
+                continue
+            if needle and needle not in entry.label:
+                continue
+            if flt.date_from and entry.date < flt.date_from:
+                continue
+            if flt.date_to and entry.date > flt.date_to:
+                continue
+            ids.append(item_id)
+        self._filtered[cache_key] = ids
+        return ids
+
+    def page(
+        self,
+        page: int,
+        page_size: int,
+        sort: str = SORT_UPLOAD,
+        descending: bool = False,
+        flt: Optional[EvidenceFilter] = None,
+    ) -> EvidencePage:
+        """Return page ``page`` (0-based) of the filtered, sorted listing."""
+        if flt is not None and flt.active:
+            ids = self._matching_ids(flt, sort)
+            total = len(ids)
+        else:
+            ids = None
+            total = len(self._entries)
+        page_count = max(1, math.ceil(total / page_size))
+        page = min(max(page, 0), page_count - 1)
+        start = page * page_size
+        stop = min(start + page_size, total)
+        if descending:
+            start, stop = total - stop, total - start
+
+        if ids is not None:
+            window = ids[start:stop]
+        else:
+            window = [item_id for _, item_id in self._orders[sort][start:stop]]
+        if descending:
+            window.reverse()
+        return EvidencePage(
+            items=tuple(self._entries[item_id].item for item_id in window),
+            total=total,
+            page=page,
+            page_count=page_count,
+        )
@@ -0,0 +1,99 @@
+"""
+Exhibit ordering for ClaimPilot v2.4.0.
+
+Exhibits default to upload order. The chronological order sorts by the
+date the evidence was created (``document_date``), falling back to
+``date_added`` for files that carry no date of their own. The order is
+sorted once and then kept up to date with ``bisect`` as items arrive.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+ORDER_UPLOAD = "upload"
+ORDER_CHRONOLOGICAL = "chronological"
+EXHIBIT_ORDERS = (ORDER_UPLOAD, ORDER_CHRONOLOGICAL)
+
+
+def chronological_key(item: Mapping[str, Any]) -> str:
+    """Sort key for an evidence record: creation date, else upload date."""
+    return item.get("document_date") or item.get("date_added") or ""
+
+
+class ExhibitOrder:
+    """Incrementally maintained chronological order of evidence item ids."""
+
+    def __init__(self, items: Iterable[Mapping[str, Any]] = ()) -> None:
+        # Ties keep upload order via the sequence number.
+        self._keys: List[Tuple[str, int, str]] = sorted(
+            (chronological_key(item), seq, item["item_id"])
+            for seq, item in enumerate(items)
+        )
+        self._seq = len(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, item: Mapping[str, Any]) -> None:
+        bisect.insort(self._keys, (chronological_key(item), self._seq, item["item_id"]))
+        self._seq += 1
+
+    def item_ids(self) -> List[str]:
+        return [item_id for _, _, item_id in self._keys]
+
+    def apply(self, items: Iterable[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+        """Return ``items`` in chronological order; unknown ids go last."""
+        by_id: Dict[str, Mapping[str, Any]] = {item["item_id"]: item for item in items}
+        ordered = [by_id.pop(item_id) for item_id in self.item_ids() if item_id in by_id]
+        ordered.extend(by_id.values())
+        return ordered
+
+
+def order_evidence(
+    items: Iterable[Mapping[str, Any]], order: str = ORDER_UPLOAD
+) -> List[Mapping[str, Any]]:
+    """One-shot ordering for callers without a maintained index."""
+    items = list(items)
+    if order == ORDER_CHRONOLOGICAL:
+        return ExhibitOrder(items).apply(items)
+    return items
+
+
+def exhibit_label(position: int) -> str:
+    """Exhibit designation for a 1-based position: A-Z, then numbers."""
+    return f"Exhibit {chr(64 + position)}" if position <= 26 else f"Exhibit {position}"
+
+
+def page_ranges(items: Sequence[Mapping[str, Any]]) -> List[Optional[Tuple[int, int]]]:
+    """
+    Assign cumulative, Bates-style page ranges to exhibits in order.
+    Items without a known ``page_count`` get None and do not consume numbers.
+    """
+    ranges: List[Optional[Tuple[int, int]]] = []
+    next_page = 1
+    for item in items:
+        count = item.get("page_count")
+        if isinstance(count, int) and count > 0:
+            ranges.append((next_page, next_page + count - 1))
+            next_page += count
+        else:
+            ranges.append(None)
+    return ranges
+
+
+def format_page_range(page_range: Optional[Tuple[int, int]]) -> str:
+    """Render a page range for display, e.g. ``"4-9"`` or ``"n/a"``."""
+    if page_range is None:
+        return "n/a"
+    first, last = page_range
+    return str(first) if first == last else f"{first}-{last}"
+
+
+def total_pages(items: Iterable[Mapping[str, Any]]) -> Optional[int]:
+    """Sum of known page counts, or None when no exhibit has one."""
+    counts = [c for c in (item.get("page_count") for item in items) if isinstance(c, int)]
+    return sum(counts) if counts else None
@@ -0,0 +1,183 @@
+"""
+Evidence image optimisation for ClaimPilot v2.4.0.
+
+Phone photos are routinely 4-12 MB. This stage fits each image to the
+printable exhibit area at ``EXHIBIT_IMAGE_DPI`` and recompresses it as
+JPEG. The original upload is never modified; callers store the returned
+derivative alongside it.
+
+Work is spread over a thread pool: Pillow releases the GIL while decoding,
+resampling and encoding, so threads scale across cores without having to
+pickle image bytes into worker processes. Results are cached by content
+hash so re-running the stage (every Streamlit rerun, every binder build)
+only pays for new uploads.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from config.settings import (
+    EXHIBIT_IMAGE_DPI,
+    EXHIBIT_IMAGE_JPEG_QUALITY,
+    EXHIBIT_IMAGE_MAX_INCHES,
+)
+from core.cache import SizedLRUCache, content_hash
+
+IMAGE_MIME_TYPES = frozenset({"image/jpeg", "image/jpg", "image/png"})
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
+
+# Upper bound on cached derivative bytes held per process.
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_CacheKey = Tuple[str, int, Tuple[float, float], int]
+
+
+@dataclass(frozen=True)
+class OptimizedImage:
+    """Result of optimising one image."""
+
+    item_id: str
+    content: bytes  # Derivative; equals the original when no saving was possible
+    original_size: int
+    optimized_size: int
+    elapsed_ms: float
+    cached: bool = False
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_size - self.optimized_size
+
+
+_cache: SizedLRUCache[bytes] = SizedLRUCache(_CACHE_MAX_BYTES)
+
+
+def is_image(file_name: str, file_type: str = "") -> bool:
+    """Return True for evidence the optimiser can handle."""
+    if file_type.lower() in IMAGE_MIME_TYPES:
+        return True
+    return os.path.splitext(file_name)[1].lower() in IMAGE_EXTENSIONS
+
+
+def max_pixels(
+    dpi: int = EXHIBIT_IMAGE_DPI,
+    max_inches: Tuple[float, float] = EXHIBIT_IMAGE_MAX_INCHES,
+) -> Tuple[int, int]:
+    """Pixel bounds of the printable exhibit area at ``dpi``."""
+    return int(max_inches[0] * dpi), int(max_inches[1] * dpi)
+
+
+def downscale_image(
+    data: bytes,
+    dpi: int = EXHIBIT_IMAGE_DPI,
+    max_inches: Tuple[float, float] = EXHIBIT_IMAGE_MAX_INCHES,
+) -> Image.Image:
+    """
+    Decode ``data`` and fit it to the print area, honouring EXIF rotation.
+    Returns an RGB image. Raises ``PIL.UnidentifiedImageError`` on bad input.
+    """
+    bound = max_pixels(dpi, max_inches)
+    with Image.open(io.BytesIO(data)) as img:
+        # Let the JPEG decoder skip DCT scales we would throw away anyway.
+        img.draft("RGB", bound)
+        img = ImageOps.exif_transpose(img)
+        # Orientation decides which side gets the longer bound.
+        if img.width > img.height:
+            bound = (bound[1], bound[0])
+        if img.mode in ("RGBA", "LA", "P"):
+            rgba = img.convert("RGBA")
+            flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+            flattened.paste(rgba, mask=rgba.getchannel("A"))
+            img = flattened
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        img.thumbnail(bound, Image.Resampling.LANCZOS)
+        img.load()
+        return img
+
+
+def optimize_image_bytes(
+    data: bytes,
+    dpi: int = EXHIBIT_IMAGE_DPI,
+    max_inches: Tuple[float, float] = EXHIBIT_IMAGE_MAX_INCHES,
+    quality: int = EXHIBIT_IMAGE_JPEG_QUALITY,
+) -> bytes:
+    """
+    Return a print-resolution JPEG of ``data``.
+    If recompression would not make the file smaller, ``data`` is returned.
+    """
+    img = downscale_image(data, dpi, max_inches)
+    out = io.BytesIO()
+    img.save(out, format="JPEG", quality=quality, optimize=True, progressive=True)
+    result = out.getvalue()
+    return result if len(result) < len(data) else data
+
+
+def optimize_image(
+    item_id: str,
+    data: bytes,
+    dpi: int = EXHIBIT_IMAGE_DPI,
+    max_inches: Tuple[float, float] = EXHIBIT_IMAGE_MAX_INCHES,
+    quality: int = EXHIBIT_IMAGE_JPEG_QUALITY,
+) -> OptimizedImage:
+    """Optimise a single image, using the content-hash cache when possible."""
+    start = time.perf_counter()
+    key: _CacheKey = (content_hash(data), dpi, tuple(max_inches), quality)
+    cached = _cache.get(key)
+    if cached is not None:
+        content, hit = cached, True
+    else:
+        content, hit = optimize_image_bytes(data, dpi, max_inches, quality), False
+        _cache.put(key, content)
+    return OptimizedImage(
+        item_id=item_id,
+        content=content,
+        original_size=len(data),
+        optimized_size=len(content),
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+        cached=hit,
+    )
+
+
+def optimize_images(
+    images: Mapping[str, bytes],
+    max_workers: Optional[int] = None,
+    dpi: int = EXHIBIT_IMAGE_DPI,
+    max_inches: Tuple[float, float] = EXHIBIT_IMAGE_MAX_INCHES,
+    quality: int = EXHIBIT_IMAGE_JPEG_QUALITY,
+) -> Dict[str, OptimizedImage]:
+    """
+    Optimise many images in parallel.
+
+    ``images`` maps ``item_id`` to original bytes. Items that cannot be
+    decoded are omitted from the result rather than failing the batch.
+    """
+    if not images:
+        return {}
+    workers = max_workers or min(len(images), os.cpu_count() or 1)
+    results: Dict[str, OptimizedImage] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            item_id: pool.submit(optimize_image, item_id, data, dpi, max_inches, quality)
+            for item_id, data in images.items()
+        }
+        for item_id, future in futures.items():
+            try:
+                results[item_id] = future.result()
+            except (OSError, ValueError, Image.DecompressionBombError):
+                continue
+    return results
+
+
+def clear_cache() -> None:
+    """Drop all cached derivatives."""
+    _cache.clear()
@@ -8,87 +8,490 @@ In production mode (CLAIMPILOT_PRODUCTION=true, the default):
 In development mode (CLAIMPILOT_PRODUCTION=false):
   - Debug-level logging is enabled.
   - PII fields are still redacted by default; use log_dev_unsafe() for raw values.
+
+The mode is read from the environment once at import; call reload_config()
+after changing it.
+
+In production, records are handed to a bounded in-memory queue and written
+by a background listener thread, so a slow stderr never blocks a render.
+Redaction and formatting happen on that thread. If the queue is full the
+record is dropped and counted, as is a record whose redaction or output
+fails (see log_pipeline_stats()). Development mode logs synchronously.
+
+Output is one JSON object per line in production and plain text in
+development (override with CLAIMPILOT_LOG_FORMAT=json|text). Repeated
+events are rate-limited per fingerprint (see log_event()); a background
+thread logs a summary of suppressed occurrences every LOG_EVENT_WINDOW_S.
+Info-level calls can be sampled with CLAIMPILOT_LOG_INFO_SAMPLE_RATE.
 """
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
 import logging
 import os
-import re
+import queue
+import random
 import sys
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-# PII patterns to redact
-_PII_PATTERNS = [
-    (re.compile(r"\b\d{3}-\d{2}-\d{4}\b"), "[SSN-REDACTED]"),
-    (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"), "[EMAIL-REDACTED]"),
-    (re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"), "[PHONE-REDACTED]"),
-    (re.compile(r"\b\d{5}(-\d{4})?\b"), "[ZIP-REDACTED]"),
-]
+from config.settings import (
+    LOG_EVENT_BURST,
+    LOG_EVENT_MAX_FINGERPRINTS,
+    LOG_EVENT_WINDOW_S,
+    LOG_FLUSH_TIMEOUT_S,
+    LOG_INFO_SAMPLE_RATE,
+    LOG_QUEUE_MAX_RECORDS,
+)
+from core.pii_guard import RedactionEngine, get_session_engine, redact_text
 
 _logger = logging.getLogger("claimpilot")
 
+# Marks records from log_dev_unsafe(), which the redaction filter leaves alone.
+_UNSAFE_ATTR = "claimpilot_unredacted"
 
-def _is_production() -> bool:
-    """Check production mode from environment at call time."""
+# The logging session's redaction engine, attached to queued records so the
+# listener thread redacts that session's identifiers too.
+_ENGINE_ATTR = "claimpilot_redactor"
+
+
+def _read_production_flag() -> bool:
     val = os.environ.get("CLAIMPILOT_PRODUCTION", "true").lower()
     return val in ("1", "true", "yes", "on")
 
 
+def _read_json_flag(production: bool) -> bool:
+    val = os.environ.get("CLAIMPILOT_LOG_FORMAT", "").lower()
+    return val == "json" if val in ("json", "text") else production
+
+
+def _read_sample_rate() -> float:
+    try:
+        rate = float(os.environ.get("CLAIMPILOT_LOG_INFO_SAMPLE_RATE", LOG_INFO_SAMPLE_RATE))
+    except ValueError:
+        rate = LOG_INFO_SAMPLE_RATE
+    return min(max(rate, 0.0), 1.0)
+
+
+# Configuration is read once; call reload_config() after changing the env.
+_production = _read_production_flag()
+_json_output = _read_json_flag(_production)
+_info_sample_rate = _read_sample_rate()
+
+# Structured fields carried on records by log_event().
+_EVENT_ATTRS = ("event", "fingerprint", "suppressed")
+_FIELDS_ATTR = "event_fields"
+
+
+def _is_production() -> bool:
+    """Return the cached production-mode decision."""
+    return _production
+
+
+class RedactingFilter(logging.Filter):
+    """
+    Redacts PII from a record's message and string args.
+
+    In development it is attached to the ``claimpilot`` logger itself, so
+    it runs only for records that passed the level check and before the
+    record reaches any handler (including handlers on ancestor loggers).
+    In production it sits on the listener's output handler instead.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, _UNSAFE_ATTR, False):
+            return True
+        engine = getattr(record, _ENGINE_ATTR, None)
+        if isinstance(record.msg, str):
+            record.msg = redact_text(record.msg, engine)
+        if isinstance(record.args, tuple):
+            record.args = _redact_args(record.args, engine)
+        elif isinstance(record.args, Mapping):
+            record.args = _redact_mapping(record.args, engine)
+        fields = getattr(record, _FIELDS_ATTR, None)
+        if fields:
+            setattr(record, _FIELDS_ATTR, _redact_mapping(fields, engine))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record. log_event() fields are nested under
+    ``"fields"`` so they cannot overwrite ts, level or message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for attr in _EVENT_ATTRS:
+            value = getattr(record, attr, None)
+            if value is not None:
+                entry[attr] = value
+        fields = getattr(record, _FIELDS_ATTR, None)
+        if fields:
+            entry["fields"] = fields
+        return json.dumps(entry, default=str)
+
+
+class FingerprintRateLimiter:
+    """
+    Allows ``burst`` events per fingerprint per ``window_s`` and counts the
+    rest. Tracks at most ``max_fingerprints``, forgetting the least recent;
+    a forgotten fingerprint's pending count is kept for the next drain().
+    """
+
+    def __init__(
+        self,
+        window_s: float = LOG_EVENT_WINDOW_S,
+        burst: int = LOG_EVENT_BURST,
+        max_fingerprints: int = LOG_EVENT_MAX_FINGERPRINTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_s = window_s
+        self.burst = burst
+        self.max_fingerprints = max_fingerprints
+        self._clock = clock
+        # fingerprint -> [window start, events in window, suppressed since last emit]
+        self._state: OrderedDict[str, List[float]] = OrderedDict()
+        # Pending suppressed counts of fingerprints evicted since the last drain.
+        self._evicted: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def check(self, fingerprint: str) -> Tuple[bool, int]:
+        """
+        Record one occurrence. Returns ``(emit, suppressed)``: whether to log
+        it, and how many occurrences were suppressed since the last one logged.
+        """
+        now = self._clock()
+        with self._lock:
+            state = self._state.get(fingerprint)
+            if state is None:
+                state = self._state[fingerprint] = [now, 0, 0]
+                if len(self._state) > self.max_fingerprints:
+                    evicted, old = self._state.popitem(last=False)
+                    if old[2]:
+                        self._evicted[evicted] = self._evicted.get(evicted, 0) + int(old[2])
+            else:
+                self._state.move_to_end(fingerprint)
+            if now - state[0] >= self.window_s:
+                state[0], state[1] = now, 0
+            state[1] += 1
+            if state[1] > self.burst:
+                state[2] += 1
+                return False, 0
+            suppressed, state[2] = int(state[2]), 0
+            return True, suppressed
+
+    def drain(self) -> List[Tuple[str, int]]:
+        """Return and reset pending suppressed counts."""
+        with self._lock:
+            pending = list(self._evicted.items())
+            self._evicted.clear()
+            for fp, state in self._state.items():
+                if state[2]:
+                    pending.append((fp, int(state[2])))
+                    state[2] = 0
+        return pending
+
+
+_rate_limiter = FingerprintRateLimiter()
+
+
+class _FlushMarker:
+    """Queued by flush(); the listener sets ``done`` when it reaches it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class _LogQueueListener(QueueListener):
+    """
+    A QueueListener that survives a failing filter or handler.
+
+    QueueListener lets the exception end its thread, after which nothing
+    drains the queue; here the record is counted and skipped instead.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.failed = 0
+
+    def handle(self, record: Any) -> None:
+        if isinstance(record, _FlushMarker):
+            record.done.set()
+            return
+        try:
+            super().handle(record)
+        except Exception:
+            self.failed += 1
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Enqueues records without blocking; drops and counts them when full.
+
+    Records are enqueued as-is: ``QueueHandler.prepare`` would format (and
+    so redact) on the calling thread, which is the work being moved off it.
+    The handler owns its listener and tracks whether it is running.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self.listener: Optional[_LogQueueListener] = None
+        self.listening = False
+
+    def start_listener(self, *handlers: logging.Handler) -> None:
+        """Start a background thread writing queued records to ``handlers``."""
+        self.stop_listener()
+        with self._lock:
+            self.listener = _LogQueueListener(self.queue, *handlers)
+            self.listener.start()
+            self.listening = True
+
+    def stop_listener(self) -> None:
+        """Write out the queued records and stop the listener, if running."""
+        with self._lock:
+            if not self.listening:
+                return
+            self.listening = False
+        self.listener.stop()
+
+    def flush(self, timeout: float = LOG_FLUSH_TIMEOUT_S) -> bool:
+        """
+        Wait up to ``timeout`` seconds for records queued so far to be
+        written. Returns False if the listener is not running or fell behind.
+        """
+        if not self.listening:
+            return self.queue.empty()
+        deadline = time.monotonic() + timeout
+        marker = _FlushMarker()
+        try:
+            self.queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(max(deadline - time.monotonic(), 0.0))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        engine = get_session_engine()
+        if engine is not None:
+            setattr(record, _ENGINE_ATTR, engine)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+
+def _stop_listeners() -> None:
+    """Drain and stop any queue listener attached to the logger."""
+    for handler in _logger.handlers:
+        if isinstance(handler, BoundedQueueHandler):
+            handler.stop_listener()
+
+
 def _setup_logger() -> None:
     """Configure the logger based on environment."""
     # Clear existing handlers to allow reconfiguration on reload
+    _stop_listeners()
     _logger.handlers.clear()
+    _logger.filters.clear()
     handler = logging.StreamHandler(sys.stderr)
-    if _is_production():
+    if _json_output:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(
+            "[%(asctime)s] %(levelname)s %(name)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        ))
+    if _production:
         _logger.setLevel(logging.WARNING)
         handler.setLevel(logging.WARNING)
+        handler.addFilter(RedactingFilter())
+        queue_handler = BoundedQueueHandler(queue.Queue(LOG_QUEUE_MAX_RECORDS))
+        queue_handler.start_listener(handler)
+        _logger.addHandler(queue_handler)
+        # Unredacted records must not reach handlers on ancestor loggers.
+        _logger.propagate = False
     else:
         _logger.setLevel(logging.DEBUG)
         handler.setLevel(logging.DEBUG)
-    formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(formatter)
-    _logger.addHandler(handler)
+        _logger.addHandler(handler)
+        _logger.addFilter(RedactingFilter())
+        _logger.propagate = True
 
 
 _setup_logger()
+atexit.register(_stop_listeners)
+
+
+def reload_config() -> None:
+    """Re-read the logging environment variables and reconfigure the logger."""
+    global _production, _json_output, _info_sample_rate
+    _production = _read_production_flag()
+    _json_output = _read_json_flag(_production)
+    _info_sample_rate = _read_sample_rate()
+    _setup_logger()
+
+
+def _queue_handler() -> Optional[BoundedQueueHandler]:
+    return next((h for h in _logger.handlers if isinstance(h, BoundedQueueHandler)), None)
+
+
+def log_pipeline_stats() -> Dict[str, Any]:
+    """Queue depth, capacity, and dropped and failed record counts of the log pipeline."""
+    handler = _queue_handler()
+    if handler is None:
+        return {"mode": "sync", "queue_depth": 0, "queue_capacity": 0, "dropped": 0, "failed": 0}
+    return {
+        "mode": "queue",
+        "queue_depth": handler.queue.qsize(),
+        "queue_capacity": handler.queue.maxsize,
+        "dropped": handler.dropped,
+        "failed": handler.listener.failed if handler.listener is not None else 0,
+    }
+
+
+def flush_logs(timeout: float = LOG_FLUSH_TIMEOUT_S) -> bool:
+    """
+    Wait up to ``timeout`` seconds for every queued record to be written.
+    Returns True once they have been (always, in development mode).
+    """
+    handler = _queue_handler()
+    return handler.flush(timeout) if handler is not None else True
 
 
 def redact_pii(text: str) -> str:
-    """Remove common PII patterns from a string."""
-    result = text
-    for pattern, replacement in _PII_PATTERNS:
-        result = pattern.sub(replacement, result)
-    return result
+    """Remove common PII patterns and the session's own identifiers (single pass; see core.pii_guard)."""
+    return redact_text(text)
 
 
-def _redact_args(args: tuple[Any, ...]) -> tuple[Any, ...]:
+def _redact_args(args: tuple[Any, ...], engine: Optional[RedactionEngine] = None) -> tuple[Any, ...]:
     """Redact PII from each positional arg before %-formatting."""
-    return tuple(redact_pii(str(a)) if isinstance(a, str) else a for a in args)
+    return tuple(redact_text(a, engine) if isinstance(a, str) else a for a in args)
+
 
+def _redact_mapping(values: Mapping[str, Any], engine: Optional[RedactionEngine] = None) -> Dict[str, Any]:
+    """Redact PII from the string values of a mapping."""
+    return {k: redact_text(v, engine) if isinstance(v, str) else v for k, v in values.items()}
+
+
+# The facade checks the level first; redaction happens in RedactingFilter,
+# so calls below the configured level return without touching the message.
 
 def log_info(msg: str, *args: Any) -> None:
-    """Log an info-level message. PII is always redacted (msg and args)."""
-    _logger.info(redact_pii(msg), *_redact_args(args))
+    """Log an info-level message, subject to sampling. PII is always redacted (msg and args)."""
+    if _logger.isEnabledFor(logging.INFO) and (
+        _info_sample_rate >= 1.0 or random.random() < _info_sample_rate
+    ):
+        _logger.info(msg, *args)
 
 
 def log_debug(msg: str, *args: Any) -> None:
     """Log a debug message. Only emitted in dev mode. PII is redacted."""
-    if not _is_production():
-        _logger.debug(redact_pii(msg), *_redact_args(args))
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(msg, *args)
 
 
 def log_warning(msg: str, *args: Any) -> None:
     """Log a warning. PII is redacted (msg and args)."""
-    _logger.warning(redact_pii(msg), *_redact_args(args))
+    if _logger.isEnabledFor(logging.WARNING):
+        _logger.warning(msg, *args)
 
 
 def log_error(msg: str, *args: Any) -> None:
     """Log an error. PII is redacted (msg and args)."""
-    _logger.error(redact_pii(msg), *_redact_args(args))
+    if _logger.isEnabledFor(logging.ERROR):
+        _logger.error(msg, *args)
+
+
+def event_fingerprint(*parts: str) -> str:
+    """Stable short fingerprint for an event, e.g. (exception type, tab name)."""
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:12]
+
+
+def log_event(level: int, event: str, fingerprint: str, msg: str, /, *args: Any, **fields: Any) -> None:
+    """
+    Log a structured event, rate-limited per ``fingerprint``.
+
+    Occurrences beyond the burst allowance are counted instead of logged;
+    the next logged occurrence reports how many were suppressed. ``fields``
+    are added to the JSON output under ``"fields"`` (string values are
+    redacted).
+    """
+    if not _logger.isEnabledFor(level):
+        return
+    emit, suppressed = _rate_limiter.check(fingerprint)
+    if not emit:
+        return
+    if suppressed:
+        msg += " (suppressed %d occurrences)"
+        args += (suppressed,)
+    _logger.log(level, msg, *args, extra={
+        "event": event,
+        "fingerprint": fingerprint,
+        "suppressed": suppressed or None,
+        _FIELDS_ATTR: fields,
+    })
+
+
+def report_suppressed() -> None:
+    """Log a summary for every fingerprint with suppressed occurrences pending."""
+    for fingerprint, count in _rate_limiter.drain():
+        _logger.warning(
+            "Suppressed %d occurrences of event %s", count, fingerprint,
+            extra={"event": "suppressed_summary", "fingerprint": fingerprint, "suppressed": count},
+        )
+
+
+def _report_suppressed_every(interval_s: float, stop: threading.Event) -> None:
+    while not stop.wait(interval_s):
+        report_suppressed()
+
+
+_reporter: Optional[threading.Thread] = None
+_reporter_stop = threading.Event()
+
+
+def start_suppressed_reporter(interval_s: float = LOG_EVENT_WINDOW_S) -> None:
+    """(Re)start the thread that calls report_suppressed() every ``interval_s``."""
+    global _reporter, _reporter_stop
+    stop_suppressed_reporter()
+    _reporter_stop = threading.Event()
+    _reporter = threading.Thread(
+        target=_report_suppressed_every, args=(interval_s, _reporter_stop),
+        name="claimpilot-log-summary", daemon=True,
+    )
+    _reporter.start()
+
+
+def stop_suppressed_reporter() -> None:
+    """Stop the summary thread and report whatever is still pending."""
+    global _reporter
+    if _reporter is not None:
+        _reporter_stop.set()
+        _reporter.join()
+        _reporter = None
+    report_suppressed()
+
+
+start_suppressed_reporter()
+# Registered after _stop_listeners, so it runs first at exit (LIFO).
+atexit.register(stop_suppressed_reporter)
 
 
 def log_dev_unsafe(msg: str, *args: Any) -> None:
@@ -96,8 +499,8 @@ def log_dev_unsafe(msg: str, *args: Any) -> None:
     Log a message WITHOUT PII redaction.
     Only emitted in dev mode. Never call this in production code paths.
     """
-    if not _is_production():
-        _logger.debug(msg, *args)
+    if not _production and _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(msg, *args, extra={_UNSAFE_ATTR: True})
 
 
 def safe_error_message(exc: BaseException) -> str:
@@ -0,0 +1,154 @@
+"""
+Evidence metadata extraction for ClaimPilot v2.4.0.
+
+Finds the date a piece of evidence was *created* (photo taken, document
+written), as opposed to ``date_added`` which is only the upload time.
+
+Only headers are read:
+  - Images: the EXIF block, via Pillow's lazy ``Image.open`` (no decode).
+  - PDF: a bounded window at the start and end of the file, where the
+    ``/Info`` dictionary lives for normal and incrementally-updated files.
+  - DOCX: the ZIP central directory plus ``docProps/core.xml``.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import zipfile
+import zlib
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional, Union
+from xml.etree import ElementTree
+
+from PIL import Image
+
+from core.image_optimizer import is_image
+
+# How much of each end of a PDF to inspect for the /Info dictionary.
+_PDF_WINDOW = 64 * 1024
+
+_EXIF_IFD = 0x8769
+_EXIF_DATETIME_ORIGINAL = 36867
+_EXIF_DATETIME_DIGITIZED = 36868
+_EXIF_DATETIME = 306
+
+_PDF_DATE = re.compile(
+    rb"/(CreationDate|ModDate)\s*\(D:(\d{4})(\d{2})?(\d{2})?(\d{2})?(\d{2})?(\d{2})?"
+)
+
+_CORE_NS = {
+    "dcterms": "http://purl.org/dc/terms/",
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+}
+
+Source = Union[bytes, BinaryIO]
+
+
+def _as_stream(source: Source) -> BinaryIO:
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def _exif_to_iso(value: object) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.strptime(value.strip("\x00 "), "%Y:%m:%d %H:%M:%S").isoformat()
+    except ValueError:
+        return None
+
+
+def image_capture_date(source: Source) -> Optional[str]:
+    """Return the EXIF capture date of an image as ISO-8601, if present."""
+    try:
+        with Image.open(_as_stream(source)) as img:
+            exif = img.getexif()
+            sub = exif.get_ifd(_EXIF_IFD)
+            for value in (
+                sub.get(_EXIF_DATETIME_ORIGINAL),
+                sub.get(_EXIF_DATETIME_DIGITIZED),
+                exif.get(_EXIF_DATETIME),
+            ):
+                iso = _exif_to_iso(value)
+                if iso:
+                    return iso
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError):
+        pass
+    return None
+
+
+def pdf_document_date(source: Source) -> Optional[str]:
+    """Return the PDF ``/CreationDate`` (or ``/ModDate``) as ISO-8601."""
+    stream = _as_stream(source)
+    try:
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        head = stream.read(_PDF_WINDOW)
+        tail = b""
+        if size > _PDF_WINDOW:
+            stream.seek(max(_PDF_WINDOW, size - _PDF_WINDOW))
+            tail = stream.read(_PDF_WINDOW)
+    except OSError:
+        return None
+
+    found = {}
+    # Later /Info dictionaries (incremental updates) win, so scan tail last.
+    for window in (head, tail):
+        for match in _PDF_DATE.finditer(window):
+            found[match.group(1)] = match.groups()[1:]
+    parts = found.get(b"CreationDate") or found.get(b"ModDate")
+    if not parts:
+        return None
+    year, month, day, hour, minute, second = (int(p) if p else None for p in parts)
+    try:
+        return datetime(
+            year, month or 1, day or 1, hour or 0, minute or 0, second or 0
+        ).isoformat()
+    except ValueError:
+        return None
+
+
+def docx_document_date(source: Source) -> Optional[str]:
+    """Return ``dcterms:created`` from a .docx core-properties part."""
+    try:
+        with zipfile.ZipFile(_as_stream(source)) as zf:
+            with zf.open("docProps/core.xml") as fh:
+                root = ElementTree.parse(fh).getroot()
+    except (KeyError, OSError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    except (zlib.error, RuntimeError, NotImplementedError):
+        # Corrupt deflate data, an encrypted part, or an unsupported
+        # compression method.
+        return None
+    for tag in ("dcterms:created", "dcterms:modified"):
+        node = root.find(tag, _CORE_NS)
+        if node is not None and node.text:
+            text = node.text.strip().replace("Z", "+00:00")
+            try:
+                parsed = datetime.fromisoformat(text)
+            except ValueError:
+                continue
+            if parsed.tzinfo is not None:
+                # Stored naive, in UTC, like the "Z" dates Word writes.
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed.isoformat()
+    return None
+
+
+def extract_document_date(source: Source, file_name: str, file_type: str = "") -> Optional[str]:
+    """
+    Return the best-known creation date for an evidence file, or None.
+    Dispatches on MIME type / extension; unknown formats return None.
+    """
+    ext = os.path.splitext(file_name)[1].lower()
+    if is_image(file_name, file_type):
+        return image_capture_date(source)
+    if ext == ".pdf" or file_type == "application/pdf":
+        return pdf_document_date(source)
+    if ext == ".docx" or file_type.endswith("wordprocessingml.document"):
+        return docx_document_date(source)
+    return None
@@ -0,0 +1,344 @@
+"""
+Lightweight PDF inspection for ClaimPilot v2.4.0.
+
+Counts pages without parsing the document. Files on disk are memory-mapped
+so only the pages the OS actually touches are read; in-memory uploads are
+scanned in place. Strategies, cheapest first:
+
+  1. Linearization dictionary ``/N`` in the first kilobyte.
+  2. ``/Count`` of the root page-tree node (``/Type /Pages`` with no
+     ``/Parent``); the last such node wins so incremental updates count.
+  3. Number of ``/Type /Page`` leaf objects.
+
+PDFs that keep their page tree inside compressed object streams defeat all
+three; those report ``None`` rather than a guess.
+
+The same scanner also walks stream objects and inflates Flate-encoded
+streams incrementally, which is enough to pull text out of content streams
+without a full PDF parser. ``ContentTextDecoder`` extracts that text one
+chunk at a time, so a stream never has to be held in memory whole.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Union
+
+_LINEARIZED = re.compile(rb"/Linearized\b.*?/N\s+(\d+)\b", re.S)
+_PAGES_NODE = re.compile(rb"/Type\s*/Pages\b")
+_PAGE_LEAF = re.compile(rb"/Type\s*/Page\b(?!s)")
+_COUNT = re.compile(rb"/Count\s+(\d+)\b(?!\s+\d+\s+R)")
+_PARENT = re.compile(rb"/Parent\s+\d+\s+\d+\s+R")
+
+# How far either side of a /Type /Pages marker to look for its dictionary.
+_NODE_WINDOW = 4096
+
+Buffer = Union[bytes, bytearray, mmap.mmap]
+Source = Union[bytes, bytearray, memoryview, str, "os.PathLike[str]"]
+
+
+def _enclosing_object(buf: Buffer, pos: int) -> bytes:
+    """Return the bytes of the indirect object around ``pos`` (bounded)."""
+    lo = max(0, pos - _NODE_WINDOW)
+    start = buf.rfind(b"obj", lo, pos)
+    start = lo if start < 0 else start + 3
+    hi = min(len(buf), pos + _NODE_WINDOW)
+    end = buf.find(b"endobj", pos, hi)
+    end = hi if end < 0 else end
+    return bytes(buf[start:end])
+
+
+def count_pages_in_buffer(buf: Buffer) -> Optional[int]:
+    """Count pages in a PDF held in a bytes-like or mmap buffer."""
+    if not buf[:1024].lstrip().startswith(b"%PDF-"):
+        return None
+
+    linearized = _LINEARIZED.search(buf[:1024])
+    if linearized:
+        return int(linearized.group(1))
+
+    root_count: Optional[int] = None
+    for match in _PAGES_NODE.finditer(buf):
+        obj = _enclosing_object(buf, match.start())
+        if _PARENT.search(obj):
+            continue
+        count = _COUNT.search(obj)
+        if count:
+            root_count = int(count.group(1))
+    if root_count is not None:
+        return root_count
+
+    leaves = sum(1 for _ in _PAGE_LEAF.finditer(buf))
+    return leaves or None
+
+
+def count_pdf_pages(source: Source) -> Optional[int]:
+    """
+    Return the page count of a PDF given as bytes or a file path.
+    Returns None for non-PDFs and for page trees that cannot be read cheaply.
+    """
+    if isinstance(source, memoryview):
+        source = source.tobytes()
+    if isinstance(source, (bytes, bytearray)):
+        return count_pages_in_buffer(source)
+    try:
+        with open(source, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return count_pages_in_buffer(mm)
+    except (OSError, ValueError):
+        # ValueError: mmap of an empty file
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Stream scanning and text extraction
+# ---------------------------------------------------------------------------
+
+_STREAM_START = re.compile(rb"\bstream\r?\n")
+_LENGTH = re.compile(rb"/Length\s+(\d+)\b(?!\s+\d+\s+R)")
+_FLATE = re.compile(rb"/Filter\s*\[?\s*/(?:FlateDecode|Fl)\b")
+_ANY_FILTER = re.compile(rb"/Filter\b")
+# Streams that never hold page text.
+_NON_TEXT = re.compile(
+    rb"/Subtype\s*/(?:Image|XML)\b|/Type\s*/(?:XRef|ObjStm|Metadata|XObject)\b|/Length[123]\b"
+)
+
+# Inflate at most this much output per stream (decompression bomb guard).
+MAX_STREAM_OUTPUT = 16 * 1024 * 1024
+_CHUNK = 64 * 1024
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a cooperative deadline passes during a scan."""
+
+
+def check_deadline(deadline: Optional[float]) -> None:
+    """Raise :class:`DeadlineExceeded` once ``time.monotonic()`` passes ``deadline``."""
+    if deadline is not None and time.monotonic() > deadline:
+        raise DeadlineExceeded()
+
+
+@dataclass(frozen=True)
+class PdfStream:
+    """Location of one stream object within a PDF buffer."""
+
+    dictionary: bytes
+    data_start: int
+    data_end: int
+
+    @property
+    def is_flate(self) -> bool:
+        return bool(_FLATE.search(self.dictionary))
+
+    @property
+    def may_contain_text(self) -> bool:
+        if _NON_TEXT.search(self.dictionary):
+            return False
+        # Only unfiltered or Flate-encoded streams are decoded.
+        return self.is_flate or not _ANY_FILTER.search(self.dictionary)
+
+
+def iter_streams(buf: Buffer) -> Iterator[PdfStream]:
+    """Yield every ``stream ... endstream`` object in ``buf``."""
+    pos = 0
+    size = len(buf)
+    while True:
+        match = _STREAM_START.search(buf, pos)
+        if not match:
+            return
+        dict_start = buf.rfind(b"obj", max(0, match.start() - _NODE_WINDOW), match.start())
+        dict_start = max(0, match.start() - _NODE_WINDOW) if dict_start < 0 else dict_start + 3
+        dictionary = bytes(buf[dict_start:match.start()])
+        data_start = match.end()
+        length = _LENGTH.search(dictionary)
+        data_end = data_start + int(length.group(1)) if length else -1
+        if data_end < 0 or data_end > size or buf[data_end:data_end + 20].lstrip()[:9] != b"endstream":
+            data_end = buf.find(b"endstream", data_start)
+            if data_end < 0:
+                return
+        yield PdfStream(dictionary, data_start, data_end)
+        pos = data_end
+
+
+def iter_stream_chunks(
+    buf: Buffer,
+    stream: PdfStream,
+    chunk_size: int = _CHUNK,
+    max_output: int = MAX_STREAM_OUTPUT,
+    deadline: Optional[float] = None,
+) -> Iterator[bytes]:
+    """
+    Yield the decoded content of ``stream`` in chunks.
+    Flate data is inflated incrementally; output stops at ``max_output``.
+    Corrupt compressed data ends the stream early instead of raising.
+    """
+    inflater = zlib.decompressobj() if stream.is_flate else None
+    produced = 0
+    for offset in range(stream.data_start, stream.data_end, chunk_size):
+        check_deadline(deadline)
+        raw = bytes(buf[offset:min(offset + chunk_size, stream.data_end)])
+        if inflater is None:
+            out = raw
+        else:
+            try:
+                out = inflater.decompress(raw, max_output - produced)
+            except zlib.error:
+                return
+        if out:
+            produced += len(out)
+            yield out
+        if produced >= max_output or (inflater is not None and inflater.eof):
+            return
+
+
+_TEXT_TOKEN = re.compile(
+    rb"\((?:\\.|[^\\()]|\((?:\\.|[^\\()])*\))*\)"  # literal string (one nesting level)
+    rb"|<[0-9A-Fa-f\s]*>"                          # hex string
+    rb"|\[|\]"                                     # array delimiters
+    rb"|-?\d*\.?\d+"                                # number
+    rb"|T[Jj*dDm]|ET|'|\"",                         # text operators
+    re.S,
+)
+_ESCAPES = {
+    b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f",
+    b"(": b"(", b")": b")", b"\\": b"\\",
+}
+_ESCAPE = re.compile(rb"\\([0-7]{1,3}|\r\n|[\r\n]|.)", re.S)
+# TJ adjustments more negative than this are treated as word gaps.
+_TJ_SPACE = -150
+
+
+def _unescape(match: "re.Match[bytes]") -> bytes:
+    code = match.group(1)
+    if code[:1].isdigit():
+        return bytes([int(code, 8) & 0xFF])
+    if code in (b"\r\n", b"\r", b"\n"):
+        return b""
+    return _ESCAPES.get(code, code)
+
+
+def _decode_pdf_string(raw: bytes) -> str:
+    if raw.startswith(b"<"):
+        hex_digits = re.sub(rb"\s", b"", raw[1:-1])
+        if len(hex_digits) % 2:
+            hex_digits += b"0"
+        data = bytes.fromhex(hex_digits.decode("ascii"))
+    else:
+        data = _ESCAPE.sub(_unescape, raw[1:-1])
+    if data.startswith(b"\xfe\xff") or (len(data) >= 2 and len(data) % 2 == 0 and not any(data[::2])):
+        return data.decode("utf-16-be", errors="replace").lstrip("\ufeff")
+    return data.decode("cp1252", errors="replace")
+
+
+def content_stream_text(content: bytes) -> str:
+    """Extract shown text from a decoded page content stream."""
+    parts: List[str] = []
+    in_array = False
+    for match in _TEXT_TOKEN.finditer(content):
+        token = match.group()
+        first = token[:1]
+        if first in (b"(", b"<"):
+            parts.append(_decode_pdf_string(token))
+        elif token == b"[":
+            in_array = True
+        elif token == b"]":
+            in_array = False
+        elif in_array:
+            if float(token) < _TJ_SPACE:
+                parts.append(" ")
+        elif token in (b"T*", b"Td", b"TD", b"ET", b"'", b'"'):
+            if parts and not parts[-1].endswith("\n"):
+                parts.append("\n")
+    return "".join(parts)
+
+
+# Parentheses (and escapes, which may hide one) track string nesting; an
+# ET token outside any string ends a text object.
+_TEXT_OBJECT_SCAN = re.compile(rb"\\.|[()]|(?<!\S)ET(?!\S)", re.S)
+
+
+class ContentTextDecoder:
+    """
+    Incremental ``content_stream_text``: ``feed`` decoded chunks of a
+    content stream and get back the text of each text object (BT ... ET)
+    completed so far. Only the unfinished text object is buffered. Content
+    before the first BT is skipped; it cannot show text.
+    """
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self._scan_from = 0  # offset in _pending not yet scanned
+        self._depth = 0  # string nesting at _scan_from
+        self._started = False
+
+    def feed(self, chunk: bytes) -> str:
+        data = self._pending + chunk
+        if not self._started:
+            start = data.find(b"BT")
+            if start < 0:
+                self._pending = data[-1:]  # a "B" that may precede "T"
+                return ""
+            data, self._started = data[start:], True
+
+        cut = 0
+        pos = self._scan_from
+        for match in _TEXT_OBJECT_SCAN.finditer(data, pos):
+            if match.end() >= len(data):
+                break  # an escape or ET whose next byte has not arrived
+            token = match.group()
+            if token == b"(":
+                self._depth += 1
+            elif token == b")":
+                self._depth = max(self._depth - 1, 0)
+            elif token == b"ET" and not self._depth:
+                cut = match.end()
+            pos = match.end()
+        else:
+            pos = max(pos, len(data) - 1)
+
+        self._pending = data[cut:]
+        self._scan_from = pos - cut
+        return content_stream_text(data[:cut]) if cut else ""
+
+    def finish(self) -> str:
+        """Text of whatever is still buffered, once the stream has ended."""
+        return content_stream_text(self._pending) if self._started else ""
+
+
+def extract_pdf_text(
+    buf: Buffer,
+    max_chars: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> str:
+    """
+    Lightweight text extraction: decode candidate streams and collect
+    string operands of text-showing operators. Raises
+    :class:`DeadlineExceeded` (with partial text in ``args[0]``) on timeout.
+    """
+    texts: List[str] = []
+    total = 0
+    try:
+        for stream in iter_streams(buf):
+            check_deadline(deadline)
+            if not stream.may_contain_text:
+                continue
+            content = b"".join(iter_stream_chunks(buf, stream, deadline=deadline))
+            if b"BT" not in content:
+                continue
+            text = content_stream_text(content)
+            if text.strip():
+                texts.append(text)
+                total += len(text)
+                if max_chars is not None and total >= max_chars:
+                    break
+    except DeadlineExceeded:
+        raise DeadlineExceeded("\n".join(texts))
+    result = "\n".join(texts)
+    return result[:max_chars] if max_chars is not None else result
@@ -0,0 +1,154 @@
+"""
+Near-duplicate photo detection for ClaimPilot v2.4.0.
+
+Each image is reduced to a 64-bit difference hash (dHash) once, at upload
+time. Hashes go into a BK-tree keyed on Hamming distance, so finding the
+neighbours of a new photo touches only a small part of the tree instead of
+comparing it against every other upload. Neighbours are merged into
+clusters with a union-find as they are discovered.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from config.settings import NEAR_DUPLICATE_MAX_DISTANCE
+
+HASH_BITS = 64
+_HASH_W, _HASH_H = 9, 8
+
+
+def dhash(data: bytes) -> int:
+    """
+    Return the 64-bit difference hash of an image.
+    Raises ``PIL.UnidentifiedImageError`` on undecodable input.
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        # The hash only needs a thumbnail; let JPEG decode at reduced scale.
+        img.draft("L", (_HASH_W * 8, _HASH_H * 8))
+        img = ImageOps.exif_transpose(img).convert("L")
+        small = img.resize((_HASH_W, _HASH_H), Image.Resampling.LANCZOS)
+    pixels = small.tobytes()
+    value = 0
+    for row in range(_HASH_H):
+        offset = row * _HASH_W
+        for col in range(_HASH_W - 1):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def format_hash(value: int) -> str:
+    """Render a hash as fixed-width hex for storage on the evidence record."""
+    return f"{value:016x}"
+
+
+def parse_hash(text: str) -> Optional[int]:
+    """Inverse of :func:`format_hash`; returns None for empty/invalid input."""
+    try:
+        return int(text, 16) if text else None
+    except ValueError:
+        return None
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes with Hamming distance."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        # Node layout: [hash, [item_ids], {distance: child_node}]
+        self._root: Optional[list] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int, item_id: str) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = [value, [item_id], {}]
+            return
+        node = self._root
+        while True:
+            dist = hamming(value, node[0])
+            if dist == 0:
+                node[1].append(item_id)
+                return
+            child = node[2].get(dist)
+            if child is None:
+                node[2][dist] = [value, [item_id], {}]
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> List[Tuple[str, int]]:
+        """Return ``(item_id, distance)`` for every entry within ``max_distance``."""
+        if self._root is None:
+            return []
+        found: List[Tuple[str, int]] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            dist = hamming(value, node[0])
+            if dist <= max_distance:
+                found.extend((item_id, dist) for item_id in node[1])
+            lo, hi = dist - max_distance, dist + max_distance
+            for edge, child in node[2].items():
+                if lo <= edge <= hi:
+                    stack.append(child)
+        return found
+
+
+class NearDuplicateIndex:
+    """
+    Incremental near-duplicate clustering over evidence photos.
+
+    ``add`` is called once per uploaded image; clusters are maintained as
+    items arrive, so reading them never requires a pairwise pass.
+    """
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_MAX_DISTANCE) -> None:
+        self.max_distance = max_distance
+        self._tree = BKTree()
+        self._parent: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._parent
+
+    def _find(self, item_id: str) -> str:
+        root = item_id
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[item_id] != root:
+            self._parent[item_id], item_id = root, self._parent[item_id]
+        return root
+
+    def add(self, item_id: str, value: int) -> List[str]:
+        """Index ``item_id`` and return the ids it is a near-duplicate of."""
+        if item_id in self._parent:
+            return []
+        neighbours = [i for i, _ in self._tree.search(value, self.max_distance)]
+        self._parent[item_id] = item_id
+        for other in neighbours:
+            self._parent[self._find(other)] = self._find(item_id)
+        self._tree.add(value, item_id)
+        return neighbours
+
+    def clusters(self) -> List[List[str]]:
+        """Return groups of two or more near-identical items, in insertion order."""
+        groups: Dict[str, List[str]] = {}
+        for item_id in self._parent:
+            groups.setdefault(self._find(item_id), []).append(item_id)
+        return [members for members in groups.values() if len(members) > 1]
@@ -7,9 +7,10 @@ exports, logs, or error messages.
 
 from __future__ import annotations
 
-import base64
+import binascii
 import re
-from typing import Any, Dict, List, Set
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 # Fields that are considered PII and must never appear in log output or
 # unredacted error messages.
@@ -24,22 +25,226 @@ PII_FIELD_NAMES: Set[str] = {
     "account_number", "policy_number",
 }
 
-# Pattern to detect likely base64-encoded binary content
-_BASE64_PATTERN = re.compile(
-    r"^(?:[A-Za-z0-9+/]{4}){10,}(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$"
+# PII patterns redacted from log output: (name, pattern, replacement).
+# Order matters only where two patterns could match at the same position;
+# the earlier one wins.
+PII_PATTERNS: Tuple[Tuple[str, str, str], ...] = (
+    ("ssn", r"\b\d{3}-\d{2}-\d{4}\b", "[SSN-REDACTED]"),
+    ("email", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[EMAIL-REDACTED]"),
+    ("phone", r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b", "[PHONE-REDACTED]"),
+    ("zip", r"\b\d{5}(?:-\d{4})?\b", "[ZIP-REDACTED]"),
 )
 
+# Every PII pattern starts with a digit, except email, which needs an "@".
+_DIGIT = re.compile(r"\d")
+
+# Standard base64 alphabet, deleted with ``bytes.translate`` to find any
+# character outside it in one C-level pass.
+_BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+# Bytes counted as text by the binary check: 32-127, tab, LF and CR.
+_TEXT_BYTES = bytes(range(32, 128)) + b"\t\n\r"
+
+# Only this many leading characters are decoded for the binary check.
+_SAMPLE_CHARS = 100
+
 # Byte sequences indicating PDF content
 _PDF_HEADER = b"%PDF-"
 
 
+class FieldNameMatcher:
+    """
+    Finds every field name from a fixed set in one scan.
+
+    The names are compiled into a single regex shaped like a trie
+    ("email(?:_address)?"), so each text position costs one branch on its
+    first character rather than one attempt per name. Each match is the
+    longest name at its position; the shorter names it contains are
+    precomputed, and the scan resumes one character later so overlapping
+    names ("mailing_address" and "address") are all found.
+    """
+
+    def __init__(self, names: Set[str] = PII_FIELD_NAMES) -> None:
+        lowered = {name.lower() for name in names}
+        self._regex = re.compile(_trie_pattern(lowered))
+        self._contained = {
+            name: frozenset(other for other in lowered if other in name) for name in lowered
+        }
+
+    def find(self, text: str) -> Set[str]:
+        """Return every name that occurs in ``text`` (case-insensitive)."""
+        text = text.lower()
+        search = self._regex.search
+        found: Set[str] = set()
+        match = search(text)
+        while match is not None:
+            found |= self._contained[match.group()]
+            match = search(text, match.start() + 1)
+        return found
+
+    def contains(self, text: str) -> bool:
+        """Return True if any name occurs in ``text``; stops at the first."""
+        return self._regex.search(text.lower()) is not None
+
+
+def _trie_pattern(words: Set[str]) -> str:
+    """Build a regex matching the longest of ``words`` at a position."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word may end here; the optional group is greedy, so the longer
+        # word still wins.
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+_field_matcher = FieldNameMatcher()
+
+
+def find_pii_field_names(text: str) -> Set[str]:
+    """Return all PII field names referenced in a string (log line, key or text blob)."""
+    return _field_matcher.find(text)
+
+
 def contains_pii_field_name(text: str) -> bool:
     """Check if a string looks like it contains a PII field name reference."""
-    text_lower = text.lower()
-    for field_name in PII_FIELD_NAMES:
-        if field_name in text_lower:
-            return True
-    return False
+    return _field_matcher.contains(text)
+
+
+# Intake fields whose values are redacted from that session's logs and
+# error messages, with their replacements.
+SESSION_PII_FIELDS: Dict[str, str] = {
+    "claimant_name": "[NAME-REDACTED]",
+    "respondent_name": "[NAME-REDACTED]",
+    "claimant_address": "[ADDRESS-REDACTED]",
+    "respondent_address": "[ADDRESS-REDACTED]",
+    "claimant_email": "[EMAIL-REDACTED]",
+    "claimant_phone": "[PHONE-REDACTED]",
+}
+
+# Name parts too common to redact on their own ("The Oak Street LLC").
+_NAME_PART_STOPWORDS = frozenset({"the", "and", "inc", "llc", "ltd", "corp", "company", "co"})
+
+
+class RedactionEngine:
+    """
+    Redacts all PII patterns in a single scan.
+
+    The patterns are compiled into one alternation of named groups, so each
+    string is scanned once and rebuilt once, instead of once per pattern.
+    Strings with no digit and no "@" cannot match and are returned as-is;
+    strings without "@" use an alternation that leaves out the email
+    pattern, which is by far the most expensive one to attempt.
+
+    ``terms`` maps literal strings (a session's own names and addresses)
+    to replacements. They are compiled into a case-insensitive trie and
+    placed first in the same alternation, so they are redacted in the
+    same scan and take precedence over the generic patterns they contain.
+    """
+
+    def __init__(
+        self,
+        patterns: Tuple[Tuple[str, str, str], ...] = PII_PATTERNS,
+        terms: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self._terms = {term.lower(): replacement for term, replacement in (terms or {}).items()}
+        literal: Tuple[Tuple[str, str, str], ...] = ()
+        if self._terms:
+            literal = (("term", rf"(?<!\w)(?i:{_trie_pattern(set(self._terms))})(?!\w)", ""),)
+        self._regex = re.compile(self._alternation(literal + patterns))
+        # The remaining patterns all start with a digit; the lookahead lets
+        # the scanner reject every other position without trying them.
+        no_at = rf"(?=\d)(?:{self._alternation(tuple(p for p in patterns if '@' not in p[1]))})"
+        if literal:
+            # Same idea with the terms: only a digit or a term's first
+            # letter can start a match.
+            starts = "".join(sorted({c for term in self._terms for c in (term[0], term[0].upper())}))
+            no_at = rf"(?=[\d{re.escape(starts)}])(?:{self._alternation(literal)}|{no_at})"
+        self._regex_no_at = re.compile(no_at)
+        self._replacements = {name: replacement for name, _, replacement in patterns}
+
+    @staticmethod
+    def _alternation(patterns: Tuple[Tuple[str, str, str], ...]) -> str:
+        return "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in patterns)
+
+    def _replace(self, match: re.Match) -> str:
+        if match.lastgroup == "term":
+            return self._terms.get(match.group().lower(), "[REDACTED]")
+        return self._replacements[match.lastgroup]
+
+    def redact(self, text: str) -> str:
+        if "@" in text:
+            return self._regex.sub(self._replace, text)
+        if not self._terms and _DIGIT.search(text) is None:
+            return text
+        return self._regex_no_at.sub(self._replace, text)
+
+
+def session_redaction_terms(intake: Mapping[str, Any]) -> Dict[str, str]:
+    """
+    Literal terms to redact for one session, from its intake.
+
+    Each ``SESSION_PII_FIELDS`` value is included whole (whitespace
+    collapsed). Name parts of three or more letters and the street line of
+    an address are included too, since logs rarely quote them in full.
+    """
+    terms: Dict[str, str] = {}
+    for field, replacement in SESSION_PII_FIELDS.items():
+        value = " ".join(str(intake.get(field) or "").split()).strip(" ,.;")
+        if len(value) < 2:
+            continue
+        terms[value] = replacement
+        if field.endswith("_name"):
+            for part in value.split():
+                part = part.strip(",.")
+                if len(part) >= 3 and part.lower() not in _NAME_PART_STOPWORDS:
+                    terms.setdefault(part, replacement)
+        elif field.endswith("_address"):
+            street = value.split(",")[0].strip()
+            if len(street) >= 5:
+                terms.setdefault(street, replacement)
+    return terms
+
+
+def build_session_engine(intake: Mapping[str, Any]) -> Optional[RedactionEngine]:
+    """Compile a redaction engine covering the intake's identifiers, or None if it has none."""
+    terms = session_redaction_terms(intake)
+    return RedactionEngine(terms=terms) if terms else None
+
+
+_engine = RedactionEngine()
+
+# The current session's engine. Streamlit runs each session's script in its
+# own context; data_manager sets this at the start of every run.
+_session_engine: ContextVar[Optional[RedactionEngine]] = ContextVar("claimpilot_redaction_engine", default=None)
+
+
+def set_session_engine(engine: Optional[RedactionEngine]) -> None:
+    """Use ``engine`` for redaction in the current context (None: patterns only)."""
+    _session_engine.set(engine)
+
+
+def get_session_engine() -> Optional[RedactionEngine]:
+    """Return the engine set for the current context, if any."""
+    return _session_engine.get()
+
+
+def redact_text(text: str, engine: Optional[RedactionEngine] = None) -> str:
+    """
+    Remove common PII patterns (SSN, email, phone, ZIP) from a string, plus
+    the current session's own identifiers when a session engine is set.
+    """
+    return (engine or _session_engine.get() or _engine).redact(text)
 
 
 def is_base64_binary(value: str) -> bool:
@@ -47,19 +252,29 @@ def is_base64_binary(value: str) -> bool:
     if not isinstance(value, str):
         return False
     stripped = value.strip()
-    if len(stripped) < 40:
+    length = len(stripped)
+    # Whole quads of at least 40 characters, alphabet only; free text
+    # almost always fails on the first space, found with one memchr.
+    if length < 40 or length % 4 or " " in stripped or not stripped.isascii():
         return False
-    if _BASE64_PATTERN.match(stripped):
-        try:
-            decoded = base64.b64decode(stripped[:100])
-            if decoded.startswith(_PDF_HEADER):
-                return True
-            # Check for high-entropy binary (non-text bytes)
-            non_text = sum(1 for b in decoded if b > 127 or (b < 32 and b not in (9, 10, 13)))
-            return non_text > len(decoded) * 0.3
-        except Exception:
-            pass
-    return False
+    encoded = stripped.encode("ascii")
+    # The sample verdict is cheap, so it goes first: most base64-shaped
+    # strings that are not binary are rejected without a full scan.
+    try:
+        decoded = binascii.a2b_base64(encoded[:_SAMPLE_CHARS])
+    except binascii.Error:
+        return False
+    if not decoded.startswith(_PDF_HEADER):
+        # Binary if over 30% of the sampled bytes are not text bytes.
+        non_text = len(decoded.translate(None, _TEXT_BYTES))
+        if non_text <= len(decoded) * 0.3:
+            return False
+    rest = encoded.translate(None, _BASE64_ALPHABET)
+    if not rest:
+        return True
+    # Only "=" or "==" padding is allowed, at the end, after ten full quads
+    # (the padded quad is the eleventh or later).
+    return rest in (b"=", b"==") and encoded.endswith(rest) and length >= 44
 
 
 def contains_raw_pdf_bytes(value: Any) -> bool:
@@ -130,3 +345,76 @@ def _check_dict_violations(
                     violations.append(f"{current_path}[{i}]: contains base64 binary data")
                 elif isinstance(item, bytes):
                     violations.append(f"{current_path}[{i}]: contains raw bytes")
+
+
+_REMOVED = "[binary content removed]"
+_END = object()
+
+
+def _looks_base64(value: str, verdicts: Dict[str, bool]) -> bool:
+    """
+    ``is_base64_binary`` with short strings decided inline and long ones
+    memoised in ``verdicts``. The memo belongs to one call, so user strings
+    are never held beyond it.
+    """
+    if len(value) < 40:
+        return False
+    verdict = verdicts.get(value)
+    if verdict is None:
+        verdict = verdicts[value] = is_base64_binary(value)
+    return verdict
+
+
+def sanitize_and_validate(data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Sanitize an export dictionary and validate the result in one traversal.
+
+    Equivalent to ``sanitize_export_dict`` followed by
+    ``validate_export_json`` on its output, but walks the tree once,
+    iteratively (deep payloads cannot hit the recursion limit), and decides
+    the base64 verdict once per distinct string within the call. After sanitizing, the only violations
+    left are raw bytes inside lists, which sanitizing keeps.
+    """
+    clean: Dict[str, Any] = {}
+    violations: List[str] = []
+    verdicts: Dict[str, bool] = {}
+    # Frames are (items iterator, output container, path); dict frames
+    # iterate (key, value) pairs, list frames iterate values.
+    stack: List[Tuple[Iterator[Any], Any, str]] = [(iter(data.items()), clean, "")]
+    while stack:
+        items, out, path = stack[-1]
+        entry = next(items, _END)
+        if entry is _END:
+            stack.pop()
+            continue
+
+        if isinstance(out, dict):
+            key, value = entry
+            current_path = f"{path}.{key}" if path else key
+            if isinstance(value, dict):
+                out[key] = child = {}
+                stack.append((iter(value.items()), child, current_path))
+            elif isinstance(value, list):
+                out[key] = child = []
+                stack.append((iter(value), child, current_path))
+            elif isinstance(value, str):
+                out[key] = _REMOVED if _looks_base64(value, verdicts) or "%PDF-" in value else value
+            elif isinstance(value, bytes):
+                out[key] = _REMOVED
+            else:
+                out[key] = value
+        else:
+            value = entry
+            index = len(out)
+            if isinstance(value, dict):
+                child = {}
+                out.append(child)
+                stack.append((iter(value.items()), child, f"{path}[{index}]"))
+            elif isinstance(value, str):
+                if not _looks_base64(value, verdicts):
+                    out.append(value)
+            else:
+                if isinstance(value, bytes):
+                    violations.append(f"{path}[{index}]: contains raw bytes")
+                out.append(value)
+    return clean, violations
@@ -0,0 +1,228 @@
+"""
+Evidence PII scanner for ClaimPilot v2.4.0.
+
+Flags sensitive numbers (SSNs, bank account numbers, card numbers) in
+evidence text before it goes into a binder. The SSN shape comes from
+``core.pii_guard``; the account and card patterns are specific to
+documents, where a bare ten-digit number is usually a phone number or an
+invoice reference and is not worth flagging.
+
+Text is scanned in fixed-size chunks. Each window searches on from exactly
+where the previous one stopped (the end of its last match), and only
+takes matches that start inside its chunk, with ``overlap`` characters of
+look-ahead past it. Every pattern has a bounded length shorter than the
+overlap, so the findings are the same as scanning the whole text at once.
+Bytes are decoded incrementally, so memory use depends on the chunk size,
+not the file size. Files run on a worker pool.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from config.settings import PII_SCAN_CHUNK_CHARS, PII_SCAN_MAX_FINDINGS, PII_SCAN_OVERLAP_CHARS
+from core.pii_guard import PII_PATTERNS
+from core.text_extractor import sniff_encoding
+
+KIND_SSN = "ssn"
+KIND_ACCOUNT = "account_number"
+KIND_CARD = "card_number"
+
+FINDING_LABELS = {
+    KIND_SSN: "Social Security number",
+    KIND_ACCOUNT: "Account number",
+    KIND_CARD: "Card number",
+}
+
+# (name, pattern). Every pattern must have a bounded length shorter than
+# PII_SCAN_OVERLAP_CHARS: no unbounded repeats.
+SCAN_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    (KIND_SSN, dict((name, pattern) for name, pattern, _ in PII_PATTERNS)[KIND_SSN]),
+    (
+        KIND_ACCOUNT,
+        r"(?i:\b(?:account|acct|routing)\b\.?(?:[ \t]{0,8}(?:no\b\.?|number|#))?[ \t]{0,8}[:#]?[ \t]{0,40})"
+        r"\d(?:[ -]?\d){5,16}\b",
+    ),
+    (KIND_CARD, r"\b\d{4}(?:[ -]?\d{4}){2}[ -]?\d{1,7}\b"),
+)
+
+_SCAN_REGEX = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in SCAN_PATTERNS))
+_NON_DIGIT = re.compile(r"\D")
+
+Source = Union[str, bytes]
+
+
+@dataclass(frozen=True)
+class PiiFinding:
+    """One sensitive number; ``preview`` keeps only the last four digits."""
+
+    kind: str
+    offset: int  # character offset in the scanned text
+    preview: str
+
+
+@dataclass(frozen=True)
+class PiiScanReport:
+    """Findings for one exhibit. ``findings`` is capped; ``counts`` is not."""
+
+    item_id: str
+    findings: Tuple[PiiFinding, ...]
+    counts: Mapping[str, int]
+    chars_scanned: int
+    elapsed_ms: float
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def _luhn_valid(digits: str) -> bool:
+    total = 0
+    for i, char in enumerate(reversed(digits)):
+        value = ord(char) - 48
+        if i % 2:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return total % 10 == 0
+
+
+def _mask(text: str) -> str:
+    """Replace every digit but the last four with ``*``."""
+    keep = len(_NON_DIGIT.sub("", text)) - 4
+    out = []
+    for char in text:
+        if char.isdigit() and keep > 0:
+            out.append("*")
+            keep -= 1
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+class PiiScanner:
+    """
+    Incremental scanner: ``feed`` text in any pieces, then ``finish``.
+
+    Holds at most one chunk plus the overlap, whatever the input size.
+    """
+
+    def __init__(
+        self,
+        chunk_chars: int = PII_SCAN_CHUNK_CHARS,
+        overlap: int = PII_SCAN_OVERLAP_CHARS,
+        max_findings: int = PII_SCAN_MAX_FINDINGS,
+    ) -> None:
+        if chunk_chars < 1 or overlap < 1:
+            raise ValueError("chunk_chars and overlap must be positive")
+        self.chunk_chars = chunk_chars
+        self.overlap = overlap
+        self.max_findings = max_findings
+        self.findings: List[PiiFinding] = []
+        self.counts: Dict[str, int] = {}
+        self.chars_scanned = 0
+        self._window = ""
+        self._window_start = 0  # global offset of self._window[0]
+        self._pos = 0  # global offset where the next search starts
+
+    def feed(self, text: str) -> None:
+        self._window += text
+        self.chars_scanned += len(text)
+        while len(self._window) >= self.chunk_chars + self.overlap:
+            self._scan(final=False)
+
+    def finish(self) -> None:
+        self._scan(final=True)
+
+    def _scan(self, final: bool) -> None:
+        # Non-final windows cover one chunk plus ``overlap`` characters of
+        # look-ahead. A match attempt at a position inside the chunk sees
+        # everything it could consume, so it agrees with a whole-text scan;
+        # attempts past the chunk wait for the next window.
+        if final:
+            scan, limit = self._window, len(self._window)
+        else:
+            scan, limit = self._window[: self.chunk_chars + self.overlap], self.chunk_chars
+        pos = self._pos - self._window_start
+        while True:
+            match = _SCAN_REGEX.search(scan, pos)
+            if match is None or match.start() > limit:
+                pos = max(pos, limit + 1)
+                break
+            self._record(match)
+            pos = match.end()
+        if final:
+            self._window = ""
+            return
+        self._pos = self._window_start + pos
+        # Keep one character before the resume point for \b and lookbehinds.
+        keep_from = pos - 1
+        self._window = self._window[keep_from:]
+        self._window_start += keep_from
+
+    def _record(self, match: re.Match) -> None:
+        kind = match.lastgroup
+        text = match.group()
+        if kind == KIND_CARD:
+            digits = _NON_DIGIT.sub("", text)
+            if not 13 <= len(digits) <= 19 or not _luhn_valid(digits):
+                return
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if len(self.findings) < self.max_findings:
+            self.findings.append(PiiFinding(kind, self._window_start + match.start(), _mask(text)))
+
+    def report(self, item_id: str, elapsed_ms: float = 0.0) -> PiiScanReport:
+        return PiiScanReport(item_id, tuple(self.findings), dict(self.counts), self.chars_scanned, elapsed_ms)
+
+
+def _decoded(data: bytes, chunk_bytes: int, encoding: str, errors: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    view = memoryview(data)
+    for start in range(0, len(data), chunk_bytes):
+        yield decoder.decode(view[start:start + chunk_bytes])
+    yield decoder.decode(b"", final=True)
+
+
+def _scan_pieces(pieces: Iterator[str], chunk_chars: int) -> PiiScanner:
+    scanner = PiiScanner(chunk_chars=chunk_chars)
+    for piece in pieces:
+        scanner.feed(piece)
+    scanner.finish()
+    return scanner
+
+
+def scan_source(item_id: str, source: Source, chunk_chars: int = PII_SCAN_CHUNK_CHARS) -> PiiScanReport:
+    """Scan one exhibit: extracted text (``str``) or raw text-file bytes."""
+    start = time.perf_counter()
+    if isinstance(source, str):
+        pieces = (source[i:i + chunk_chars] for i in range(0, len(source), chunk_chars))
+        scanner = _scan_pieces(pieces, chunk_chars)
+    else:
+        try:
+            scanner = _scan_pieces(_decoded(source, chunk_chars, sniff_encoding(source[:4]), "strict"), chunk_chars)
+        except UnicodeDecodeError:
+            # Not UTF-8 after all: rescan as cp1252, like text extraction does.
+            scanner = _scan_pieces(_decoded(source, chunk_chars, "cp1252", "replace"), chunk_chars)
+    return scanner.report(item_id, (time.perf_counter() - start) * 1000)
+
+
+def scan_sources(
+    sources: Mapping[str, Source],
+    max_workers: Optional[int] = None,
+) -> Dict[str, PiiScanReport]:
+    """Scan many exhibits in parallel; ``sources`` maps ``item_id`` to text or bytes."""
+    if not sources:
+        return {}
+    workers = max_workers or min(len(sources), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {item_id: pool.submit(scan_source, item_id, source) for item_id, source in sources.items()}
+        return {item_id: future.result() for item_id, future in futures.items()}
@@ -0,0 +1,205 @@
+"""
+Full-text search over a case for ClaimPilot v2.4.0.
+
+An in-process positional inverted index covering extracted evidence text,
+evidence labels/descriptions and the intake narrative. Documents are added,
+replaced and removed incrementally; queries are ranked with BM25. Quoted
+phrases ("promised a refund") must match consecutive positions.
+
+Postings are ``term -> {doc_number: array of positions}``, so a query only
+touches the documents that contain its terms. Each document also keeps the
+character offset of every token, so snippets are cut straight from the
+matched position instead of re-scanning the text.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+_TOKEN = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]+)"')
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+_SNIPPET_RADIUS = 80
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, in order."""
+    return _TOKEN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result."""
+
+    key: str
+    title: str
+    score: float
+    snippet: str
+
+
+class SearchIndex:
+    """Positional inverted index with BM25 ranking."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[int, array]] = {}
+        self._doc_number: Dict[str, int] = {}
+        self._doc_key: Dict[int, str] = {}
+        self._doc_len: Dict[int, int] = {}
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._doc_title: Dict[int, str] = {}
+        self._doc_text: Dict[int, str] = {}
+        self._doc_offsets: Dict[int, array] = {}
+        self._next_number = 0
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_number)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._doc_number
+
+    # ---- Updates ----------------------------------------------------------
+
+    def add_document(self, key: str, text: str, title: str = "") -> None:
+        """Index ``text`` under ``key``, replacing any previous version."""
+        self.remove_document(key)
+        offsets = array("I")
+        tokens = []
+        for match in _TOKEN.finditer(text):
+            offsets.append(match.start())
+            tokens.append(match.group().lower())
+        if not tokens:
+            return
+        number = self._next_number
+        self._next_number += 1
+
+        positions: Dict[str, array] = {}
+        for pos, term in enumerate(tokens):
+            plist = positions.get(term)
+            if plist is None:
+                positions[term] = plist = array("I")
+            plist.append(pos)
+        for term, plist in positions.items():
+            self._postings.setdefault(term, {})[number] = plist
+
+        self._doc_number[key] = number
+        self._doc_key[number] = key
+        self._doc_len[number] = len(tokens)
+        self._doc_terms[number] = tuple(positions)
+        self._doc_title[number] = title or key
+        self._doc_text[number] = text
+        self._doc_offsets[number] = offsets
+        self._total_len += len(tokens)
+
+    def remove_document(self, key: str) -> None:
+        number = self._doc_number.pop(key, None)
+        if number is None:
+            return
+        for term in self._doc_terms.pop(number):
+            docs = self._postings[term]
+            del docs[number]
+            if not docs:
+                del self._postings[term]
+        self._total_len -= self._doc_len.pop(number)
+        del self._doc_key[number]
+        del self._doc_title[number]
+        del self._doc_text[number]
+        del self._doc_offsets[number]
+
+    # ---- Queries ----------------------------------------------------------
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self._doc_number)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def _phrase_docs(self, phrase: List[str]) -> Dict[int, Tuple[int, int]]:
+        """
+        Documents in which the terms of ``phrase`` occur consecutively,
+        mapped to the ``(first, last)`` token positions of the first match.
+        """
+        postings = [self._postings.get(term) for term in phrase]
+        if not all(postings):
+            return {}
+        # Intersect starting from the rarest term.
+        candidates = set(min(postings, key=len))
+        for docs in postings:
+            candidates.intersection_update(docs)
+        matched: Dict[int, Tuple[int, int]] = {}
+        for number in candidates:
+            starts = set(postings[0][number])
+            for offset, docs in enumerate(postings[1:], 1):
+                starts &= {p - offset for p in docs[number]}
+                if not starts:
+                    break
+            if starts:
+                first = min(starts)
+                matched[number] = (first, first + len(phrase) - 1)
+        return matched
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """Return up to ``limit`` hits for ``query``, best first."""
+        phrases = [tokenize(p) for p in _PHRASE.findall(query)]
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        allowed: Optional[Set[int]] = None
+        spans: Dict[int, Tuple[int, int]] = {}
+        for phrase in phrases:
+            if phrase:
+                docs = self._phrase_docs(phrase)
+                allowed = set(docs) if allowed is None else allowed & docs.keys()
+                for number, span in docs.items():
+                    spans.setdefault(number, span)
+        if allowed is not None and not allowed:
+            return []
+
+        avg_len = self._total_len / len(self._doc_number) if self._doc_number else 0.0
+        scores: Dict[int, float] = {}
+        for term in terms:
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            idf = self._idf(term)
+            for number, plist in docs.items():
+                if allowed is not None and number not in allowed:
+                    continue
+                tf = len(plist)
+                norm = _K1 * (1 - _B + _B * self._doc_len[number] / avg_len)
+                scores[number] = scores.get(number, 0.0) + idf * tf * (_K1 + 1) / (tf + norm)
+                if number not in spans:
+                    spans[number] = (plist[0], plist[0])
+
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        return [
+            SearchHit(
+                key=self._doc_key[number],
+                title=self._doc_title[number],
+                score=score,
+                snippet=self._snippet(number, spans[number]),
+            )
+            for number, score in ranked
+        ]
+
+    def _snippet(self, number: int, span: Tuple[int, int]) -> str:
+        """Excerpt around the token span ``(first, last)`` of a match."""
+        text = self._doc_text[number]
+        offsets = self._doc_offsets[number]
+        first, last = span
+        match_end = _TOKEN.match(text, offsets[last]).end()
+        start = max(0, offsets[first] - _SNIPPET_RADIUS)
+        end = min(len(text), match_end + _SNIPPET_RADIUS)
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if end < len(text) else ""
+        return prefix + " ".join(text[start:end].split()) + suffix
@@ -0,0 +1,224 @@
+"""
+Evidence text extraction for ClaimPilot v2.4.0.
+
+Makes the content of text-bearing evidence available for search and
+checks. Three formats are handled:
+
+  - ``.txt``: decoded in fixed-size chunks with an incremental decoder.
+  - ``.docx``: ``word/document.xml`` is streamed with ``iterparse`` straight
+    out of the ZIP; the archive is never unpacked.
+  - ``.pdf``: a lightweight scan of content streams (see core/pdf_inspector).
+
+Legacy ``.doc`` files are accepted by the uploader but not extracted.
+
+Files run on a worker pool. Each file gets a cooperative deadline that the
+extractors check between chunks, so a pathological file ends with status
+``"timeout"`` and whatever text was recovered, instead of holding a worker
+forever. Completed extractions are cached by content hash.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import codecs
+import io
+import os
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+from xml.etree import ElementTree
+
+from config.settings import EVIDENCE_TEXT_MAX_CHARS, EVIDENCE_TEXT_TIMEOUT_S
+from core.cache import SizedLRUCache, content_hash
+from core.pdf_inspector import DeadlineExceeded, check_deadline, extract_pdf_text
+
+_CHUNK = 64 * 1024
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Upper bound on cached text (characters) held per process.
+_CACHE_MAX_CHARS = 32 * 1024 * 1024
+_cache: SizedLRUCache[str] = SizedLRUCache(_CACHE_MAX_CHARS)
+
+KIND_TXT = "txt"
+KIND_DOCX = "docx"
+KIND_PDF = "pdf"
+
+
+@dataclass(frozen=True)
+class ExtractionResult:
+    """Outcome of extracting one evidence file."""
+
+    item_id: str
+    text: str
+    status: str  # "ok" | "timeout" | "error" | "unsupported"
+    elapsed_ms: float
+    cached: bool = False
+
+
+def text_kind(file_name: str, file_type: str = "") -> Optional[str]:
+    """Return the extractor kind for a file, or None if unsupported."""
+    ext = os.path.splitext(file_name)[1].lower()
+    if ext == ".txt" or file_type == "text/plain":
+        return KIND_TXT
+    if ext == ".docx" or file_type.endswith("wordprocessingml.document"):
+        return KIND_DOCX
+    if ext == ".pdf" or file_type == "application/pdf":
+        return KIND_PDF
+    return None
+
+
+class _TextSink:
+    """Accumulates text up to a character limit."""
+
+    def __init__(self, max_chars: int) -> None:
+        self.parts: List[str] = []
+        self.remaining = max_chars
+
+    @property
+    def full(self) -> bool:
+        return self.remaining <= 0
+
+    def write(self, text: str) -> None:
+        if self.remaining > 0 and text:
+            text = text[: self.remaining]
+            self.parts.append(text)
+            self.remaining -= len(text)
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+def sniff_encoding(head: bytes) -> str:
+    """Codec for text whose first bytes are ``head``: a BOM decides, else UTF-8."""
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    return "utf-8"
+
+
+def extract_txt(data: bytes, max_chars: int, deadline: Optional[float] = None) -> str:
+    """Decode plain text chunk by chunk; falls back to cp1252 for non-UTF-8 files."""
+    encoding = sniff_encoding(data[:4])
+    for attempt in (encoding, "cp1252"):
+        errors = "strict" if attempt != "cp1252" else "replace"
+        decoder = codecs.getincrementaldecoder(attempt)(errors=errors)
+        sink = _TextSink(max_chars)
+        stream = io.BytesIO(data)
+        try:
+            while not sink.full:
+                check_deadline(deadline)
+                chunk = stream.read(_CHUNK)
+                sink.write(decoder.decode(chunk, final=not chunk))
+                if not chunk:
+                    break
+        except UnicodeDecodeError:
+            continue
+        except DeadlineExceeded:
+            raise DeadlineExceeded(sink.getvalue())
+        return sink.getvalue()
+    return ""
+
+
+def extract_docx(data: bytes, max_chars: int, deadline: Optional[float] = None) -> str:
+    """Stream paragraphs out of ``word/document.xml`` without unpacking the archive."""
+    sink = _TextSink(max_chars)
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            with zf.open("word/document.xml") as fh:
+                for _event, elem in ElementTree.iterparse(fh, events=("end",)):
+                    tag = elem.tag
+                    if tag == _W_NS + "t":
+                        sink.write(elem.text or "")
+                    elif tag == _W_NS + "tab":
+                        sink.write("\t")
+                    elif tag in (_W_NS + "br", _W_NS + "cr"):
+                        sink.write("\n")
+                    elif tag == _W_NS + "p":
+                        sink.write("\n")
+                        # Paragraph fully consumed: drop its subtree to keep memory flat.
+                        elem.clear()
+                        check_deadline(deadline)
+                    if sink.full:
+                        break
+    except DeadlineExceeded:
+        raise DeadlineExceeded(sink.getvalue())
+    return sink.getvalue()
+
+
+def extract_pdf(data: bytes, max_chars: int, deadline: Optional[float] = None) -> str:
+    return extract_pdf_text(data, max_chars=max_chars, deadline=deadline)
+
+
+_EXTRACTORS = {
+    KIND_TXT: extract_txt,
+    KIND_DOCX: extract_docx,
+    KIND_PDF: extract_pdf,
+}
+
+
+def extract_text(
+    item_id: str,
+    data: bytes,
+    file_name: str,
+    file_type: str = "",
+    timeout_s: float = EVIDENCE_TEXT_TIMEOUT_S,
+    max_chars: int = EVIDENCE_TEXT_MAX_CHARS,
+) -> ExtractionResult:
+    """Extract text from one evidence file, using the content-hash cache."""
+    start = time.perf_counter()
+
+    def result(text: str, status: str, cached: bool = False) -> ExtractionResult:
+        return ExtractionResult(item_id, text, status, (time.perf_counter() - start) * 1000, cached)
+
+    kind = text_kind(file_name, file_type)
+    if kind is None:
+        return result("", "unsupported")
+
+    key = (content_hash(data), kind, max_chars)
+    cached = _cache.get(key)
+    if cached is not None:
+        return result(cached, "ok", cached=True)
+
+    deadline = time.monotonic() + timeout_s
+    try:
+        text = _EXTRACTORS[kind](data, max_chars, deadline)
+    except DeadlineExceeded as exc:
+        return result(exc.args[0] if exc.args else "", "timeout")
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return result("", "error")
+    except (zlib.error, RuntimeError, NotImplementedError):
+        # zipfile: corrupt deflate data, an encrypted member, or an
+        # unsupported compression method.
+        return result("", "error")
+    _cache.put(key, text)
+    return result(text, "ok")
+
+
+def extract_texts(
+    files: Mapping[str, Tuple[bytes, str, str]],
+    max_workers: Optional[int] = None,
+    timeout_s: float = EVIDENCE_TEXT_TIMEOUT_S,
+) -> Dict[str, ExtractionResult]:
+    """
+    Extract text from many files in parallel.
+    ``files`` maps ``item_id`` to ``(content, file_name, file_type)``.
+    """
+    if not files:
+        return {}
+    workers = max_workers or min(len(files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            item_id: pool.submit(extract_text, item_id, data, name, ftype, timeout_s)
+            for item_id, (data, name, ftype) in files.items()
+        }
+        return {item_id: future.result() for item_id, future in futures.items()}
+
+
+def clear_cache() -> None:
+    """Drop all cached extractions."""
+    _cache.clear()
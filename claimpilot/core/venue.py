@@ -0,0 +1,153 @@
+"""
+ZIP code to court venue resolution for ClaimPilot v2.4.0.
+
+Parses the ZIP code out of a free-text address and looks it up in a
+sorted range index built from config/data/zip_venues.csv (columns:
+zip_start, zip_end, state, county). Range starts and ends live in two
+``array('I')`` columns and lookups bisect the starts, so a lookup takes a
+microsecond or so. The index is built once per process and shared across
+sessions.
+
+Shipped ranges are the USPS three-digit sectional-center prefixes, which
+give the state but not the county. A row with a county narrows a range to
+that county's court (see config/counties.py); ranges must not overlap.
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import re
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from config.counties import CountyCourt, get_county_court
+from config.settings import ZIP_VENUE_DATA_PATH
+
+# A ZIP or ZIP+4 not embedded in a longer number. The last one in an
+# address wins: street numbers come first, the ZIP code last.
+_ZIP_RE = re.compile(r"(?<!\d)(\d{5})(?:-\d{4})?(?!\d)")
+
+ZipRange = Tuple[int, int, str, str]  # (first ZIP, last ZIP, state, county)
+
+
+class ZipVenueDataError(ValueError):
+    """The ZIP range data is malformed or has overlapping ranges."""
+
+
+@dataclass(frozen=True)
+class Venue:
+    """Where a claim for an address is likely filed."""
+
+    zip_code: str
+    state: str
+    county: str = ""
+
+    @property
+    def court(self) -> Optional[CountyCourt]:
+        return get_county_court(self.state, self.county)
+
+
+def parse_zip(address: str) -> Optional[str]:
+    """The five-digit ZIP code in a free-text address, or None."""
+    if not address:
+        return None
+    matches = _ZIP_RE.findall(address)
+    return matches[-1] if matches else None
+
+
+class ZipVenueIndex:
+    """Non-overlapping ZIP ranges, sorted, with a (state, county) per range."""
+
+    def __init__(self, ranges: Iterable[ZipRange]) -> None:
+        self._starts = array("I")
+        self._ends = array("I")
+        self._venue_ids = array("H")
+        self._venues: List[Tuple[str, str]] = []
+        ids: Dict[Tuple[str, str], int] = {}
+        last_end = -1
+        for start, end, state, county in sorted(ranges):
+            if not 0 <= start <= end <= 99999:
+                raise ZipVenueDataError(f"invalid ZIP range {start:05d}-{end:05d}")
+            if start <= last_end:
+                raise ZipVenueDataError(f"ZIP range {start:05d}-{end:05d} overlaps the previous range")
+            venue = (state, county)
+            if venue not in ids:
+                ids[venue] = len(self._venues)
+                self._venues.append(venue)
+            self._starts.append(start)
+            self._ends.append(end)
+            self._venue_ids.append(ids[venue])
+            last_end = end
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def lookup(self, zip_code: str) -> Optional[Venue]:
+        """The venue for a five-digit ZIP code, or None if it is not covered."""
+        if len(zip_code) != 5 or not zip_code.isdigit():
+            return None
+        value = int(zip_code)
+        i = bisect.bisect_right(self._starts, value) - 1
+        if i < 0 or value > self._ends[i]:
+            return None
+        state, county = self._venues[self._venue_ids[i]]
+        return Venue(zip_code, state, county)
+
+
+def read_zip_ranges(path: str) -> List[ZipRange]:
+    """Read and validate the ZIP range CSV."""
+    ranges: List[ZipRange] = []
+    with open(path, encoding="utf-8", newline="") as fh:
+        for line, row in enumerate(csv.DictReader(fh), start=2):
+            try:
+                start, end = row["zip_start"].strip(), row["zip_end"].strip()
+                state, county = row["state"].strip(), (row["county"] or "").strip()
+            except (KeyError, AttributeError):
+                raise ZipVenueDataError(f"{path}:{line}: expected zip_start, zip_end, state, county") from None
+            if not (len(start) == len(end) == 5 and start.isdigit() and end.isdigit()):
+                raise ZipVenueDataError(f"{path}:{line}: ZIP codes must be five digits")
+            if not (len(state) == 2 and state.isascii() and state.isalpha() and state.isupper()):
+                raise ZipVenueDataError(f"{path}:{line}: state must be two capital letters")
+            ranges.append((int(start), int(end), state, county))
+    return ranges
+
+
+_lock = threading.Lock()
+_index: Optional[ZipVenueIndex] = None
+
+
+def get_zip_index() -> ZipVenueIndex:
+    """The shared index, built on first use."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = ZipVenueIndex(read_zip_ranges(ZIP_VENUE_DATA_PATH))
+    return _index
+
+
+def resolve_venue(address: str) -> Optional[Venue]:
+    """The venue for the ZIP code in ``address``, or None."""
+    zip_code = parse_zip(address)
+    return get_zip_index().lookup(zip_code) if zip_code else None
+
+
+def resolve_intake_venue(intake: Mapping[str, object]) -> Optional[Venue]:
+    """
+    The likely venue for an intake.
+
+    Small claims are usually filed where the respondent lives or does
+    business, so the respondent's address is tried before the claimant's.
+    """
+    for field in ("respondent_address", "claimant_address"):
+        address = intake.get(field)
+        if isinstance(address, str):
+            venue = resolve_venue(address)
+            if venue:
+                return venue
+    return None
@@ -8,59 +8,164 @@ Assembles all documents into a single ZIP download:
   - CaseSummary.json
   - Sources.json
   - ReadMe.txt
+  - ExhibitPacket.pdf (only when image evidence content is supplied)
+
+With ENABLE_BINDER_VERIFICATION on (the default), each PDF is handed to a
+worker thread for verification (export/pdf_verification.py) as soon as it
+is rendered, and checked while the remaining members are generated and
+compressed. ``build_binder`` reports the findings together with how long
+the export waited on verification after the ZIP was complete. A check
+that raises is reported as a violation instead of failing the export.
 """
 
 from __future__ import annotations
 
 import io
+import time
 import zipfile
-from typing import Any, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from config.feature_flags import ENABLE_BINDER_VERIFICATION
+from core.logger import log_warning
 
 from export.case_summary import generate_case_summary_json
 from export.claim_form import generate_claim_form_pdf
 from export.demand_letter import generate_demand_letter_pdf
 from export.evidence_index import generate_evidence_index_pdf
+from export.exhibit_packet import generate_exhibit_packet_pdf, image_exhibits
+from export.pdf_verification import PdfVerification, verify_pdf
 from export.readme_txt import generate_readme_txt
 from export.sources_json import generate_sources_json
 
 
-def generate_binder_zip(
-    intake: Dict[str, Any],
+# Worker threads for PDF verification; inflating and scanning overlaps
+# with rendering and ZIP compression on the calling thread.
+_VERIFY_WORKERS = 2
+
+
+@dataclass(frozen=True)
+class BinderVerification:
+    """Verification results for every PDF in a binder."""
+
+    results: Tuple[PdfVerification, ...]
+    check_ms: float  # summed per-PDF verification time
+    wait_ms: float  # time the export waited for verification after the ZIP was written
+
+    @property
+    def violations(self) -> List[str]:
+        return [v for result in self.results for v in result.violations]
+
+
+@dataclass(frozen=True)
+class BinderBuild:
+    """A generated binder with its timing and (optional) verification."""
+
+    content: bytes
+    build_ms: float
+    verification: Optional[BinderVerification] = None
+
+
+def build_binder(
+    intake: Mapping[str, Any],
     evidence_items: List[Dict[str, Any]],
     state_abbr: str,
-) -> bytes:
+    evidence_files: Optional[Mapping[str, bytes]] = None,
+    verify: bool = ENABLE_BINDER_VERIFICATION,
+    image_derivatives: Optional[Mapping[str, bytes]] = None,
+) -> BinderBuild:
     """
-    Generate the complete binder ZIP package.
-    Returns raw ZIP bytes ready for download.
+    Generate the binder ZIP and, if ``verify``, check each PDF on a
+    worker pool while the ZIP is written. ``image_derivatives`` (optimised
+    copies keyed by ``item_id``) are placed in the exhibit packet in place
+    of the originals.
     """
+    start = time.perf_counter()
     buf = io.BytesIO()
+    pool = ThreadPoolExecutor(max_workers=_VERIFY_WORKERS) if verify else None
+    checks: List[Tuple[str, Future]] = []
+
+    def add_pdf(zf: zipfile.ZipFile, name: str, content: bytes) -> None:
+        if pool is not None:
+            checks.append((name, pool.submit(verify_pdf, name, content)))
+        zf.writestr(name, content)
 
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        # 1. DemandLetter.pdf
-        demand_pdf = generate_demand_letter_pdf(intake, state_abbr)
-        zf.writestr("DemandLetter.pdf", demand_pdf)
+    try:
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            # 1. DemandLetter.pdf
+            add_pdf(zf, "DemandLetter.pdf", generate_demand_letter_pdf(intake, state_abbr))
 
-        # 2. ClaimForm.pdf
-        claim_pdf = generate_claim_form_pdf(intake, state_abbr)
-        zf.writestr("ClaimForm.pdf", claim_pdf)
+            # 2. ClaimForm.pdf
+            add_pdf(zf, "ClaimForm.pdf", generate_claim_form_pdf(intake, state_abbr))
 
-        # 3. EvidenceIndex.pdf
-        evidence_pdf = generate_evidence_index_pdf(evidence_items, state_abbr)
-        zf.writestr("EvidenceIndex.pdf", evidence_pdf)
+            # 3. EvidenceIndex.pdf
+            add_pdf(zf, "EvidenceIndex.pdf", generate_evidence_index_pdf(evidence_items, state_abbr))
 
-        # 4. CaseSummary.json (metadata only)
-        case_json = generate_case_summary_json(intake, evidence_items, state_abbr)
-        zf.writestr("CaseSummary.json", case_json)
+            # 4. CaseSummary.json (metadata only)
+            case_json = generate_case_summary_json(intake, evidence_items, state_abbr)
+            zf.writestr("CaseSummary.json", case_json)
 
-        # 5. Sources.json
-        sources_json = generate_sources_json(state_abbr)
-        zf.writestr("Sources.json", sources_json)
+            # 5. Sources.json
+            sources_json = generate_sources_json(state_abbr)
+            zf.writestr("Sources.json", sources_json)
 
-        # 6. ReadMe.txt
-        readme = generate_readme_txt(state_abbr)
-        zf.writestr("ReadMe.txt", readme)
+            # 6. ReadMe.txt
+            readme = generate_readme_txt(state_abbr)
+            zf.writestr("ReadMe.txt", readme)
 
-    return buf.getvalue()
+            # 7. ExhibitPacket.pdf (optional)
+            if evidence_files and image_exhibits(evidence_items, evidence_files):
+                packet_pdf = generate_exhibit_packet_pdf(
+                    evidence_items, evidence_files, state_abbr, derivatives=image_derivatives,
+                )
+                add_pdf(zf, "ExhibitPacket.pdf", packet_pdf)
+
+        written = time.perf_counter()
+        verification = None
+        if pool is not None:
+            results = tuple(_check_result(name, check) for name, check in checks)
+            verification = BinderVerification(
+                results=results,
+                check_ms=sum(r.elapsed_ms for r in results),
+                wait_ms=(time.perf_counter() - written) * 1000,
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    return BinderBuild(buf.getvalue(), (time.perf_counter() - start) * 1000, verification)
+
+
+def _check_result(file_name: str, check: Future) -> PdfVerification:
+    """The check's result, or a failed verification if the check raised."""
+    try:
+        return check.result()
+    except Exception as exc:
+        log_warning("Verification of %s failed: %s", file_name, type(exc).__name__)
+        return PdfVerification(
+            file_name=file_name,
+            violations=(f"{file_name}: could not be verified ({type(exc).__name__})",),
+            streams_checked=0,
+            chars_checked=0,
+            elapsed_ms=0.0,
+        )
+
+
+def generate_binder_zip(
+    intake: Mapping[str, Any],
+    evidence_items: List[Dict[str, Any]],
+    state_abbr: str,
+    evidence_files: Optional[Mapping[str, bytes]] = None,
+) -> bytes:
+    """
+    Generate the complete binder ZIP package.
+    ``evidence_files`` maps ``item_id`` to uploaded content; image exhibits
+    found there are rendered into ExhibitPacket.pdf.
+    Returns raw ZIP bytes ready for download; use ``build_binder`` for
+    verification results.
+    """
+    return build_binder(intake, evidence_items, state_abbr, evidence_files, verify=False).content
 
 
 EXPECTED_BINDER_FILES = [
@@ -71,3 +176,7 @@ EXPECTED_BINDER_FILES = [
     "Sources.json",
     "ReadMe.txt",
 ]
+
+OPTIONAL_BINDER_FILES = [
+    "ExhibitPacket.pdf",
+]
@@ -13,7 +13,8 @@ from typing import Any, Dict, List
 
 from config.settings import APP_VERSION
 from config.states import get_state, tier_label
-from core.pii_guard import sanitize_export_dict, validate_export_json
+from core.exhibit_order import total_pages
+from core.pii_guard import sanitize_and_validate
 
 
 def generate_case_summary_json(
@@ -41,6 +42,7 @@ def generate_case_summary_json(
         "has_resolution_attempted": bool(intake.get("resolution_attempted")),
         "has_desired_outcome": bool(intake.get("desired_outcome")),
         "evidence_count": len(evidence_items),
+        "total_page_count": total_pages(evidence_items),
         "evidence_items": [
             {
                 "item_id": item.get("item_id", ""),
@@ -49,14 +51,15 @@ def generate_case_summary_json(
                 "file_type": item.get("file_type", ""),
                 "file_size_bytes": item.get("file_size_bytes", 0),
                 "date_added": item.get("date_added", ""),
+                "document_date": item.get("document_date", ""),
+                "page_count": item.get("page_count"),
             }
             for item in evidence_items
         ],
     }
 
     # Safety: sanitize and validate
-    summary = sanitize_export_dict(summary)
-    violations = validate_export_json(summary)
+    summary, violations = sanitize_and_validate(summary)
     if violations:
         raise ValueError(f"Export safety violation: {'; '.join(violations)}")
 
@@ -2,7 +2,8 @@
 Claim form PDF generation for ClaimPilot v2.4.0.
 
 Generates state-specific small claims court forms with proper legal structure:
-- State court header with court name, division, form number
+- State court header with court name, division, form number (the county
+  court when the intake names a county with court data)
 - Case number field
 - Plaintiff / Defendant sections with full contact info
 - Claim details with amount, description, dates
@@ -14,12 +15,13 @@ Generates state-specific small claims court forms with proper legal structure:
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fpdf import FPDF
 
+from config.counties import CountyCourt, get_county_court
 from config.settings import EXPORT_DISCLAIMER
-from config.states import StateCoverage, get_state, tier_label
+from config.states import StateCoverage, get_state, get_state_fragments
 
 
 def _draw_box(pdf: FPDF, x: float, y: float, w: float, h: float) -> None:
@@ -75,8 +77,10 @@ def generate_claim_form_pdf(
 ) -> bytes:
     """Generate a state-specific claim form PDF. Returns PDF bytes."""
     state = get_state(state_abbr)
-    coverage = tier_label(state_abbr) if state else "Unknown"
-    state_name = state.name if state else state_abbr
+    fragments = get_state_fragments(state_abbr)
+    state_name = fragments.state_name if fragments else state_abbr
+    coverage_line = fragments.coverage_line if fragments else "Coverage Status: Unknown"
+    venue = get_county_court(state_abbr, intake.get("venue_county", ""))
 
     pdf = FPDF()
     pdf.add_page()
@@ -84,7 +88,7 @@ def generate_claim_form_pdf(
     pdf.set_margins(15, 15, 15)
 
     # ---- Court header ----
-    _render_court_header(pdf, state, state_name, state_abbr)
+    _render_court_header(pdf, state, state_name, venue)
 
     pdf.ln(3)
 
@@ -211,12 +215,12 @@ def generate_claim_form_pdf(
     pdf.ln(5)
 
     # ---- Filing Instructions ----
-    _render_filing_instructions(pdf, state, state_name, state_abbr)
+    _render_filing_instructions(pdf, state, state_abbr, venue)
 
     # ---- Coverage & Disclaimer footer ----
     pdf.ln(5)
     pdf.set_font("Helvetica", "B", 8)
-    pdf.cell(0, 5, f"Coverage Status: {coverage}", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 5, coverage_line, new_x="LMARGIN", new_y="NEXT")
     pdf.set_font("Helvetica", "I", 7)
     pdf.multi_cell(0, 4, EXPORT_DISCLAIMER)
     pdf.ln(2)
@@ -226,18 +230,22 @@ def generate_claim_form_pdf(
     return pdf.output()
 
 
-def _render_court_header(pdf: FPDF, state: StateCoverage | None, state_name: str, state_abbr: str) -> None:
-    """Render the state-specific court header at the top of the form."""
+def _render_court_header(pdf: FPDF, state: StateCoverage | None, state_name: str, venue: Optional[CountyCourt]) -> None:
+    """Render the state-specific (or county) court header at the top of the form."""
     # Court name
     pdf.set_font("Helvetica", "B", 13)
-    if state and state.court_name:
+    if venue:
+        pdf.cell(0, 8, venue.court_name.upper(), new_x="LMARGIN", new_y="NEXT", align="C")
+    elif state and state.court_name:
         pdf.cell(0, 8, state.court_name.upper(), new_x="LMARGIN", new_y="NEXT", align="C")
     else:
         pdf.cell(0, 8, f"SMALL CLAIMS COURT - {state_name.upper()}", new_x="LMARGIN", new_y="NEXT", align="C")
 
     # Division
     pdf.set_font("Helvetica", "B", 11)
-    if state and state.court_division:
+    if venue and venue.division:
+        pdf.cell(0, 7, venue.division, new_x="LMARGIN", new_y="NEXT", align="C")
+    elif state and state.court_division:
         pdf.cell(0, 7, state.court_division, new_x="LMARGIN", new_y="NEXT", align="C")
     else:
         pdf.cell(0, 7, "Small Claims Division", new_x="LMARGIN", new_y="NEXT", align="C")
@@ -262,7 +270,7 @@ def _render_court_header(pdf: FPDF, state: StateCoverage | None, state_name: str
     pdf.ln(2)
 
 
-def _render_filing_instructions(pdf: FPDF, state: StateCoverage | None, state_name: str, state_abbr: str) -> None:
+def _render_filing_instructions(pdf: FPDF, state: StateCoverage | None, state_abbr: str, venue: Optional[CountyCourt]) -> None:
     """Render state-specific filing instructions at the bottom."""
     _section_header(pdf, "FILING INSTRUCTIONS")
     pdf.ln(2)
@@ -272,7 +280,8 @@ def _render_filing_instructions(pdf: FPDF, state: StateCoverage | None, state_na
 
     if state and state.tier == 1:
         instructions.append(f"1. Complete this form and make {_num_copies(state_abbr)} copies.")
-        instructions.append(f"2. File the original with the clerk of the {state.court_name if state.court_name else 'appropriate court'}.")
+        court = venue.court_name if venue else state.court_name or "appropriate court"
+        instructions.append(f"2. File the original with the clerk of the {court}.")
 
         if state.filing_fee_range:
             instructions.append(f"3. Pay the filing fee ({state.filing_fee_range}). Fee waivers may be available for qualifying individuals.")
@@ -290,7 +299,10 @@ def _render_filing_instructions(pdf: FPDF, state: StateCoverage | None, state_na
     else:
         instructions.append("1. Verify this form meets your local court's requirements.")
         instructions.append("2. Complete any additional required local forms.")
-        instructions.append("3. File with the appropriate court clerk and pay the filing fee.")
+        if venue:
+            instructions.append(f"3. File with the clerk of the {venue.court_name} and pay the filing fee.")
+        else:
+            instructions.append("3. File with the appropriate court clerk and pay the filing fee.")
         instructions.append("4. Serve the defendant according to your state's rules.")
         instructions.append("5. Attend the scheduled hearing with all evidence.")
 
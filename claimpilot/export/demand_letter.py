@@ -6,7 +6,7 @@ Generates a professional pre-litigation demand letter with:
 - Via Certified Mail header
 - Proper salutation and body structure
 - Specific demand amount and deadline
-- Statement of intent to file suit
+- Statement of intent to file suit, naming the county court when known
 - Professional closing with signature block
 """
 
@@ -17,8 +17,9 @@ from typing import Any, Dict
 
 from fpdf import FPDF
 
+from config.counties import get_county_court
 from config.settings import EXPORT_DISCLAIMER
-from config.states import get_state, tier_label
+from config.states import get_state, get_state_fragments
 
 
 def generate_demand_letter_pdf(
@@ -27,8 +28,9 @@ def generate_demand_letter_pdf(
 ) -> bytes:
     """Generate a professional demand letter PDF. Returns PDF bytes."""
     state = get_state(state_abbr)
-    coverage = tier_label(state_abbr) if state else "Unknown"
-    state_name = state.name if state else state_abbr
+    fragments = get_state_fragments(state_abbr)
+    state_name = fragments.state_name if fragments else state_abbr
+    coverage_line = fragments.coverage_line if fragments else "Coverage Status: Unknown"
 
     pdf = FPDF()
     pdf.add_page()
@@ -134,8 +136,10 @@ def generate_demand_letter_pdf(
     pdf.ln(3)
 
     # Paragraph 5: Consequences
-    court_name = ""
-    if state and state.court_name:
+    venue = get_county_court(state_abbr, intake.get("venue_county", ""))
+    if venue:
+        court_name = venue.venue
+    elif state and state.court_name:
         court_name = state.court_name
     else:
         court_name = "the appropriate court"
@@ -180,7 +184,7 @@ def generate_demand_letter_pdf(
     # ---- Disclaimer footer ----
     pdf.ln(10)
     pdf.set_font("Helvetica", "B", 8)
-    pdf.cell(0, 5, f"Coverage Status: {coverage}", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 5, coverage_line, new_x="LMARGIN", new_y="NEXT")
     pdf.set_font("Helvetica", "I", 7)
     pdf.multi_cell(0, 4, EXPORT_DISCLAIMER)
     pdf.ln(2)
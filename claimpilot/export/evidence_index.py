@@ -3,7 +3,8 @@ Evidence index PDF generation for ClaimPilot v2.4.0.
 
 Generates a professional evidence index with:
 - Numbered exhibit list in tabular format
-- File metadata (name, type, size, date)
+- File metadata (name, type, size, document date, upload date)
+- Cumulative (Bates-style) page ranges for exhibits with known page counts
 - Description column
 - Summary statistics
 """
@@ -16,7 +17,8 @@ from typing import Any, Dict, List
 from fpdf import FPDF
 
 from config.settings import EXPORT_DISCLAIMER
-from config.states import get_state, tier_label
+from config.states import TIER2_LABEL, get_state_fragments
+from core.exhibit_order import exhibit_label, format_page_range, page_ranges, total_pages
 
 
 def _format_file_size(size_bytes: int) -> str:
@@ -34,9 +36,8 @@ def generate_evidence_index_pdf(
     state_abbr: str,
 ) -> bytes:
     """Generate an evidence index PDF. Returns PDF bytes."""
-    state = get_state(state_abbr)
-    coverage = tier_label(state_abbr)
-    state_name = state.name if state else state_abbr
+    fragments = get_state_fragments(state_abbr)
+    state_line = fragments.state_line if fragments else f"State of {state_abbr} | Coverage: {TIER2_LABEL}"
 
     pdf = FPDF()
     pdf.add_page("L")  # Landscape for wider table
@@ -46,7 +47,7 @@ def generate_evidence_index_pdf(
     pdf.set_font("Helvetica", "B", 14)
     pdf.cell(0, 10, "EVIDENCE INDEX", new_x="LMARGIN", new_y="NEXT", align="C")
     pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 6, f"State of {state_name} | Coverage: {coverage}", new_x="LMARGIN", new_y="NEXT", align="C")
+    pdf.cell(0, 6, state_line, new_x="LMARGIN", new_y="NEXT", align="C")
     pdf.set_font("Helvetica", "", 9)
     pdf.cell(0, 5, f"Generated by ClaimPilot on {date.today().isoformat()}", new_x="LMARGIN", new_y="NEXT", align="C")
     pdf.ln(3)
@@ -70,12 +71,17 @@ def generate_evidence_index_pdf(
         # Column widths for landscape (total ~257mm usable)
         col_num = 12
         col_exhibit = 25
-        col_label = 50
-        col_filename = 45
+        col_label = 42
+        col_filename = 40
         col_type = 30
         col_size = 22
+        col_pages = 20
+        col_docdate = 22
         col_date = 25
-        col_desc = pdf.w - 20 - col_num - col_exhibit - col_label - col_filename - col_type - col_size - col_date
+        col_desc = (
+            pdf.w - 20 - col_num - col_exhibit - col_label - col_filename
+            - col_type - col_size - col_pages - col_docdate - col_date
+        )
 
         # Table header
         pdf.set_font("Helvetica", "B", 8)
@@ -87,12 +93,15 @@ def generate_evidence_index_pdf(
         pdf.cell(col_filename, 7, " File Name", border=1, fill=True)
         pdf.cell(col_type, 7, " Type", border=1, fill=True)
         pdf.cell(col_size, 7, " Size", border=1, fill=True)
+        pdf.cell(col_pages, 7, " Pages", border=1, fill=True)
+        pdf.cell(col_docdate, 7, " Doc Date", border=1, fill=True)
         pdf.cell(col_date, 7, " Date Added", border=1, fill=True)
         pdf.cell(col_desc, 7, " Description", border=1, fill=True, new_x="LMARGIN", new_y="NEXT")
         pdf.set_text_color(0, 0, 0)
         pdf.set_fill_color(255, 255, 255)
 
         pdf.set_font("Helvetica", "", 8)
+        ranges = page_ranges(evidence_items)
         for i, item in enumerate(evidence_items, 1):
             # Alternate row colors
             if i % 2 == 0:
@@ -100,13 +109,15 @@ def generate_evidence_index_pdf(
             else:
                 pdf.set_fill_color(255, 255, 255)
 
-            exhibit = f"Exhibit {chr(64 + i)}" if i <= 26 else f"Exhibit {i}"
-            label = (item.get("label", "") or "")[:28]
-            filename = (item.get("file_name", "") or "")[:25]
+            exhibit = exhibit_label(i)
+            label = (item.get("label", "") or "")[:24]
+            filename = (item.get("file_name", "") or "")[:22]
             ftype = (item.get("file_type", "") or "").replace("application/", "")[:15]
             size = _format_file_size(item.get("file_size_bytes", 0))
+            doc_date = (item.get("document_date", "") or "")[:10]
             date_str = (item.get("date_added", "") or "")[:10]
-            desc = (item.get("description", "") or "")[:30]
+            pages = format_page_range(ranges[i - 1])
+            desc = (item.get("description", "") or "")[:20]
 
             pdf.cell(col_num, 6, f" {i}", border=1, fill=True)
             pdf.cell(col_exhibit, 6, f" {exhibit}", border=1, fill=True)
@@ -114,6 +125,8 @@ def generate_evidence_index_pdf(
             pdf.cell(col_filename, 6, f" {filename}", border=1, fill=True)
             pdf.cell(col_type, 6, f" {ftype}", border=1, fill=True)
             pdf.cell(col_size, 6, f" {size}", border=1, fill=True)
+            pdf.cell(col_pages, 6, f" {pages}", border=1, fill=True)
+            pdf.cell(col_docdate, 6, f" {doc_date}", border=1, fill=True)
             pdf.cell(col_date, 6, f" {date_str}", border=1, fill=True)
             pdf.cell(col_desc, 6, f" {desc}", border=1, fill=True, new_x="LMARGIN", new_y="NEXT")
 
@@ -131,6 +144,10 @@ def generate_evidence_index_pdf(
         total_size = sum(item.get("file_size_bytes", 0) for item in evidence_items)
         pdf.cell(0, 6, f"Total file size: {_format_file_size(total_size)}", new_x="LMARGIN", new_y="NEXT")
 
+        pages_total = total_pages(evidence_items)
+        if pages_total is not None:
+            pdf.cell(0, 6, f"Total exhibit pages: {pages_total}", new_x="LMARGIN", new_y="NEXT")
+
         types = set(item.get("file_type", "unknown") for item in evidence_items)
         pdf.cell(0, 6, f"File types: {', '.join(sorted(types))}", new_x="LMARGIN", new_y="NEXT")
 
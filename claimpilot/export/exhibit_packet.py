@@ -0,0 +1,163 @@
+"""
+Exhibit packet PDF generation for ClaimPilot v2.4.0.
+
+Places each image exhibit on its own page with an "Exhibit X" stamp and a
+caption. Exhibit designations match EvidenceIndex.pdf, so they are
+assigned by position in the full evidence list, not just among images.
+
+Image decoding and resizing run in parallel ahead of PDF assembly (which
+fpdf2 does single-threaded). Images are placed from the session's
+optimised derivatives when the caller passes them, and otherwise prepared
+through the cached optimiser, so rebuilding a binder does not decode the
+same photos again.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fpdf import FPDF
+from PIL import Image
+
+from config.settings import EXPORT_DISCLAIMER
+from config.states import TIER2_LABEL, get_state_fragments
+from core.exhibit_order import exhibit_label
+from core.image_optimizer import is_image, optimize_image
+
+# Page geometry (mm, A4 portrait)
+_MARGIN = 15
+_HEADER_H = 28
+_CAPTION_H = 36
+
+
+def image_exhibits(
+    evidence_items: Sequence[Mapping[str, Any]],
+    evidence_files: Mapping[str, bytes],
+) -> List[Tuple[int, Mapping[str, Any]]]:
+    """Return ``(position, item)`` for image exhibits that have content."""
+    return [
+        (position, item)
+        for position, item in enumerate(evidence_items, 1)
+        if item.get("item_id") in evidence_files
+        and is_image(item.get("file_name", ""), item.get("file_type", ""))
+    ]
+
+
+def _prepare(item_id: str, data: bytes, derivative: Optional[bytes] = None) -> Optional[bytes]:
+    """Decode and fit one image for placement; None if it can't be decoded."""
+    try:
+        prepared = derivative if derivative is not None else optimize_image(item_id, data).content
+        # Verify the result decodes so assembly never fails mid-document.
+        with Image.open(io.BytesIO(prepared)) as img:
+            img.verify()
+        return prepared
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def prepare_images(
+    exhibits: Sequence[Tuple[int, Mapping[str, Any]]],
+    evidence_files: Mapping[str, bytes],
+    max_workers: Optional[int] = None,
+    derivatives: Optional[Mapping[str, bytes]] = None,
+) -> Dict[str, Optional[bytes]]:
+    """Decode and resize all exhibit images in parallel, reusing ``derivatives``."""
+    if not exhibits:
+        return {}
+    derivatives = derivatives or {}
+    workers = max_workers or min(len(exhibits), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            item["item_id"]: pool.submit(
+                _prepare, item["item_id"], evidence_files[item["item_id"]], derivatives.get(item["item_id"]),
+            )
+            for _, item in exhibits
+        }
+        return {item_id: future.result() for item_id, future in futures.items()}
+
+
+def generate_exhibit_packet_pdf(
+    evidence_items: Sequence[Mapping[str, Any]],
+    evidence_files: Mapping[str, bytes],
+    state_abbr: str,
+    derivatives: Optional[Mapping[str, bytes]] = None,
+) -> bytes:
+    """
+    Generate ExhibitPacket.pdf with one stamped page per image exhibit.
+    ``derivatives`` maps ``item_id`` to an already optimised copy to place
+    instead of the original.
+    """
+    fragments = get_state_fragments(state_abbr)
+    state_line = fragments.state_line if fragments else f"State of {state_abbr} | Coverage: {TIER2_LABEL}"
+
+    exhibits = image_exhibits(evidence_items, evidence_files)
+    prepared = prepare_images(exhibits, evidence_files, derivatives=derivatives)
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=False)
+    pdf.set_margins(_MARGIN, _MARGIN, _MARGIN)
+
+    if not exhibits:
+        pdf.add_page()
+        pdf.set_font("Helvetica", "I", 11)
+        pdf.cell(0, 7, "No image exhibits have been submitted.", new_x="LMARGIN", new_y="NEXT")
+        _footer(pdf)
+
+    for position, item in exhibits:
+        pdf.add_page()
+        stamp = exhibit_label(position).upper()
+
+        # ---- Stamp (top right) ----
+        pdf.set_font("Helvetica", "B", 16)
+        stamp_w = pdf.get_string_width(stamp) + 12
+        pdf.set_xy(pdf.w - _MARGIN - stamp_w, _MARGIN)
+        pdf.set_line_width(0.8)
+        pdf.cell(stamp_w, 12, stamp, border=1, align="C")
+        pdf.set_line_width(0.2)
+
+        # ---- Header (top left) ----
+        pdf.set_xy(_MARGIN, _MARGIN)
+        pdf.set_font("Helvetica", "", 8)
+        pdf.cell(0, 5, state_line, new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 5, f"Generated by ClaimPilot on {date.today().isoformat()}", new_x="LMARGIN", new_y="NEXT")
+
+        # ---- Image ----
+        box_y = _MARGIN + _HEADER_H
+        box_w = pdf.w - 2 * _MARGIN
+        box_h = pdf.h - box_y - _MARGIN - _CAPTION_H
+        content = prepared.get(item["item_id"])
+        if content is not None:
+            pdf.image(io.BytesIO(content), x=_MARGIN, y=box_y, w=box_w, h=box_h, keep_aspect_ratio=True)
+        else:
+            pdf.rect(_MARGIN, box_y, box_w, box_h)
+            pdf.set_xy(_MARGIN, box_y + box_h / 2 - 4)
+            pdf.set_font("Helvetica", "I", 10)
+            pdf.cell(box_w, 8, "Image could not be rendered. See the original file.", align="C")
+
+        # ---- Caption ----
+        pdf.set_xy(_MARGIN, pdf.h - _MARGIN - _CAPTION_H + 2)
+        pdf.set_font("Helvetica", "B", 10)
+        pdf.cell(0, 6, f"{exhibit_label(position)}: {item.get('label', '') or ''}", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", "", 8)
+        details = f"File: {item.get('file_name', '')}"
+        if item.get("document_date"):
+            details += f" | Taken: {item['document_date'][:10]}"
+        pdf.cell(0, 5, details, new_x="LMARGIN", new_y="NEXT")
+        description = item.get("description", "") or ""
+        if description:
+            pdf.multi_cell(0, 4, description[:300])
+
+        _footer(pdf)
+
+    return pdf.output()
+
+
+def _footer(pdf: FPDF) -> None:
+    """Render the export disclaimer along the bottom edge of the page."""
+    pdf.set_xy(_MARGIN, pdf.h - 12)
+    pdf.set_font("Helvetica", "I", 6)
+    pdf.multi_cell(0, 2.5, EXPORT_DISCLAIMER)
@@ -0,0 +1,92 @@
+"""
+Post-render verification of generated PDFs for ClaimPilot v2.4.0.
+
+``validate_export_json`` guards CaseSummary.json; this module checks the
+PDFs. Each text-bearing stream is inflated incrementally (see
+core/pdf_inspector) and its shown text is extracted chunk by chunk, so no
+stream is held in memory whole. The text is run through the evidence PII
+scanner plus the export binary checks:
+
+  - Social Security, account and card numbers (core/pii_scanner)
+  - base64-encoded binary runs (core/pii_guard.is_base64_binary)
+  - raw PDF content, in the text or embedded anywhere past the header
+
+Image streams are skipped, so ExhibitPacket.pdf costs about as much to
+check as a text-only PDF. The binder runs these checks on a worker pool
+while it compresses the ZIP (see export/binder.py).
+
+This module has no Streamlit dependency.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from core.pdf_inspector import ContentTextDecoder, iter_stream_chunks, iter_streams
+from core.pii_guard import is_base64_binary
+from core.pii_scanner import FINDING_LABELS, PiiScanner
+
+_PDF_HEADER = b"%PDF-"
+
+
+@dataclass(frozen=True)
+class PdfVerification:
+    """Outcome of verifying one generated PDF."""
+
+    file_name: str
+    violations: Tuple[str, ...]
+    streams_checked: int
+    chars_checked: int
+    elapsed_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+
+def verify_pdf(file_name: str, content: bytes) -> PdfVerification:
+    """Check one rendered PDF for leaked PII numbers, base64 binary and raw PDF data."""
+    start = time.perf_counter()
+    violations: List[str] = []
+    scanner = PiiScanner()
+    streams = 0
+    base64_runs = 0
+    raw_pdf = content.find(_PDF_HEADER, 1) >= 0
+
+    def check_text(text: str) -> None:
+        nonlocal raw_pdf, base64_runs
+        scanner.feed(text)
+        if "%PDF-" in text:
+            raw_pdf = True
+        base64_runs += sum(1 for token in text.split() if len(token) >= 40 and is_base64_binary(token))
+
+    for stream in iter_streams(content):
+        if not stream.may_contain_text:
+            continue
+        streams += 1
+        # Text comes back one whole text object at a time, so no word or
+        # number is split between calls.
+        decoder = ContentTextDecoder()
+        for chunk in iter_stream_chunks(content, stream):
+            text = decoder.feed(chunk)
+            if text:
+                check_text(text)
+        check_text(decoder.finish())
+        scanner.feed("\n")
+    scanner.finish()
+
+    for finding in scanner.findings:
+        violations.append(f"{file_name}: {FINDING_LABELS[finding.kind]} {finding.preview}")
+    if base64_runs:
+        violations.append(f"{file_name}: contains base64 binary data")
+    if raw_pdf:
+        violations.append(f"{file_name}: contains raw PDF bytes")
+    return PdfVerification(
+        file_name=file_name,
+        violations=tuple(violations),
+        streams_checked=streams,
+        chars_checked=scanner.chars_scanned,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
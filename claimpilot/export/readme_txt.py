@@ -35,6 +35,8 @@ CONTENTS OF THIS PACKAGE
 5. Sources.json        - Source URLs, quality ratings, and review dates for
                          the legal information used in this package.
 6. ReadMe.txt          - This file.
+7. ExhibitPacket.pdf   - One stamped page per photo exhibit (included only
+                         when image evidence was uploaded).
 
 DISCLAIMERS
 -----------
@@ -20,6 +20,7 @@ class IntakeData:
     respondent_name: str = ""
     respondent_address: str = ""
     state: str = ""
+    venue_county: str = ""  # county whose court hears the claim, if known
     claim_type: str = "small_claims"
     incident_date: Optional[date] = None
     amount_claimed: float = 0.0
@@ -36,6 +37,7 @@ class IntakeData:
             "respondent_name": self.respondent_name,
             "respondent_address": self.respondent_address,
             "state": self.state,
+            "venue_county": self.venue_county,
             "claim_type": self.claim_type,
             "incident_date": self.incident_date.isoformat() if self.incident_date else None,
             "amount_claimed": self.amount_claimed,
@@ -58,6 +60,7 @@ class IntakeData:
             respondent_name=d.get("respondent_name", ""),
             respondent_address=d.get("respondent_address", ""),
             state=d.get("state", ""),
+            venue_county=d.get("venue_county", ""),
             claim_type=d.get("claim_type", "small_claims"),
             incident_date=incident,
             amount_claimed=float(d.get("amount_claimed", 0)),
@@ -4,13 +4,21 @@ Evidence models for ClaimPilot v2.4.0.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Iterator, List, Optional
 
 
-@dataclass
-class EvidenceItem:
-    """A single piece of evidence attached to a claim."""
+@dataclass(frozen=True, slots=True)
+class EvidenceItem(Mapping):
+    """
+    A single piece of evidence attached to a claim.
+
+    Records are immutable and slotted (no per-instance ``__dict__``), so the
+    session can hand them out without defensive copies. They also implement
+    the read-only mapping protocol, so code written against evidence dicts
+    (``item["label"]``, ``item.get("page_count")``) works unchanged.
+    """
 
     item_id: str  # Unique identifier
     label: str  # User-facing label
@@ -19,6 +27,24 @@ class EvidenceItem:
     file_size_bytes: int
     description: str = ""
     date_added: str = ""  # ISO-8601
+    document_date: str = ""  # ISO-8601 creation date from file metadata
+    page_count: Optional[int] = None  # Known for PDFs and images
+    perceptual_hash: str = ""  # 64-bit dHash as hex; images only
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELD_NAMES)
+
+    def __len__(self) -> int:
+        return len(_FIELD_NAMES)
+
+    def replace(self, **changes: Any) -> EvidenceItem:
+        """Return a copy with ``changes`` applied."""
+        return replace(self, **changes)
 
     def to_metadata_dict(self) -> Dict[str, Any]:
         """Return metadata only -- never include file content."""
@@ -30,10 +56,15 @@ class EvidenceItem:
             "file_size_bytes": self.file_size_bytes,
             "description": self.description,
             "date_added": self.date_added,
+            "document_date": self.document_date,
+            "page_count": self.page_count,
+            "perceptual_hash": self.perceptual_hash,
         }
 
     @classmethod
-    def from_dict(cls, d: Dict[str, Any]) -> EvidenceItem:
+    def from_dict(cls, d: Mapping) -> EvidenceItem:
+        if isinstance(d, cls):
+            return d
         return cls(
             item_id=d.get("item_id", ""),
             label=d.get("label", ""),
@@ -42,9 +73,16 @@ class EvidenceItem:
             file_size_bytes=int(d.get("file_size_bytes", 0)),
             description=d.get("description", ""),
             date_added=d.get("date_added", ""),
+            document_date=d.get("document_date", ""),
+            page_count=d.get("page_count"),
+            perceptual_hash=d.get("perceptual_hash", ""),
         )
 
 
+_FIELD_NAMES = tuple(f.name for f in fields(EvidenceItem))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+
+
 def evidence_list_metadata(items: List[EvidenceItem]) -> List[Dict[str, Any]]:
     """Convert a list of evidence items to metadata-only dicts."""
     return [item.to_metadata_dict() for item in items]
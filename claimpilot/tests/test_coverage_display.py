@@ -137,3 +137,355 @@ class TestExportCoverageStatus:
                     assert src["last_reviewed_iso"] is not None, (
                         f"Tier 1 state {abbr} official source missing review date"
                     )
+
+
+class TestStateRegistry:
+    """The compiled state registry is read-only and agrees with the helpers."""
+
+    def test_all_states_is_read_only(self):
+        with pytest.raises(TypeError):
+            ALL_STATES["ZZ"] = ALL_STATES["CA"]
+
+    def test_sources_are_tuples(self):
+        for abbr, state in ALL_STATES.items():
+            assert isinstance(state.sources, tuple), abbr
+
+    def test_lookups_ignore_case(self):
+        for spelling in ("ca", "Ca", "cA", "CA"):
+            assert get_state(spelling) is ALL_STATES["CA"]
+            assert is_tier1(spelling)
+            assert tier_label(spelling) == "Supported (Tier 1)"
+
+    def test_unknown_state(self):
+        from config.states import get_state_fragments
+
+        assert get_state("ZZ") is None
+        assert not is_tier1("ZZ")
+        assert tier_label("ZZ") == "Guidance-only (Tier 2)"
+        assert get_state_fragments("ZZ") is None
+
+    def test_fragments_match_labels(self):
+        from config.states import get_state_fragments
+
+        for abbr, state in ALL_STATES.items():
+            fragments = get_state_fragments(abbr.lower())
+            assert fragments.state_name == state.name
+            assert fragments.coverage == tier_label(abbr)
+            assert fragments.coverage_line == f"Coverage Status: {tier_label(abbr)}"
+            assert fragments.state_line == f"State of {state.name} | Coverage: {tier_label(abbr)}"
+
+
+@pytest.fixture
+def state_data_copy(tmp_path, monkeypatch):
+    """A writable copy of the shipped state data, made current for one test."""
+    from config import states
+    from config.settings import STATE_DATA_PATH
+    from config.states import reload_state_data
+
+    monkeypatch.setattr(states, "_next_check", 0.0)
+
+    path = tmp_path / "states.json"
+    with open(STATE_DATA_PATH, encoding="utf-8") as fh:
+        document = json.load(fh)
+    path.write_text(json.dumps(document), encoding="utf-8")
+    reload_state_data(str(path))
+    yield path, document
+    reload_state_data(STATE_DATA_PATH)
+
+
+def _rewrite(path, document):
+    path.write_text(json.dumps(document), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestStateDataFile:
+    """State data is loaded from a versioned JSON file and validated."""
+
+    def test_shipped_file_is_valid(self):
+        from config.settings import STATE_DATA_PATH
+        from config.states import load_state_data, state_data_version
+
+        registry = load_state_data(STATE_DATA_PATH)
+        assert registry.version == state_data_version()
+        assert sorted(registry.tier1) == TIER1_STATES
+        assert set(registry.states) == set(ALL_STATES)
+
+    @pytest.mark.parametrize(
+        "mutate, message",
+        [
+            (lambda d: d.update(schema=99), "unsupported schema"),
+            (lambda d: d["states"][0].update(fee="$10"), "unknown field"),
+            (lambda d: d["states"][0].update(tier=3), "tier must be 1 or 2"),
+            (lambda d: d["states"][-1].update(official_form_url="https://example.com/form.pdf"), "Tier 2"),
+            (lambda d: d["states"].append(dict(d["states"][0])), "duplicate abbreviation"),
+            (lambda d: d["states"][0]["sources"][0].update(last_reviewed_iso="15/12/2025"), "ISO-8601"),
+            (lambda d: d["states"][0].update(max_claim_amount="12500"), "wrong type"),
+        ],
+    )
+    def test_invalid_documents_rejected(self, mutate, message):
+        from config.settings import STATE_DATA_PATH
+        from config.states import StateDataError, parse_state_data
+
+        with open(STATE_DATA_PATH, encoding="utf-8") as fh:
+            document = json.load(fh)
+        mutate(document)
+        with pytest.raises(StateDataError, match=message):
+            parse_state_data(document)
+
+    def test_invalid_json_rejected(self, tmp_path):
+        from config.states import StateDataError, load_state_data
+
+        path = tmp_path / "states.json"
+        path.write_text("{not json", encoding="utf-8")
+        with pytest.raises(StateDataError, match="invalid JSON"):
+            load_state_data(str(path))
+
+
+class TestStateDataReload:
+    """Edits to the data file are picked up without a restart."""
+
+    def test_reload_on_change(self, state_data_copy):
+        from config.states import maybe_reload_state_data, state_data_version
+
+        path, document = state_data_copy
+        assert maybe_reload_state_data(now=1e12) is False  # unchanged
+
+        document["version"] = 2
+        document["states"][0]["filing_fee_range"] = "$35 - $80"
+        _rewrite(path, document)
+        assert maybe_reload_state_data(now=2e12) is True
+        assert state_data_version() == 2
+        assert get_state("CA").filing_fee_range == "$35 - $80"
+        assert ALL_STATES["CA"] is get_state("CA")
+
+    def test_checks_are_throttled(self, state_data_copy):
+        from config.settings import STATE_DATA_CHECK_S
+        from config.states import maybe_reload_state_data
+
+        path, document = state_data_copy
+        maybe_reload_state_data(now=1e12)
+        document["version"] = 2
+        _rewrite(path, document)
+        assert maybe_reload_state_data(now=1e12 + STATE_DATA_CHECK_S / 2) is False
+        assert maybe_reload_state_data(now=1e12 + STATE_DATA_CHECK_S) is True
+
+    def test_invalid_edit_keeps_current_registry(self, state_data_copy):
+        from config.states import StateDataError, maybe_reload_state_data
+
+        path, document = state_data_copy
+        before = get_state("CA")
+        document["states"][0]["tier"] = 7
+        _rewrite(path, document)
+        with pytest.raises(StateDataError):
+            maybe_reload_state_data(now=1e12)
+        assert get_state("CA") is before
+        # Reported once per change, not on every check.
+        assert maybe_reload_state_data(now=2e12) is False
+
+    def test_listeners_run_after_swap(self, state_data_copy):
+        from config.states import add_reload_listener, remove_reload_listener, reload_state_data
+
+        path, document = state_data_copy
+        seen = []
+
+        def listener(registry):
+            seen.append((registry.version, get_state("CA").notes))
+
+        document["version"] = 3
+        document["states"][0]["notes"] = "Updated notes."
+        _rewrite(path, document)
+        add_reload_listener(listener)
+        try:
+            reload_state_data()
+        finally:
+            remove_reload_listener(listener)
+        assert seen == [(3, "Updated notes.")]
+
+    def test_tier_lists_follow_reload(self, state_data_copy):
+        from config import states
+
+        path, document = state_data_copy
+        oregon = next(s for s in document["states"] if s["abbreviation"] == "OR")
+        oregon["tier"] = 1
+        _rewrite(path, document)
+        states.reload_state_data()
+        assert "OR" in states.TIER1_STATES
+        assert "OR" not in states.TIER2_STATES
+        assert tier_label("or") == "Supported (Tier 1)"
+        assert states.get_state_fragments("OR").coverage == "Supported (Tier 1)"
+
+
+class TestCountyCourts:
+    """County court data is read from a compact memory-mapped index."""
+
+    def test_data_file_matches_csv(self):
+        from config.counties import encode_county_data, read_county_csv
+        from config.settings import COUNTY_DATA_CSV_PATH, COUNTY_DATA_PATH
+
+        with open(COUNTY_DATA_PATH, "rb") as fh:
+            shipped = fh.read()
+        assert shipped == encode_county_data(read_county_csv(COUNTY_DATA_CSV_PATH)), (
+            "county_courts.bin is stale; rebuild with python -m config.counties"
+        )
+
+    def test_seeded_states(self):
+        from config.counties import counties_for_state
+
+        assert len(counties_for_state("CA")) == 58
+        assert len(counties_for_state("fl")) == 67
+        assert counties_for_state("TX") == ()
+        assert counties_for_state("") == ()
+
+    def test_counties_are_in_tier1_states(self):
+        from config.counties import get_county_index
+
+        index = get_county_index()
+        for abbr in ALL_STATES:
+            if index.counties(abbr):
+                assert is_tier1(abbr)
+
+    def test_lookup_normalises_names(self):
+        from config.counties import get_county_court
+
+        court = get_county_court("ca", "San Luis Obispo County")
+        assert court.court_name == "Superior Court of California, County of San Luis Obispo"
+        assert get_county_court("FL", "st johns").county == "St. Johns"
+        assert get_county_court("FL", "Miami-Dade").division == "Small Claims Division"
+        assert get_county_court("CA", "Miami-Dade") is None
+        assert get_county_court("", "Alameda") is None
+
+    def test_round_trip_and_bad_data(self, tmp_path):
+        from config.counties import CountyCourt, CountyDataError, CountyIndex, build_county_data
+
+        csv_path = tmp_path / "courts.csv"
+        csv_path.write_text(
+            "state,county,court_name,division\n"
+            "NY,Kings,Civil Court of the City of New York,Small Claims Part\n"
+            "NY,Albany,Albany City Court,\n",
+            encoding="utf-8",
+        )
+        out = tmp_path / "courts.bin"
+        assert build_county_data(str(csv_path), str(out)) == 2
+        index = CountyIndex.open(str(out))
+        assert [c.county for c in index.counties("NY")] == ["Albany", "Kings"]
+        assert index.lookup("NY", "kings") == CountyCourt(
+            "NY", "Kings", "Civil Court of the City of New York", "Small Claims Part"
+        )
+        assert index.lookup("NY", "Albany").venue == "the Albany City Court"
+
+        with pytest.raises(CountyDataError):
+            CountyIndex(b"XXXX" + out.read_bytes()[4:])
+        with pytest.raises(CountyDataError):
+            CountyIndex(out.read_bytes()[:20])
+
+        csv_path.write_text("state,county,court_name,division\nNY,Kings,A,\nNY,Kings County,B,\n", encoding="utf-8")
+        with pytest.raises(CountyDataError, match="duplicate"):
+            build_county_data(str(csv_path), str(out))
+
+
+class TestVenueResolver:
+    """Addresses resolve to a state (and county, where known) by ZIP code."""
+
+    @pytest.mark.parametrize(
+        "address, expected",
+        [
+            ("123 Main St\nAnytown, CA 90210", "90210"),
+            ("12345 Ocean Dr, Miami, FL 33139-1234", "33139"),
+            ("PO Box 1234567, Austin TX", None),
+            ("", None),
+        ],
+    )
+    def test_parse_zip(self, address, expected):
+        from core.venue import parse_zip
+
+        assert parse_zip(address) == expected
+
+    def test_every_state_has_a_zip_range(self):
+        from core.venue import get_zip_index
+
+        index = get_zip_index()
+        states = {index.lookup(f"{z:05d}").state for z in range(0, 100000, 100) if index.lookup(f"{z:05d}")}
+        assert states == set(ALL_STATES)
+
+    def test_lookup(self):
+        from core.venue import resolve_venue
+
+        assert resolve_venue("Anytown, CA 90210").state == "CA"
+        assert resolve_venue("Austin, TX 73301").state == "TX"
+        assert resolve_venue("APO AE 09001") is None
+
+    def test_respondent_address_preferred(self, sample_intake):
+        from core.venue import resolve_intake_venue
+
+        intake = {**sample_intake, "claimant_address": "Anytown, CA 90210", "respondent_address": "Portland, OR 97201"}
+        assert resolve_intake_venue(intake).state == "OR"
+        intake["respondent_address"] = "Somewhere without a ZIP"
+        assert resolve_intake_venue(intake).state == "CA"
+
+    def test_county_ranges(self):
+        from core.venue import ZipVenueDataError, ZipVenueIndex
+
+        index = ZipVenueIndex([(94500, 94599, "CA", "Alameda"), (90000, 94499, "CA", "")])
+        venue = index.lookup("94501")
+        assert (venue.state, venue.county) == ("CA", "Alameda")
+        assert venue.court.court_name == "Superior Court of California, County of Alameda"
+        assert index.lookup("90210").court is None
+        assert index.lookup("94600") is None
+        with pytest.raises(ZipVenueDataError, match="overlaps"):
+            ZipVenueIndex([(90000, 96199, "CA", ""), (94500, 94599, "CA", "Alameda")])
+
+
+class TestStateSelectorOptions:
+    """Selector options are built once and rebuilt when state data reloads."""
+
+    def test_options_are_cached(self):
+        from components.state_selector import selector_options
+
+        assert selector_options() is selector_options()
+
+    def test_options_sorted_by_name_with_placeholder_first(self):
+        from components.state_selector import selector_options
+
+        options = selector_options()
+        names = [ALL_STATES[options.abbr_by_label[label]].name for label in options.labels[1:]]
+        assert options.labels[0].startswith("--")
+        assert names == sorted(names)
+        assert len(options.labels) == len(ALL_STATES) + 1
+
+    def test_index_maps_agree(self):
+        from components.state_selector import selector_options
+
+        options = selector_options()
+        for abbr, i in options.index_by_abbr.items():
+            label = options.labels[i]
+            assert options.abbr_by_label[label] == abbr
+            assert f"({abbr})" in label
+            assert tier_label(abbr) in label
+
+    def test_rebuilt_after_reload(self, state_data_copy):
+        from components.state_selector import selector_options
+        from config.states import reload_state_data
+
+        before = selector_options()
+        path, document = state_data_copy
+        oregon = next(s for s in document["states"] if s["abbreviation"] == "OR")
+        oregon["tier"] = 1
+        _rewrite(path, document)
+        reload_state_data()
+        after = selector_options()
+        assert after is not before
+        assert after.labels[after.index_by_abbr["OR"]] == "Oregon (OR) — Supported (Tier 1)"
+
+    def test_options_built_from_a_replaced_registry_are_rebuilt(self, state_data_copy):
+        import components.state_selector as state_selector
+        from config import states
+
+        old = states.REGISTRY
+        states.reload_state_data()
+        # Options stored from the old registry after the reload, e.g. by a
+        # render that read it just before the swap.
+        state_selector._options = state_selector._build_options(old)
+        options = state_selector.selector_options()
+        assert options.registry is states.REGISTRY
+        assert options is state_selector.selector_options()
@@ -0,0 +1,866 @@
+"""
+Evidence processing tests — optimisation and analysis stages.
+
+Acceptance criteria:
+- Image optimisation keeps originals and reports bytes saved / time spent
+- Stages are cached by content hash and tolerate undecodable input
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.image_optimizer import (
+    clear_cache,
+    is_image,
+    max_pixels,
+    optimize_image,
+    optimize_images,
+)
+
+
+def _make_jpeg(width: int = 3000, height: int = 2000, seed: int = 0) -> bytes:
+    """Create a noisy JPEG that compresses poorly, like a phone photo."""
+    img = Image.effect_noise((width, height), 60 + seed).convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=95)
+    return buf.getvalue()
+
+
+class TestImageOptimizer:
+    """Images are fitted to print resolution and recompressed."""
+
+    def setup_method(self):
+        clear_cache()
+
+    def test_large_photo_is_downscaled(self):
+        original = _make_jpeg()
+        result = optimize_image("ev-1", original)
+        assert result.optimized_size < result.original_size
+        assert result.bytes_saved > 0
+        assert result.elapsed_ms >= 0
+        with Image.open(io.BytesIO(result.content)) as img:
+            bound = max_pixels()
+            # Landscape input: long side bounded by the long print dimension
+            assert img.width <= bound[1]
+            assert img.height <= bound[0]
+
+    def test_small_image_is_returned_unchanged(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (20, 20), (255, 0, 0)).save(buf, format="PNG")
+        original = buf.getvalue()
+        result = optimize_image("ev-1", original)
+        assert result.content == original
+        assert result.bytes_saved == 0
+
+    def test_second_run_is_cached(self):
+        original = _make_jpeg(1600, 1200)
+        first = optimize_image("ev-1", original)
+        second = optimize_image("ev-2", original)
+        assert not first.cached
+        assert second.cached
+        assert second.content == first.content
+
+    def test_batch_skips_undecodable_items(self):
+        results = optimize_images({
+            "good": _make_jpeg(1600, 1200),
+            "bad": b"not an image",
+        })
+        assert "good" in results
+        assert "bad" not in results
+
+    def test_undecodable_upload_is_attempted_once(self, monkeypatch):
+        import components.evidence_manager as evidence_manager
+        from core import data_manager
+        data_manager.delete_all_user_data()
+        data_manager.add_evidence_items([
+            ({"item_id": "good", "label": "Photo", "file_name": "good.jpg", "file_type": "image/jpeg"},
+             _make_jpeg(1600, 1200)),
+            ({"item_id": "bad", "label": "Broken", "file_name": "bad.jpg", "file_type": "image/jpeg"},
+             b"not an image"),
+        ])
+        attempts = []
+
+        def counting(images, **kwargs):
+            attempts.append(sorted(images))
+            return optimize_images(images, **kwargs)
+
+        monkeypatch.setattr(evidence_manager, "optimize_images", counting)
+        evidence_manager._optimize_new_images()
+        evidence_manager._optimize_new_images()
+        assert attempts == [["bad", "good"]]
+        assert set(data_manager.get_evidence_derivatives()) == {"good"}
+        assert data_manager.get_evidence_derivative_failures() == {"bad"}
+        data_manager.delete_all_user_data()
+
+    def test_is_image_by_type_or_extension(self):
+        assert is_image("photo.JPG")
+        assert is_image("scan", "image/png")
+        assert not is_image("contract.pdf", "application/pdf")
+
+
+class TestNearDuplicateDetection:
+    """Bursts of near-identical photos are clustered via perceptual hashes."""
+
+    def _photo(self, shade: int, noise_seed: int = 0) -> bytes:
+        img = Image.linear_gradient("L").resize((640, 480)).convert("RGB")
+        overlay = Image.new("RGB", img.size, (shade, 0, 0))
+        img = Image.blend(img, overlay, 0.3)
+        if noise_seed:
+            img.putpixel((noise_seed, noise_seed), (255, 255, 255))
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=90)
+        return buf.getvalue()
+
+    def test_similar_photos_hash_close(self):
+        from core.perceptual_hash import dhash, hamming
+        a = dhash(self._photo(100))
+        b = dhash(self._photo(100, noise_seed=5))
+        assert hamming(a, b) <= 4
+
+    def test_hash_round_trip(self):
+        from core.perceptual_hash import format_hash, parse_hash
+        assert parse_hash(format_hash(0xDEADBEEF)) == 0xDEADBEEF
+        assert parse_hash("") is None
+
+    def test_bk_tree_search_matches_brute_force(self):
+        import random
+        from core.perceptual_hash import BKTree, hamming
+        rng = random.Random(7)
+        values = [rng.getrandbits(64) for _ in range(500)]
+        tree = BKTree()
+        for i, v in enumerate(values):
+            tree.add(v, f"ev-{i}")
+        probe = values[42] ^ 0b1011
+        expected = {f"ev-{i}" for i, v in enumerate(values) if hamming(v, probe) <= 12}
+        found = {item_id for item_id, _ in tree.search(probe, 12)}
+        assert found == expected
+
+    def test_index_clusters_neighbours(self):
+        from core.perceptual_hash import NearDuplicateIndex
+        index = NearDuplicateIndex(max_distance=3)
+        index.add("a", 0b0000)
+        index.add("far", (1 << 64) - 1)
+        assert index.add("b", 0b0001) == ["a"]
+        index.add("c", 0b0011)
+        assert index.clusters() == [["a", "b", "c"]]
+
+    def test_duplicate_add_is_ignored(self):
+        from core.perceptual_hash import NearDuplicateIndex
+        index = NearDuplicateIndex()
+        index.add("a", 1)
+        assert index.add("a", 1) == []
+        assert len(index) == 1
+
+    def test_decompression_bomb_is_skipped_not_raised(self):
+        from components.evidence_manager import _index_image
+        item = {"item_id": "ev-1"}
+        _index_image(item, _huge_png_header())
+        assert "perceptual_hash" not in item
+
+
+def _huge_png_header(width: int = 20000, height: int = 20000) -> bytes:
+    """A PNG with an empty IDAT: Pillow reads the size without decoding."""
+    import struct
+    import zlib
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", b"") + chunk(b"IEND", b"")
+
+
+class TestMetadataExtraction:
+    """Creation dates come from file headers, not the upload time."""
+
+    def test_exif_capture_date(self):
+        from core.metadata_extractor import extract_document_date
+        exif = Image.Exif()
+        exif.get_ifd(0x8769)[36867] = "2025:06:14 09:30:00"
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, format="JPEG", exif=exif)
+        assert extract_document_date(buf.getvalue(), "photo.jpg") == "2025-06-14T09:30:00"
+
+    def test_image_without_exif(self):
+        from core.metadata_extractor import extract_document_date
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, format="PNG")
+        assert extract_document_date(buf.getvalue(), "scan.png") is None
+
+    def test_pdf_creation_date(self):
+        from core.metadata_extractor import extract_document_date
+        pdf = b"%PDF-1.4\n" + b"x" * 200_000 + b"\n<< /CreationDate (D:20250301120000Z) >>\n%%EOF"
+        assert extract_document_date(pdf, "letter.pdf") == "2025-03-01T12:00:00"
+
+    def test_pdf_date_only_precision(self):
+        from core.metadata_extractor import pdf_document_date
+        assert pdf_document_date(b"%PDF-1.4 << /ModDate (D:2024) >>") == "2024-01-01T00:00:00"
+
+    def test_docx_core_properties(self):
+        import zipfile
+        from core.metadata_extractor import extract_document_date
+        core = (
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            'xmlns:dcterms="http://purl.org/dc/terms/">'
+            '<dcterms:created>2025-05-20T08:15:00Z</dcterms:created></cp:coreProperties>'
+        )
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("docProps/core.xml", core)
+            zf.writestr("word/document.xml", "<w:document/>")
+        assert extract_document_date(buf.getvalue(), "notes.docx") == "2025-05-20T08:15:00"
+
+    def test_unknown_or_corrupt_input(self):
+        from core.metadata_extractor import extract_document_date
+        assert extract_document_date(b"hello", "notes.txt") is None
+        assert extract_document_date(b"not a zip", "notes.docx") is None
+
+    @staticmethod
+    def _core_docx(created: str) -> bytes:
+        import zipfile
+        core = (
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            f'xmlns:dcterms="http://purl.org/dc/terms/"><dcterms:created>{created}</dcterms:created>'
+            '</cp:coreProperties>'
+        )
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("docProps/core.xml", core)
+        return buf.getvalue()
+
+    @pytest.mark.parametrize("tamper", [{"corrupt": True}, {"encrypt": True}, {"method": 99}])
+    def test_damaged_docx(self, tamper):
+        from core.metadata_extractor import extract_document_date
+        damaged = _tamper_zip(self._core_docx("2025-05-20T08:15:00Z"), **tamper)
+        assert extract_document_date(damaged, "notes.docx") is None
+
+    def test_decompression_bomb_image(self):
+        from core.metadata_extractor import extract_document_date
+        assert extract_document_date(_huge_png_header(), "huge.png") is None
+
+    def test_docx_offset_converted_to_utc(self):
+        from core.metadata_extractor import extract_document_date
+        docx = self._core_docx("2025-05-20T08:15:00-07:00")
+        assert extract_document_date(docx, "notes.docx") == "2025-05-20T15:15:00"
+
+
+class TestExhibitOrder:
+    """Chronological ordering is maintained incrementally."""
+
+    def _item(self, item_id, added, doc=""):
+        return {"item_id": item_id, "date_added": added, "document_date": doc}
+
+    def test_orders_by_document_date_then_upload_date(self):
+        from core.exhibit_order import ExhibitOrder
+        order = ExhibitOrder([
+            self._item("late", "2025-07-01T00:00:00", "2025-06-20T00:00:00"),
+            self._item("undated", "2025-07-02T00:00:00"),
+        ])
+        order.add(self._item("early", "2025-07-03T00:00:00", "2025-01-05T00:00:00"))
+        assert order.item_ids() == ["early", "late", "undated"]
+
+    def test_ties_keep_upload_order(self):
+        from core.exhibit_order import ExhibitOrder
+        order = ExhibitOrder()
+        for item_id in ("a", "b", "c"):
+            order.add(self._item(item_id, "2025-07-01T00:00:00"))
+        assert order.item_ids() == ["a", "b", "c"]
+
+    def test_order_evidence_upload_is_identity(self):
+        from core.exhibit_order import ORDER_CHRONOLOGICAL, order_evidence
+        items = [
+            self._item("b", "2025-07-02T00:00:00"),
+            self._item("a", "2025-07-01T00:00:00"),
+        ]
+        assert [i["item_id"] for i in order_evidence(items)] == ["b", "a"]
+        ordered = order_evidence(items, ORDER_CHRONOLOGICAL)
+        assert [i["item_id"] for i in ordered] == ["a", "b"]
+
+
+def _make_pdf(pages: int) -> bytes:
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.set_font("Helvetica", "", 12)
+    for n in range(pages):
+        pdf.add_page()
+        pdf.cell(0, 10, f"Page {n + 1}")
+    return bytes(pdf.output())
+
+
+class TestPdfPageCount:
+    """Page counts come from the page tree without a full parse."""
+
+    @pytest.mark.parametrize("pages", [1, 3, 12])
+    def test_counts_generated_pdfs(self, pages):
+        from core.pdf_inspector import count_pdf_pages
+        assert count_pdf_pages(_make_pdf(pages)) == pages
+
+    def test_counts_from_memory_mapped_file(self, tmp_path):
+        from core.pdf_inspector import count_pdf_pages
+        path = tmp_path / "exhibit.pdf"
+        path.write_bytes(_make_pdf(4))
+        assert count_pdf_pages(str(path)) == 4
+
+    def test_leaf_scan_fallback(self):
+        from core.pdf_inspector import count_pdf_pages
+        pdf = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n2 0 obj << /Type /Page >> endobj\n"
+        assert count_pdf_pages(pdf) == 2
+
+    def test_latest_root_node_wins(self):
+        from core.pdf_inspector import count_pdf_pages
+        pdf = (
+            b"%PDF-1.4\n2 0 obj << /Type /Pages /Kids [] /Count 2 >> endobj\n"
+            b"5 0 obj << /Type /Pages /Parent 2 0 R /Count 1 >> endobj\n"
+            b"2 0 obj << /Type /Pages /Kids [] /Count 3 >> endobj\n"
+        )
+        assert count_pdf_pages(pdf) == 3
+
+    def test_non_pdf_and_empty_file(self, tmp_path):
+        from core.pdf_inspector import count_pdf_pages
+        assert count_pdf_pages(b"hello") is None
+        empty = tmp_path / "empty.pdf"
+        empty.write_bytes(b"")
+        assert count_pdf_pages(str(empty)) is None
+
+
+class TestExhibitPageRanges:
+    """Exhibits get cumulative page numbers for court."""
+
+    def test_cumulative_ranges_skip_unknown(self):
+        from core.exhibit_order import format_page_range, page_ranges, total_pages
+        items = [{"page_count": 3}, {"page_count": None}, {"page_count": 1}, {}]
+        ranges = page_ranges(items)
+        assert ranges == [(1, 3), None, (4, 4), None]
+        assert [format_page_range(r) for r in ranges] == ["1-3", "n/a", "4", "n/a"]
+        assert total_pages(items) == 4
+        assert total_pages([{}]) is None
+
+    def test_case_summary_total_pages(self, sample_intake, sample_evidence):
+        import json
+        from export.case_summary import generate_case_summary_json
+        sample_evidence[0]["page_count"] = 5
+        sample_evidence[1]["page_count"] = 2
+        data = json.loads(generate_case_summary_json(sample_intake, sample_evidence, "CA"))
+        assert data["total_page_count"] == 7
+        assert data["evidence_items"][0]["page_count"] == 5
+
+    def test_evidence_index_with_page_counts(self, sample_evidence):
+        from export.evidence_index import generate_evidence_index_pdf
+        sample_evidence[0]["page_count"] = 5
+        assert generate_evidence_index_pdf(sample_evidence, "CA")[:5] == b"%PDF-"
+
+
+def _make_docx(paragraphs) -> bytes:
+    import zipfile
+    ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in paragraphs)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("word/document.xml", f'<w:document xmlns:w="{ns}"><w:body>{body}</w:body></w:document>')
+    return buf.getvalue()
+
+
+def _tamper_zip(data: bytes, *, encrypt: bool = False, method=None, corrupt: bool = False) -> bytes:
+    """Mark members encrypted, change their compression method, or garble their data."""
+    import struct
+    buf = bytearray(data)
+    i = buf.find(b"PK\x03\x04")
+    while i >= 0:
+        if encrypt:
+            buf[i + 6] |= 1
+        if method is not None:
+            struct.pack_into("<H", buf, i + 8, method)
+        if corrupt:
+            size, = struct.unpack_from("<I", buf, i + 18)
+            name_len, extra_len = struct.unpack_from("<HH", buf, i + 26)
+            start = i + 30 + name_len + extra_len
+            buf[start:start + size] = b"\xff" * size
+        i = buf.find(b"PK\x03\x04", i + 4)
+    i = buf.find(b"PK\x01\x02")
+    while i >= 0:
+        if encrypt:
+            buf[i + 8] |= 1
+        if method is not None:
+            struct.pack_into("<H", buf, i + 10, method)
+        i = buf.find(b"PK\x01\x02", i + 4)
+    return bytes(buf)
+
+
+class TestTextExtraction:
+    """Text is pulled out of txt, docx and pdf evidence."""
+
+    def setup_method(self):
+        from core.text_extractor import clear_cache
+        clear_cache()
+
+    def test_txt_utf8_across_chunks(self):
+        from core.text_extractor import extract_text
+        content = ("Refund promised — café " * 10000).encode("utf-8")
+        result = extract_text("ev-1", content, "emails.txt")
+        assert result.status == "ok"
+        assert result.text == content.decode("utf-8")
+
+    def test_txt_cp1252_fallback(self):
+        from core.text_extractor import extract_text
+        result = extract_text("ev-1", "Caf\xe9 receipt".encode("cp1252"), "receipt.txt")
+        assert result.text == "Caf\xe9 receipt"
+
+    def test_docx_paragraphs(self):
+        from core.text_extractor import extract_text
+        result = extract_text("ev-1", _make_docx(["First para", "They promised a refund"]), "letter.docx")
+        assert result.text == "First para\nThey promised a refund\n"
+
+    def test_pdf_content_streams(self):
+        from core.text_extractor import extract_text
+        from fpdf import FPDF
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font("Helvetica", "", 12)
+        pdf.cell(0, 10, "Invoice (final) #42")
+        result = extract_text("ev-1", bytes(pdf.output()), "invoice.pdf")
+        assert "Invoice (final) #42" in result.text
+
+    def test_pdf_tj_array_spacing_and_escapes(self):
+        from core.pdf_inspector import content_stream_text
+        stream = b"BT [(Hello)-300(world)] TJ T* (a\\(b\\)c\\101) Tj T* <00480069> Tj ET"
+        assert content_stream_text(stream) == "Hello world\na(b)cA\nHi\n"
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_incremental_text_matches_whole_stream(self, chunk_size):
+        from core.pdf_inspector import ContentTextDecoder, content_stream_text
+        stream = (
+            b"0 0 m 10 10 l S BT [(Hello)-300(world)] TJ T* (a\\(b\\)c\\101) Tj ET\n"
+            b"BT (not ET the end) Tj T* (nested (ET) too) Tj ET BT <00480069> Tj ET"
+        )
+        decoder = ContentTextDecoder()
+        pieces = [decoder.feed(stream[i:i + chunk_size]) for i in range(0, len(stream), chunk_size)]
+        pieces.append(decoder.finish())
+        assert "".join(pieces) == content_stream_text(stream)
+        assert sum(1 for piece in pieces if piece) >= 2
+
+    def test_max_chars_cap(self):
+        from core.text_extractor import extract_text
+        result = extract_text("ev-1", b"x" * 1000, "big.txt", max_chars=100)
+        assert len(result.text) == 100
+
+    def test_timeout_returns_partial_status(self):
+        from core.text_extractor import extract_text
+        result = extract_text("ev-1", b"x" * 1000, "slow.txt", timeout_s=-1)
+        assert result.status == "timeout"
+
+    def test_cached_by_content_hash(self):
+        from core.text_extractor import extract_text
+        first = extract_text("a", b"same content", "a.txt")
+        second = extract_text("b", b"same content", "b.txt")
+        assert not first.cached and second.cached
+
+    def test_unsupported_and_corrupt(self):
+        from core.text_extractor import extract_texts
+        results = extract_texts({
+            "doc": (b"\xd0\xcf\x11\xe0", "old.doc", "application/msword"),
+            "bad": (b"not a zip", "broken.docx", ""),
+            "ok": (b"hello", "note.txt", "text/plain"),
+        })
+        assert results["doc"].status == "unsupported"
+        assert results["bad"].status == "error"
+        assert results["ok"].text == "hello"
+
+    @pytest.mark.parametrize("tamper", [
+        {"corrupt": True},  # zlib.error
+        {"encrypt": True},  # RuntimeError
+        {"method": 99},  # NotImplementedError
+    ])
+    def test_damaged_docx_is_an_error_not_a_crash(self, tamper):
+        from core.text_extractor import extract_texts
+        damaged = _tamper_zip(_make_docx(["Refund owed " * 50]), **tamper)
+        results = extract_texts({
+            "bad": (damaged, "letter.docx", ""),
+            "ok": (b"hello", "note.txt", "text/plain"),
+        })
+        assert results["bad"].status == "error"
+        assert results["ok"].text == "hello"
+
+
+def _catalog_items(n: int):
+    return [
+        {
+            "item_id": f"ev-{i:03d}",
+            "label": f"Item {n - i:03d}",
+            "file_name": f"f{i}.jpg" if i % 2 else f"f{i}.pdf",
+            "file_type": "image/jpeg" if i % 2 else "application/pdf",
+            "file_size_bytes": 1000 + (i * 37) % n,
+            "date_added": f"2025-07-{1 + i % 28:02d}T10:00:00",
+        }
+        for i in range(n)
+    ]
+
+
+class TestEvidenceCatalog:
+    """Evidence listing pages, sorts and filters without re-sorting."""
+
+    def test_pages_in_upload_order(self):
+        from core.evidence_view import EvidenceCatalog
+        catalog = EvidenceCatalog(_catalog_items(45))
+        page = catalog.page(0, 20)
+        assert (page.total, page.page_count) == (45, 3)
+        assert [i["item_id"] for i in page.items] == [f"ev-{i:03d}" for i in range(20)]
+        last = catalog.page(2, 20)
+        assert [i["item_id"] for i in last.items] == [f"ev-{i:03d}" for i in range(40, 45)]
+
+    def test_page_is_clamped(self):
+        from core.evidence_view import EvidenceCatalog
+        catalog = EvidenceCatalog(_catalog_items(5))
+        assert catalog.page(9, 20).page == 0
+        assert catalog.page(-1, 20).page == 0
+        assert EvidenceCatalog().page(0, 20).items == ()
+
+    @pytest.mark.parametrize("sort", ["upload", "label", "date", "size"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_sorted_pages_match_full_sort(self, sort, descending):
+        from core.evidence_view import EvidenceCatalog
+        items = _catalog_items(33)
+        catalog = EvidenceCatalog()
+        for item in items:
+            catalog.add(item)
+        key = {
+            "upload": lambda i: 0,
+            "label": lambda i: i["label"].casefold(),
+            "date": lambda i: i["date_added"][:10],
+            "size": lambda i: i["file_size_bytes"],
+        }[sort]
+        expected = sorted(items, key=key, reverse=descending)
+        paged = []
+        for n in range(catalog.page(0, 10).page_count):
+            paged.extend(catalog.page(n, 10, sort=sort, descending=descending).items)
+        assert [key(i) for i in paged] == [key(i) for i in expected]
+        assert len({i["item_id"] for i in paged}) == 33
+
+    def test_filters(self):
+        from core.evidence_view import EvidenceCatalog, EvidenceFilter
+        catalog = EvidenceCatalog(_catalog_items(30))
+        images = catalog.page(0, 50, flt=EvidenceFilter(kind="image"))
+        assert images.total == 15
+        assert all(i["file_type"] == "image/jpeg" for i in images.items)
+        by_label = catalog.page(0, 50, flt=EvidenceFilter(label="item 01"))
+        assert {i["label"] for i in by_label.items} == {f"Item 01{d}" for d in range(10)}
+        dated = catalog.page(0, 50, flt=EvidenceFilter(date_from="2025-07-02", date_to="2025-07-03"))
+        assert {i["date_added"][:10] for i in dated.items} == {"2025-07-02", "2025-07-03"}
+
+    def test_filter_cache_invalidated_on_add(self):
+        from core.evidence_view import EvidenceCatalog, EvidenceFilter
+        items = _catalog_items(4)
+        catalog = EvidenceCatalog(items[:3])
+        flt = EvidenceFilter(kind="image")
+        assert catalog.page(0, 10, flt=flt).total == 1
+        catalog.add(items[3])
+        assert catalog.page(0, 10, flt=flt).total == 2
+
+    def test_evidence_kind(self):
+        from core.evidence_view import evidence_kind
+        assert evidence_kind({"file_name": "a.PNG"}) == "image"
+        assert evidence_kind({"file_name": "a.pdf"}) == "pdf"
+        assert evidence_kind({"file_name": "a.docx"}) == "document"
+        assert evidence_kind({"file_name": "a.txt"}) == "text"
+        assert evidence_kind({"file_name": "a.bin"}) == "other"
+
+
+def _make_zip(members, compression=None) -> io.BytesIO:
+    import zipfile
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED if compression is None else compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+class TestBulkImport:
+    """ZIP archives are streamed member by member into evidence records."""
+
+    def test_imports_supported_files_with_manifest(self):
+        from core.bulk_import import import_archive
+        manifest = (
+            "file_name,label,description,date\n"
+            "receipt.jpg,Deposit receipt,Paid by card,03/02/2025\n"
+            "contract.pdf,Signed contract,,2025-01-15\n"
+        )
+        archive = _make_zip({
+            "manifest.csv": manifest,
+            "receipts/receipt.jpg": _make_jpeg(200, 100),
+            "contract.pdf": _make_pdf(2),
+            "notes.txt": "Called them twice.",
+        })
+        calls = []
+        result = import_archive(archive, progress=lambda d, t, n: calls.append((d, t)))
+        assert result.manifest_rows == 2
+        assert result.skipped == []
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+        by_name = {i["file_name"]: i for i in result.items}
+        assert set(by_name) == {"receipt.jpg", "contract.pdf", "notes.txt"}
+        assert by_name["receipt.jpg"]["label"] == "Deposit receipt"
+        assert by_name["receipt.jpg"]["description"] == "Paid by card"
+        assert by_name["receipt.jpg"]["document_date"].startswith("2025-03-02")
+        assert by_name["receipt.jpg"]["file_type"] == "image/jpeg"
+        assert by_name["notes.txt"]["label"] == "notes"
+        assert by_name["notes.txt"]["document_date"] == ""
+        item = by_name["contract.pdf"]
+        assert result.contents[item["item_id"]].startswith(b"%PDF-")
+        assert item["file_size_bytes"] == len(result.contents[item["item_id"]])
+
+    def test_skips_with_reasons(self):
+        from core.bulk_import import import_archive
+        pdf = _make_pdf(1)
+        archive = _make_zip({
+            "__MACOSX/._a.pdf": b"junk",
+            ".DS_Store": b"junk",
+            "a.pdf": pdf,
+            "copy-of-a.pdf": pdf,
+            "fake.pdf": b"not a pdf at all",
+            "script.exe": b"MZ",
+            "existing.txt": "hello",
+        })
+        result = import_archive(archive, existing_names={"existing.txt"})
+        assert [i["file_name"] for i in result.items] == ["a.pdf"]
+        reasons = dict(result.skipped)
+        assert set(reasons) == {"copy-of-a.pdf", "fake.pdf", "script.exe", "existing.txt"}
+        assert "identical" in reasons["copy-of-a.pdf"]
+        assert "do not match" in reasons["fake.pdf"]
+
+    def test_size_cap_is_enforced_while_streaming(self, monkeypatch):
+        import core.bulk_import as bulk_import
+        monkeypatch.setattr(bulk_import, "BULK_IMPORT_MAX_FILE_BYTES", 1000)
+        monkeypatch.setattr(bulk_import, "BULK_IMPORT_MAX_RATIO", 10**6)
+        archive = _make_zip({"big.txt": "x" * 5000, "small.txt": "ok"})
+        result = bulk_import.import_archive(archive)
+        assert [i["file_name"] for i in result.items] == ["small.txt"]
+        assert dict(result.skipped) == {"big.txt": "file is too large"}
+
+    def test_compression_ratio_guard(self):
+        from core.bulk_import import import_archive
+        result = import_archive(_make_zip({"bomb.txt": "\0" * 5_000_000}))
+        assert result.items == []
+        assert "compressed" in dict(result.skipped)["bomb.txt"]
+
+    def test_unsupported_compression_method_is_skipped(self):
+        from core.bulk_import import import_archive
+        archive = _make_zip({"a.txt": "first", "b.txt": "second"})
+        result = import_archive(io.BytesIO(_tamper_zip(archive.getvalue(), method=99)))
+        assert result.items == []
+        assert dict(result.skipped) == {
+            "a.txt": "file uses an unsupported compression method",
+            "b.txt": "file uses an unsupported compression method",
+        }
+
+    @pytest.mark.parametrize("tamper, reason", [
+        ({"corrupt": True}, "manifest is damaged"),
+        ({"encrypt": True}, "manifest is password-protected"),
+        ({"method": 99}, "manifest uses an unsupported compression method"),
+    ])
+    def test_unreadable_manifest_is_skipped(self, tamper, reason):
+        from core.bulk_import import import_archive
+        archive = _make_zip({"manifest.csv": "file_name,label\nnotes.txt,Call log\n"})
+        result = import_archive(io.BytesIO(_tamper_zip(archive.getvalue(), **tamper)))
+        assert result.manifest_rows == 0
+        assert dict(result.skipped) == {"manifest.csv": reason}
+
+    def test_manifest_with_oversized_field_is_skipped(self):
+        import zipfile
+        from core.bulk_import import import_archive
+        manifest = "file_name,label\nnotes.txt,\"" + "x" * 200_000 + "\"\n"
+        archive = _make_zip({"manifest.csv": manifest, "notes.txt": "Called twice."}, zipfile.ZIP_STORED)
+        result = import_archive(archive)
+        assert [i["file_name"] for i in result.items] == ["notes.txt"]
+        assert result.items[0]["label"] == "notes"
+        assert dict(result.skipped) == {"manifest.csv": "manifest is damaged"}
+
+    def test_manifest_is_size_capped(self, monkeypatch):
+        import core.bulk_import as bulk_import
+        monkeypatch.setattr(bulk_import, "BULK_IMPORT_MAX_FILE_BYTES", 1000)
+        manifest = "file_name,label\n" + "notes.txt,Call log\n" * 100
+        result = bulk_import.import_archive(_make_zip({"manifest.csv": manifest, "notes.txt": "ok"}))
+        assert [i["file_name"] for i in result.items] == ["notes.txt"]
+        assert dict(result.skipped) == {"manifest.csv": "manifest is too large"}
+
+    def test_rejects_non_zip(self):
+        import zipfile
+        from core.bulk_import import import_archive
+        with pytest.raises(zipfile.BadZipFile):
+            import_archive(io.BytesIO(b"not a zip"))
+
+    def test_classify_checks_magic_bytes(self):
+        from core.bulk_import import classify
+        assert classify("a.PNG", b"\x89PNG\r\n\x1a\n....") == "image/png"
+        assert classify("a.png", b"\xff\xd8\xff\xe0") is None
+        assert classify("a.txt", b"anything") == "text/plain"
+        assert classify("a.zip", b"PK\x03\x04") is None
+
+
+class TestEvidenceRecords:
+    """Session evidence is held as immutable slotted records without copies."""
+
+    _ITEM = {
+        "item_id": "ev-1",
+        "label": "Receipt",
+        "file_name": "receipt.pdf",
+        "file_type": "application/pdf",
+        "file_size_bytes": 1200,
+        "date_added": "2025-07-01T10:00:00",
+        "page_count": 2,
+    }
+
+    def test_record_is_slotted_and_immutable(self):
+        import dataclasses
+        from models.evidence import EvidenceItem
+        record = EvidenceItem.from_dict(self._ITEM)
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.label = "changed"
+        assert record.replace(label="Invoice").label == "Invoice"
+        assert record.label == "Receipt"
+
+    def test_record_reads_like_a_dict(self):
+        from models.evidence import EvidenceItem
+        record = EvidenceItem.from_dict(self._ITEM)
+        assert record["label"] == "Receipt"
+        assert record.get("page_count") == 2
+        assert record.get("missing", "x") == "x"
+        assert "file_name" in record and "missing" not in record
+        assert dict(record) == record.to_metadata_dict()
+        assert EvidenceItem.from_dict(record) is record
+        with pytest.raises(KeyError):
+            record["missing"]
+
+    def test_accessors_return_views_not_copies(self):
+        from core import data_manager
+        from models.evidence import EvidenceItem
+        data_manager.delete_all_user_data()
+        data_manager.add_evidence_item(dict(self._ITEM), b"%PDF-1.4")
+        items = data_manager.get_evidence_items()
+        assert items is data_manager.get_evidence_items()
+        assert isinstance(items, tuple) and isinstance(items[0], EvidenceItem)
+        files = data_manager.get_evidence_files()
+        assert files["ev-1"] == b"%PDF-1.4"
+        with pytest.raises(TypeError):
+            files["ev-2"] = b""
+
+        data_manager.set_intake_data({"description": "Refund never arrived"})
+        intake = data_manager.get_intake_data()
+        assert intake is data_manager.get_intake_data()
+        with pytest.raises(TypeError):
+            intake["description"] = "changed"
+        data_manager.delete_all_user_data()
+        assert data_manager.get_evidence_items() == ()
+        assert dict(data_manager.get_intake_data()) == {}
+
+    def test_batch_add_keeps_indexes_in_step(self):
+        from core import data_manager
+        data_manager.delete_all_user_data()
+        data_manager.add_evidence_items([
+            ({**self._ITEM, "item_id": f"ev-{n}", "label": f"Receipt {n}"}, None) for n in range(3)
+        ])
+        assert [i.item_id for i in data_manager.get_evidence_items()] == ["ev-0", "ev-1", "ev-2"]
+        assert len(data_manager.get_evidence_catalog()) == 3
+        before = data_manager.get_evidence_items()
+        data_manager.add_evidence_item({**self._ITEM, "item_id": "ev-3"})
+        after = data_manager.get_evidence_items()
+        assert len(before) == 3 and [i.item_id for i in after][-1] == "ev-3"
+        assert after is data_manager.get_evidence_items()
+        data_manager.set_evidence_text("ev-1", "promised a refund")
+        hits = data_manager.get_search_index().search('"promised a refund"')
+        assert [h.key for h in hits] == ["evidence:ev-1"]
+        data_manager.delete_all_user_data()
+
+
+class TestPiiScanner:
+    """Evidence text is scanned for sensitive numbers in bounded chunks."""
+
+    _TEXT = (
+        "Statement for acct # 12345678 dated 2025-06-01.\n"
+        "Tenant SSN 123-45-6789 on file; paid by card 4111 1111 1111 1111.\n"
+        "Call 555-123-4567 or ref 1234 5678 9012 3456.\n"
+    )
+
+    def test_finds_ssn_account_and_card_numbers(self):
+        from core.pii_scanner import scan_source
+        report = scan_source("ev-1", self._TEXT)
+        assert report.counts == {"account_number": 1, "ssn": 1, "card_number": 1}
+        assert [f.preview for f in report.findings] == [
+            "acct # ****5678", "***-**-6789", "**** **** **** 1111",
+        ]
+        assert report.chars_scanned == len(self._TEXT)
+
+    def test_matches_across_chunk_boundaries_are_found_once(self):
+        from core.pii_scanner import PiiScanner, scan_source
+        text = ("x" * 61 + "SSN 123-45-6789 ") * 40 + self._TEXT * 3
+        whole = PiiScanner(chunk_chars=len(text) + 1)
+        whole.feed(text)
+        whole.finish()
+        expected = [(f.kind, f.offset) for f in whole.findings]
+        assert len(expected) == 49
+        for chunk_chars in (65, 77, 100, 128, 1000):
+            report = scan_source("ev-1", text, chunk_chars=chunk_chars)
+            assert [(f.kind, f.offset) for f in report.findings] == expected
+
+    def test_patterns_are_shorter_than_the_overlap(self):
+        from re import _parser
+        from config.settings import PII_SCAN_OVERLAP_CHARS
+        from core.pii_scanner import SCAN_PATTERNS
+        for name, pattern in SCAN_PATTERNS:
+            assert _parser.parse(pattern).getwidth()[1] < PII_SCAN_OVERLAP_CHARS, name
+
+    def test_padded_account_number_at_every_boundary(self):
+        from core.pii_scanner import scan_source
+        record = "Account Number:" + " " * 30 + "123456789012"
+        for lead in range(0, 100):
+            report = scan_source("ev-1", "x" * lead + " " + record + "\n", chunk_chars=64)
+            assert report.counts == {"account_number": 1}, lead
+
+    def test_adjacent_numbers_match_a_whole_text_scan(self):
+        import random
+        from core.pii_scanner import PiiScanner
+        tokens = [
+            "4111 1111 1111 1111", "4111111111111111", "5500-0000-0000-0004", "123-45-6789",
+            "acct # 12345678", "routing 021000021", "Account No.:" + " " * 20 + "123456789012",
+            " ", "-", "7", "\n", "ref",
+        ]
+        rng = random.Random(7)
+        for _ in range(300):
+            text = "".join(rng.choice(tokens) for _ in range(rng.randint(5, 40)))
+            whole = PiiScanner(chunk_chars=len(text) + 1)
+            whole.feed(text)
+            whole.finish()
+            chunked = PiiScanner(chunk_chars=rng.randint(1, 200))
+            piece = rng.randint(1, 100)
+            for i in range(0, len(text), piece):
+                chunked.feed(text[i:i + piece])
+            chunked.finish()
+            assert chunked.findings == whole.findings, text
+
+    def test_bytes_are_decoded_incrementally_with_fallback(self):
+        from core.pii_scanner import scan_source
+        utf8 = ("Café receipt — SSN 123-45-6789\n" * 50).encode("utf-8")
+        assert scan_source("a", utf8, chunk_chars=70).counts == {"ssn": 50}
+        cp1252 = "Caf\xe9 receipt SSN 123-45-6789\n".encode("cp1252") * 3
+        assert scan_source("b", cp1252, chunk_chars=70).counts == {"ssn": 3}
+
+    def test_findings_are_capped_but_counted(self):
+        from core.pii_scanner import PiiScanner
+        scanner = PiiScanner(max_findings=5)
+        scanner.feed("SSN 123-45-6789. " * 200)
+        scanner.finish()
+        report = scanner.report("ev-1")
+        assert len(report.findings) == 5 and report.total == 200
+
+    def test_scan_sources_runs_in_parallel_and_keeps_ids(self):
+        from core.pii_scanner import scan_sources
+        reports = scan_sources({"a": self._TEXT, "b": b"nothing sensitive", "c": ""}, max_workers=3)
+        assert set(reports) == {"a", "b", "c"}
+        assert reports["a"].total == 3 and reports["b"].total == 0 and reports["c"].total == 0
@@ -176,3 +176,156 @@ class TestExportCoverageHeaders:
     def test_evidence_index_empty_list(self, tier1_state):
         pdf_bytes = generate_evidence_index_pdf([], tier1_state)
         assert pdf_bytes[:5] == b"%PDF-"
+
+
+class TestCountyVenue:
+    """The claim form and demand letter name the county court when one is chosen."""
+
+    @staticmethod
+    def _text(pdf_bytes: bytes) -> str:
+        from core.text_extractor import extract_pdf
+        return extract_pdf(bytes(pdf_bytes), 1_000_000)
+
+    def test_claim_form_names_county_court(self, sample_intake):
+        intake = {**sample_intake, "venue_county": "Alameda"}
+        text = self._text(generate_claim_form_pdf(intake, "CA"))
+        assert "SUPERIOR COURT OF CALIFORNIA, COUNTY OF ALAMEDA" in text
+        assert "clerk of the Superior Court of California, County of Alameda" in text
+
+    def test_demand_letter_names_county_court(self, sample_intake):
+        intake = {**sample_intake, "venue_county": "Miami-Dade"}
+        text = " ".join(self._text(generate_demand_letter_pdf(intake, "FL")).split())
+        assert "Small Claims Division of the County Court in and for Miami-Dade County" in text
+
+    def test_falls_back_to_state_court(self, sample_intake):
+        intake = {**sample_intake, "venue_county": "Harris"}
+        text = self._text(generate_claim_form_pdf(intake, "CA"))
+        assert "COUNTY OF" not in text
+        assert "SUPERIOR COURT OF CALIFORNIA" in text
+
+
+class TestExhibitPacket:
+    """Image exhibits are rendered into a stamped ExhibitPacket.pdf."""
+
+    def _photo_item(self, item_id: str, name: str = "damage.jpg") -> dict:
+        return {
+            "item_id": item_id,
+            "label": "Water damage",
+            "file_name": name,
+            "file_type": "image/jpeg",
+            "file_size_bytes": 1000,
+            "description": "Ceiling after the leak",
+            "date_added": "2025-07-01T10:00:00",
+        }
+
+    def _jpeg(self) -> bytes:
+        from PIL import Image
+        buf = io.BytesIO()
+        Image.effect_noise((1200, 900), 40).convert("RGB").save(buf, format="JPEG")
+        return buf.getvalue()
+
+    def test_packet_added_when_images_supplied(self, sample_intake, sample_evidence, tier1_state):
+        items = sample_evidence + [self._photo_item("ev-img")]
+        binder = generate_binder_zip(sample_intake, items, tier1_state, {"ev-img": self._jpeg()})
+        with zipfile.ZipFile(io.BytesIO(binder)) as zf:
+            assert "ExhibitPacket.pdf" in zf.namelist()
+            assert zf.read("ExhibitPacket.pdf")[:5] == b"%PDF-"
+
+    def test_no_packet_without_image_content(self, sample_intake, sample_evidence, tier1_state):
+        binder = generate_binder_zip(sample_intake, sample_evidence, tier1_state, {"ev-001": b"%PDF-1.4"})
+        with zipfile.ZipFile(io.BytesIO(binder)) as zf:
+            assert "ExhibitPacket.pdf" not in zf.namelist()
+
+    def test_one_page_per_image_with_matching_designation(self, sample_evidence, tier1_state):
+        from export.exhibit_packet import generate_exhibit_packet_pdf, image_exhibits
+        from core.pdf_inspector import count_pdf_pages
+        items = sample_evidence + [self._photo_item("a"), self._photo_item("b", "broken.png")]
+        files = {"a": self._jpeg(), "b": b"corrupt image bytes"}
+        # Positions follow the full evidence list, matching EvidenceIndex.pdf
+        assert [pos for pos, _ in image_exhibits(items, files)] == [3, 4]
+        pdf_bytes = generate_exhibit_packet_pdf(items, files, tier1_state)
+        assert count_pdf_pages(pdf_bytes) == 2
+
+    def test_stored_derivatives_are_placed_without_reoptimising(
+        self, monkeypatch, sample_intake, sample_evidence, tier1_state,
+    ):
+        import export.exhibit_packet as exhibit_packet
+        from core.image_optimizer import optimize_image_bytes
+        from export.binder import build_binder
+        original = self._jpeg()
+        derivative = optimize_image_bytes(original)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the stored derivative should be used")
+
+        monkeypatch.setattr(exhibit_packet, "optimize_image", fail)
+        items = sample_evidence + [self._photo_item("a")]
+        binder = build_binder(sample_intake, items, tier1_state, {"a": original}, verify=False,
+                              image_derivatives={"a": derivative})
+        with zipfile.ZipFile(io.BytesIO(binder.content)) as zf:
+            assert zf.read("ExhibitPacket.pdf")[:5] == b"%PDF-"
+
+
+class TestBinderVerification:
+    """Generated PDFs are checked for leaked numbers and binary data."""
+
+    @staticmethod
+    def _pdf(*lines: str, compress: bool = True) -> bytes:
+        from fpdf import FPDF
+        pdf = FPDF()
+        pdf.set_compression(compress)
+        pdf.add_page()
+        pdf.set_font("Helvetica", size=10)
+        for line in lines:
+            pdf.cell(0, 6, line, new_x="LMARGIN", new_y="NEXT")
+        return bytes(pdf.output())
+
+    def test_clean_binder_passes(self, sample_intake, sample_evidence, tier1_state):
+        from export.binder import build_binder
+        build = build_binder(sample_intake, sample_evidence, tier1_state, verify=True)
+        verification = build.verification
+        assert [r.file_name for r in verification.results] == [
+            "DemandLetter.pdf", "ClaimForm.pdf", "EvidenceIndex.pdf",
+        ]
+        assert verification.violations == []
+        assert all(r.streams_checked and r.chars_checked for r in verification.results)
+        assert verification.check_ms > 0 and verification.wait_ms >= 0
+
+    def test_verification_does_not_change_the_zip_members(self, sample_intake, sample_evidence, tier1_state):
+        from export.binder import build_binder
+        plain = build_binder(sample_intake, sample_evidence, tier1_state, verify=False)
+        checked = build_binder(sample_intake, sample_evidence, tier1_state, verify=True)
+        assert plain.verification is None
+        with zipfile.ZipFile(io.BytesIO(plain.content)) as a, zipfile.ZipFile(io.BytesIO(checked.content)) as b:
+            assert a.namelist() == b.namelist()
+
+    def test_ssn_in_narrative_is_flagged(self, sample_intake, sample_evidence, tier1_state):
+        from export.binder import build_binder
+        intake = dict(sample_intake, description="My SSN 123-45-6789 was printed on the lease.")
+        violations = build_binder(intake, sample_evidence, tier1_state, verify=True).verification.violations
+        assert "DemandLetter.pdf: Social Security number ***-**-6789" in violations
+        assert not any("6789" in v and "***-**-6789" not in v for v in violations)
+
+    def test_failing_check_is_reported_not_raised(self, monkeypatch, sample_intake, sample_evidence, tier1_state):
+        import export.binder as binder
+        from export.pdf_verification import verify_pdf
+
+        def flaky(name, content):
+            if name == "ClaimForm.pdf":
+                raise MemoryError
+            return verify_pdf(name, content)
+
+        monkeypatch.setattr(binder, "verify_pdf", flaky)
+        build = binder.build_binder(sample_intake, sample_evidence, tier1_state, verify=True)
+        assert build.content[:2] == b"PK"
+        assert build.verification.violations == ["ClaimForm.pdf: could not be verified (MemoryError)"]
+        assert [r.ok for r in build.verification.results] == [True, False, True]
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_binary_and_embedded_pdf_text_flagged(self, compress):
+        import base64
+        from export.pdf_verification import verify_pdf
+        blob = base64.b64encode(bytes(range(256))).decode()[:80]
+        result = verify_pdf("X.pdf", self._pdf("Attachment:", blob, "%PDF-1.4 leaked", compress=compress))
+        assert result.violations == ("X.pdf: contains base64 binary data", "X.pdf: contains raw PDF bytes")
+        assert not verify_pdf("Y.pdf", self._pdf("Nothing to see here.", compress=compress)).violations
@@ -0,0 +1,80 @@
+"""
+Evidence search tests — full-text index over evidence and intake narrative.
+
+Acceptance criteria:
+- Documents are indexed, replaced and removed incrementally
+- Results are ranked with BM25; quoted phrases require consecutive terms
+- Snippets are cut around the matched text
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.search_index import SearchIndex, tokenize
+
+
+def _index() -> SearchIndex:
+    index = SearchIndex()
+    index.add_document("evidence:1", "Invoice for kitchen cabinets. Total due $4,200.", "Invoice")
+    index.add_document(
+        "evidence:2",
+        "Hi Jane, as discussed we promised a refund within 30 days. Regards, Acme",
+        "Email from Acme",
+    )
+    index.add_document("evidence:3", "Refund refund refund policy: no refund after 30 days.", "Policy")
+    index.add_document("intake:description", "The contractor never installed the cabinets.", "Case description")
+    return index
+
+
+class TestSearchIndex:
+    def test_tokenize_lowercases_words(self):
+        assert tokenize("Promised a REFUND, on 3/4!") == ["promised", "a", "refund", "on", "3", "4"]
+
+    def test_term_query_ranks_by_frequency(self):
+        hits = _index().search("refund")
+        assert [h.key for h in hits] == ["evidence:3", "evidence:2"]
+        assert hits[0].score > hits[1].score
+
+    def test_phrase_query_requires_consecutive_terms(self):
+        index = _index()
+        hits = index.search('"promised a refund"')
+        assert [h.key for h in hits] == ["evidence:2"]
+        assert index.search('"refund promised"') == []
+
+    def test_covers_intake_narrative(self):
+        hits = _index().search("cabinets")
+        assert {h.key for h in hits} == {"evidence:1", "intake:description"}
+
+    def test_replace_and_remove(self):
+        index = _index()
+        index.add_document("evidence:1", "Receipt for a refund", "Receipt")
+        assert len(index) == 4
+        assert index.search("invoice") == []
+        assert "evidence:1" in {h.key for h in index.search("refund")}
+        index.remove_document("evidence:1")
+        assert "evidence:1" not in index
+        assert index.search("receipt") == []
+
+    def test_empty_text_is_not_indexed(self):
+        index = SearchIndex()
+        index.add_document("evidence:1", "  ...  ")
+        assert len(index) == 0
+        assert index.search("") == []
+
+    def test_snippet_surrounds_match(self):
+        index = SearchIndex()
+        text = "filler " * 100 + "they promised a refund" + " filler" * 100
+        index.add_document("evidence:1", text, "Long")
+        hit = index.search('"promised a refund"')[0]
+        assert "promised a refund" in hit.snippet
+        assert hit.snippet.startswith("...") and hit.snippet.endswith("...")
+        assert len(hit.snippet) < 250
+
+    def test_title_defaults_to_key(self):
+        index = SearchIndex()
+        index.add_document("intake:description", "deposit")
+        assert index.search("deposit")[0].title == "intake:description"
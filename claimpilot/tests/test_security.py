@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import sys
+import threading
 
 import pytest
 
@@ -55,6 +56,47 @@ class TestPIIRedaction:
         assert "ValueError" in msg
 
 
+class TestRedactionEngine:
+    """Single-pass redaction matches the original sequential substitutions."""
+
+    _SAMPLES = [
+        "SSN 123-45-6789, phone 555.123.4567, ZIP 90210-1234",
+        "123-45-6789@example.com and 5551234567@example.com",
+        "jane_doe+claims@mail.example.org wrote at 10:45 on 2025-06-15",
+        "Order 1234567890123 for $5,000 shipped to 90210",
+        "Optimised evidence 1a2b3c4d: 4820113 -> 712004 bytes in 38.2 ms",
+        "no digits or at-signs here",
+        "555-123-4567-12-3456 12345-6789 123456",
+        "",
+    ]
+
+    @staticmethod
+    def _legacy(text):
+        import re
+        for pattern, replacement in [
+            (r"\b\d{3}-\d{2}-\d{4}\b", "[SSN-REDACTED]"),
+            (r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", "[EMAIL-REDACTED]"),
+            (r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b", "[PHONE-REDACTED]"),
+            (r"\b\d{5}(-\d{4})?\b", "[ZIP-REDACTED]"),
+        ]:
+            text = re.sub(pattern, replacement, text)
+        return text
+
+    @pytest.mark.parametrize("text", _SAMPLES)
+    def test_matches_sequential_redaction(self, text):
+        from core.pii_guard import redact_text
+        assert redact_text(text) == self._legacy(text)
+
+    def test_text_without_digits_or_at_is_returned_unchanged(self):
+        from core.pii_guard import redact_text
+        text = "Rendering tab Evidence"
+        assert redact_text(text) is text
+
+    def test_logger_delegates_to_engine(self):
+        from core.logger import redact_pii
+        assert redact_pii("jane@example.com 123-45-6789") == "[EMAIL-REDACTED] [SSN-REDACTED]"
+
+
 class TestProductionLogging:
     """In production mode, debug/info logging must be suppressed."""
 
@@ -85,6 +127,23 @@ class TestNoBase64InExport:
         assert not is_base64_binary("hello world")
         assert not is_base64_binary("SGVsbG8=")  # too short
 
+    def test_base64_of_text_not_flagged(self):
+        text = "The landlord kept the full deposit after move-out. " * 4
+        assert not is_base64_binary(base64.b64encode(text.encode()).decode())
+
+    def test_padding_rules(self):
+        blob = base64.b64encode(bytes(range(128, 256))).decode()  # 172 chars, no padding
+        assert is_base64_binary(f"  {blob}\n")
+        assert is_base64_binary(blob[:40])
+        assert not is_base64_binary(blob[:39])
+        assert not is_base64_binary(blob[:37] + "===")
+        # Padding needs ten full quads before the padded one.
+        assert not is_base64_binary(blob[:38] + "==")
+        assert is_base64_binary(blob[:42] + "==")
+        assert is_base64_binary(blob[:43] + "=")
+        assert not is_base64_binary(blob[:20] + "=" + blob[21:44])
+        assert not is_base64_binary(blob[:20] + " " + blob[21:44])
+
     def test_sanitize_removes_base64(self):
         binary_data = b"%PDF-1.4 " + bytes(range(256)) * 2
         b64 = base64.b64encode(binary_data).decode()
@@ -115,6 +174,60 @@ class TestNoBase64InExport:
         assert len(violations) == 0
 
 
+class TestFusedSanitizeAndValidate:
+    """One traversal gives the same result as sanitize followed by validate."""
+
+    def _payload(self):
+        blob = base64.b64encode(b"%PDF-1.4 " + bytes(range(256)) * 2).decode()
+        return {
+            "label": "Receipt",
+            "amount": 5000,
+            "pdf_text": "%PDF-1.7 raw",
+            "blob": blob,
+            "raw": b"\x00\x01",
+            "nested": {"inner": blob, "ok": "fine", "deeper": {"n": None}},
+            "items": [
+                "plain",
+                blob,
+                b"bytes in a list",
+                {"thumb": blob, "list": [b"x", blob, "y"]},
+                ["nested list", b"not walked"],
+                "%PDF- kept in lists",
+            ],
+        }
+
+    def test_matches_two_pass_result(self):
+        from core.pii_guard import sanitize_and_validate
+        data = self._payload()
+        clean = sanitize_export_dict(data)
+        assert sanitize_and_validate(data) == (clean, validate_export_json(clean))
+
+    def test_reports_post_filter_list_indexes(self):
+        from core.pii_guard import sanitize_and_validate
+        _, violations = sanitize_and_validate(self._payload())
+        assert violations == [
+            "items[1]: contains raw bytes",
+            "items[2].list[0]: contains raw bytes",
+        ]
+
+    def test_does_not_mutate_input(self):
+        from core.pii_guard import sanitize_and_validate
+        data = self._payload()
+        snapshot = json.dumps(data, default=repr)
+        sanitize_and_validate(data)
+        assert json.dumps(data, default=repr) == snapshot
+
+    def test_deep_nesting_is_not_recursive(self):
+        from core.pii_guard import sanitize_and_validate
+        root = node = {}
+        for _ in range(sys.getrecursionlimit() * 2):
+            node["child"] = {}
+            node = node["child"]
+        node["raw"] = [b"leaf"]
+        clean, violations = sanitize_and_validate(root)
+        assert len(violations) == 1 and violations[0].endswith("raw[0]: contains raw bytes")
+
+
 class TestNoPDFBytesInExport:
     """Export JSON must never contain raw PDF bytes."""
 
@@ -159,6 +272,21 @@ class TestPIIFieldDetection:
         assert not contains_pii_field_name("claim_type")
         assert not contains_pii_field_name("amount")
 
+    def test_find_returns_all_names_including_overlaps(self):
+        from core.pii_guard import find_pii_field_names
+        found = find_pii_field_names("Updated Mailing_Address and DOB for claimant")
+        assert found == {"mailing_address", "address", "dob"}
+
+    def test_find_reports_prefix_names(self):
+        from core.pii_guard import find_pii_field_names
+        assert find_pii_field_names("phone_number=555") == {"phone", "phone_number"}
+        assert find_pii_field_names("claim_type amount") == set()
+
+    def test_find_agrees_with_substring_search(self):
+        from core.pii_guard import PII_FIELD_NAMES, find_pii_field_names
+        text = " ".join(sorted(PII_FIELD_NAMES)).upper() + " receipts, photos and invoices"
+        assert find_pii_field_names(text) == {n for n in PII_FIELD_NAMES if n in text.lower()}
+
 
 class TestLoggerRedactsFormattedArgs:
     """PII in %-format args must be redacted before final log output (fix A)."""
@@ -199,6 +327,344 @@ class TestLoggerRedactsFormattedArgs:
         assert "555.999.1234" not in caplog.text
 
 
+class TestLazyLogging:
+    """Suppressed log calls skip redaction; the mode is cached until reloaded."""
+
+    def test_suppressed_calls_do_not_redact(self, monkeypatch):
+        import core.logger as lg
+        monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "true")
+        lg.reload_config()
+        calls = []
+        monkeypatch.setattr(lg, "redact_text", lambda text, engine=None: calls.append(text) or text)
+        try:
+            lg.log_info("User email: %s", "test@example.com")
+            lg.log_debug("Phone %s", "555-123-4567")
+            assert calls == []
+            lg.log_warning("Visible %s", "x")
+            lg.flush_logs()
+            assert calls == ["Visible %s", "x"]
+        finally:
+            monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "false")
+            lg.reload_config()
+
+    def test_production_flag_is_cached_until_reload(self, monkeypatch):
+        import core.logger as lg
+        lg.reload_config()
+        assert lg._is_production() is False
+        monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "true")
+        assert lg._is_production() is False
+        lg.reload_config()
+        assert lg._is_production() is True
+        assert lg._logger.level >= logging.WARNING
+        monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "false")
+        lg.reload_config()
+        assert lg._logger.level <= logging.DEBUG
+
+    def test_mapping_args_redacted(self, monkeypatch, caplog):
+        import core.logger as lg
+        lg.reload_config()
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            lg.log_info("Contact %(email)s", {"email": "a@b.com"})
+        assert "a@b.com" not in caplog.text
+        assert "[EMAIL-REDACTED]" in caplog.text
+
+    def test_dev_unsafe_is_not_redacted(self, caplog):
+        import core.logger as lg
+        lg.reload_config()
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            lg.log_dev_unsafe("Raw %s", "dev@example.com")
+        assert "dev@example.com" in caplog.text
+
+
+class TestQueuedLogPipeline:
+    """Production logging goes through a bounded queue and a listener thread."""
+
+    def test_production_writes_redacted_records_off_thread(self, monkeypatch, capsys):
+        import core.logger as lg
+        monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "true")
+        lg.reload_config()
+        try:
+            writer_threads = []
+            monkeypatch.setattr(
+                lg, "redact_text",
+                lambda text, engine=None, _real=lg.redact_text: writer_threads.append(threading.current_thread()) or _real(text, engine),
+            )
+            lg.log_error("Failed for %s", "jane@example.com")
+            lg.flush_logs()
+            err = capsys.readouterr().err
+            assert "[EMAIL-REDACTED]" in err and "jane@example.com" not in err
+            assert writer_threads and threading.main_thread() not in writer_threads
+            stats = lg.log_pipeline_stats()
+            assert stats["mode"] == "queue"
+            assert stats["queue_depth"] == 0 and stats["dropped"] == 0
+            assert stats["queue_capacity"] > 0
+            assert lg._logger.propagate is False
+        finally:
+            monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "false")
+            lg.reload_config()
+        assert lg.log_pipeline_stats()["mode"] == "sync"
+
+    def test_full_queue_drops_and_counts(self):
+        import queue
+        from core.logger import BoundedQueueHandler
+        handler = BoundedQueueHandler(queue.Queue(2))
+        for n in range(5):
+            handler.handle(logging.LogRecord("claimpilot", logging.ERROR, __file__, 1, "msg %s", (n,), None))
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+        # Records are enqueued unformatted; formatting happens on the listener.
+        assert handler.queue.get_nowait().args == (0,)
+
+    def test_failing_filter_does_not_stop_the_listener(self, capsys):
+        import queue
+
+        from core.logger import BoundedQueueHandler
+
+        class Explodes(logging.Filter):
+            def filter(self, record):
+                if record.msg == "boom":
+                    raise RuntimeError("filter failed")
+                return True
+
+        out = logging.StreamHandler(sys.stderr)
+        out.addFilter(Explodes())
+        handler = BoundedQueueHandler(queue.Queue(10))
+        handler.start_listener(out)
+        try:
+            for msg in ("boom", "after"):
+                handler.handle(logging.LogRecord("claimpilot", logging.ERROR, __file__, 1, msg, (), None))
+            assert handler.flush(timeout=5)
+            assert handler.listener.failed == 1
+            assert "after" in capsys.readouterr().err
+        finally:
+            handler.stop_listener()
+        assert not handler.listening
+        handler.stop_listener()  # stopping twice is harmless
+
+    def test_flush_is_bounded(self):
+        import queue
+
+        from core.logger import BoundedQueueHandler
+
+        release = threading.Event()
+
+        class Stuck(logging.Handler):
+            def emit(self, record):
+                release.wait(5)
+
+        handler = BoundedQueueHandler(queue.Queue(10))
+        assert handler.flush(timeout=0.01)  # nothing queued, no listener
+        handler.start_listener(Stuck())
+        try:
+            handler.handle(logging.LogRecord("claimpilot", logging.ERROR, __file__, 1, "slow", (), None))
+            assert handler.flush(timeout=0.05) is False
+            release.set()
+            assert handler.flush(timeout=5)
+        finally:
+            handler.stop_listener()
+
+
+class TestSessionRedaction:
+    """The session's own names and addresses are redacted with the generic patterns."""
+
+    _INTAKE = {
+        "claimant_name": "Jane  Q. Doe",
+        "respondent_name": "The Oak Street LLC",
+        "claimant_address": "742 Evergreen Terrace, Springfield, OR 97403",
+        "claimant_phone": "(555) 123-4567",
+        "description": "Deposit not returned.",
+    }
+
+    @pytest.fixture(autouse=True)
+    def _reset_session_engine(self):
+        from core.pii_guard import set_session_engine
+        yield
+        set_session_engine(None)
+
+    def test_terms_cover_whole_values_and_parts(self):
+        from core.pii_guard import session_redaction_terms
+        terms = session_redaction_terms(self._INTAKE)
+        assert terms["Jane Q. Doe"] == "[NAME-REDACTED]"
+        assert terms["Doe"] == "[NAME-REDACTED]"
+        assert "The" not in terms and "LLC" not in terms
+        assert terms["742 Evergreen Terrace"] == "[ADDRESS-REDACTED]"
+        assert "Deposit not returned." not in terms
+
+    def test_engine_redacts_terms_and_patterns_in_one_pass(self):
+        from core.pii_guard import build_session_engine
+        engine = build_session_engine(self._INTAKE)
+        text = "JANE Q. DOE at 742 evergreen terrace, Springfield, OR 97403 called (555) 123-4567, SSN 123-45-6789"
+        assert engine.redact(text) == (
+            "[NAME-REDACTED] at [ADDRESS-REDACTED] called [PHONE-REDACTED], SSN [SSN-REDACTED]"
+        )
+
+    def test_terms_match_whole_words_only(self):
+        from core.pii_guard import build_session_engine
+        engine = build_session_engine(self._INTAKE)
+        assert engine.redact("Janet Doerr and Jane's landlord") == "Janet Doerr and [NAME-REDACTED]'s landlord"
+
+    def test_empty_intake_builds_no_engine(self):
+        from core.pii_guard import build_session_engine
+        assert build_session_engine({"claimant_name": " ", "description": "x"}) is None
+
+    def test_saving_intake_installs_engine_for_logs(self, caplog):
+        import core.logger as lg
+        from core.data_manager import delete_all_user_data, set_intake_data
+        lg.reload_config()
+        set_intake_data(self._INTAKE)
+        try:
+            assert lg.redact_pii("Error for Doe") == "Error for [NAME-REDACTED]"
+            with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+                lg.log_warning("Letter drafted for %s", "Jane Q. Doe")
+            assert "Doe" not in caplog.text and "[NAME-REDACTED]" in caplog.text
+        finally:
+            delete_all_user_data()
+        assert lg.redact_pii("Error for Doe") == "Error for Doe"
+
+    def test_listener_thread_uses_callers_engine(self, monkeypatch, capsys):
+        import core.logger as lg
+        from core.pii_guard import build_session_engine, set_session_engine
+        monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "true")
+        lg.reload_config()
+        try:
+            set_session_engine(build_session_engine(self._INTAKE))
+            lg.log_error("Render failed for %s", "Jane Q. Doe")
+            set_session_engine(None)
+            lg.flush_logs()
+            err = capsys.readouterr().err
+            assert "[NAME-REDACTED]" in err and "Doe" not in err
+        finally:
+            monkeypatch.setenv("CLAIMPILOT_PRODUCTION", "false")
+            lg.reload_config()
+
+
+class TestStructuredEventLogging:
+    """Error storms are fingerprinted, rate-limited and summarised."""
+
+    def test_rate_limiter_window_and_summary(self):
+        from core.logger import FingerprintRateLimiter
+        now = [0.0]
+        limiter = FingerprintRateLimiter(window_s=10, burst=2, clock=lambda: now[0])
+        assert [limiter.check("fp") for _ in range(4)] == [(True, 0), (True, 0), (False, 0), (False, 0)]
+        assert limiter.check("other") == (True, 0)
+        now[0] = 10.0
+        assert limiter.check("fp") == (True, 2)
+        limiter.check("fp")
+        limiter.check("fp")
+        assert limiter.drain() == [("fp", 1)]
+        assert limiter.drain() == []
+
+    def test_rate_limiter_is_bounded(self):
+        from core.logger import FingerprintRateLimiter
+        limiter = FingerprintRateLimiter(window_s=60, burst=1, max_fingerprints=3)
+        for n in range(10):
+            limiter.check(f"fp{n}")
+        assert len(limiter._state) == 3
+
+    def test_evicted_fingerprint_keeps_pending_count(self):
+        from core.logger import FingerprintRateLimiter
+        limiter = FingerprintRateLimiter(window_s=60, burst=1, max_fingerprints=2)
+        for _ in range(4):
+            limiter.check("storm")
+        limiter.check("a")
+        limiter.check("b")
+        assert "storm" not in limiter._state
+        assert limiter.drain() == [("storm", 3)]
+        assert limiter.drain() == []
+
+    def test_suppressed_counts_are_reported_periodically(self, monkeypatch, caplog):
+        import time
+        import core.logger as lg
+        lg.reload_config()
+        monkeypatch.setattr(lg, "_rate_limiter", lg.FingerprintRateLimiter(window_s=60, burst=1))
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            for _ in range(3):
+                lg.log_event(logging.WARNING, "storm", "fp-periodic", "Storm")
+            lg.start_suppressed_reporter(interval_s=0.01)
+            try:
+                deadline = time.monotonic() + 5
+                while "Suppressed 2 occurrences" not in caplog.text and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                lg.start_suppressed_reporter()
+        assert "Suppressed 2 occurrences of event fp-periodic" in caplog.text
+
+    def test_error_storm_in_tab_is_logged_once_per_burst(self, monkeypatch, caplog):
+        import core.logger as lg
+        from core.error_boundary import safe_render
+        lg.reload_config()
+        monkeypatch.setattr(lg, "_rate_limiter", lg.FingerprintRateLimiter(window_s=60, burst=1))
+
+        @safe_render("Storm Tab")
+        def broken():
+            raise KeyError("jane@example.com")
+
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            for _ in range(5):
+                broken()
+        records = [r for r in caplog.records if getattr(r, "event", None) == "render_error"]
+        assert len(records) == 1
+        assert records[0].fingerprint == lg.event_fingerprint("KeyError", "Storm Tab")
+        assert records[0].event_fields == {"tab": "Storm Tab", "exc_type": "KeyError"}
+        assert "jane@example.com" not in caplog.text
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            lg.report_suppressed()
+        assert "Suppressed 4 occurrences" in caplog.text
+
+    def test_json_formatter(self, caplog):
+        import core.logger as lg
+        lg.reload_config()
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            lg.log_event(logging.WARNING, "export_failed", "abc123", "Export failed for %s", "CA",
+                         contact="jane@example.com")
+        entry = json.loads(lg.JsonFormatter().format(caplog.records[-1]))
+        assert entry["level"] == "WARNING"
+        assert entry["message"] == "Export failed for CA"
+        assert entry["event"] == "export_failed"
+        assert entry["fingerprint"] == "abc123"
+        assert entry["fields"] == {"contact": "[EMAIL-REDACTED]"}
+        assert "suppressed" not in entry
+
+    def test_json_fields_cannot_overwrite_reserved_keys(self, caplog):
+        import core.logger as lg
+        lg.reload_config()
+        with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+            lg.log_event(logging.WARNING, "export_failed", "abc123", "Export failed",
+                         level="DEBUG", message="forged", ts="never")
+        entry = json.loads(lg.JsonFormatter().format(caplog.records[-1]))
+        assert entry["level"] == "WARNING"
+        assert entry["message"] == "Export failed"
+        assert entry["ts"] != "never"
+        assert entry["fields"] == {"level": "DEBUG", "message": "forged", "ts": "never"}
+
+    def test_info_sampling(self, monkeypatch, caplog):
+        import core.logger as lg
+        monkeypatch.setenv("CLAIMPILOT_LOG_INFO_SAMPLE_RATE", "0")
+        lg.reload_config()
+        try:
+            with caplog.at_level(logging.DEBUG, logger="claimpilot"):
+                lg.log_info("sampled out")
+                lg.log_warning("always kept")
+            assert "sampled out" not in caplog.text
+            assert "always kept" in caplog.text
+        finally:
+            monkeypatch.delenv("CLAIMPILOT_LOG_INFO_SAMPLE_RATE")
+            lg.reload_config()
+
+    def test_format_follows_mode(self, monkeypatch):
+        import core.logger as lg
+        monkeypatch.setenv("CLAIMPILOT_LOG_FORMAT", "json")
+        lg.reload_config()
+        try:
+            assert any(isinstance(h.formatter, lg.JsonFormatter) for h in lg._logger.handlers)
+        finally:
+            monkeypatch.delenv("CLAIMPILOT_LOG_FORMAT")
+            lg.reload_config()
+        assert not any(isinstance(h.formatter, lg.JsonFormatter) for h in lg._logger.handlers)
+
+
 class TestExportNoStreamlitImport:
     """Export modules must not depend on Streamlit (fix D)."""
 